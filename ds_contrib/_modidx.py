@@ -5,38 +5,172 @@ d = { 'settings': { 'branch': 'main',
                 'doc_host': 'https://apoyezzhayev.github.io',
                 'git_url': 'https://github.com/apoyezzhayev/ds_contrib',
                 'lib_path': 'ds_contrib'},
-  'syms': { 'ds_contrib.analysis.motion.iri': { 'ds_contrib.analysis.motion.iri.RideQuality': ( 'core/road_quality.html#ridequality',
+  'syms': { 'ds_contrib.analysis.motion.batch': { 'ds_contrib.analysis.motion.batch.SessionResult': ( 'core/road_quality_batch.html#sessionresult',
+                                                                                                      'ds_contrib/analysis/motion/batch.py'),
+                                                  'ds_contrib.analysis.motion.batch.SessionResult.ok': ( 'core/road_quality_batch.html#sessionresult.ok',
+                                                                                                         'ds_contrib/analysis/motion/batch.py'),
+                                                  'ds_contrib.analysis.motion.batch._write_partition': ( 'core/road_quality_batch.html#_write_partition',
+                                                                                                         'ds_contrib/analysis/motion/batch.py'),
+                                                  'ds_contrib.analysis.motion.batch.get_session_name': ( 'core/road_quality_batch.html#get_session_name',
+                                                                                                         'ds_contrib/analysis/motion/batch.py'),
+                                                  'ds_contrib.analysis.motion.batch.process_session': ( 'core/road_quality_batch.html#process_session',
+                                                                                                        'ds_contrib/analysis/motion/batch.py'),
+                                                  'ds_contrib.analysis.motion.batch.read_session_sensor_data': ( 'core/road_quality_batch.html#read_session_sensor_data',
+                                                                                                                 'ds_contrib/analysis/motion/batch.py'),
+                                                  'ds_contrib.analysis.motion.batch.run_road_quality_batch': ( 'core/road_quality_batch.html#run_road_quality_batch',
+                                                                                                               'ds_contrib/analysis/motion/batch.py')},
+            'ds_contrib.analysis.motion.benchmark': { 'ds_contrib.analysis.motion.benchmark._count_rows': ( 'core/road_quality_benchmark.html#_count_rows',
+                                                                                                            'ds_contrib/analysis/motion/benchmark.py'),
+                                                      'ds_contrib.analysis.motion.benchmark._run_pipeline_once': ( 'core/road_quality_benchmark.html#_run_pipeline_once',
+                                                                                                                   'ds_contrib/analysis/motion/benchmark.py'),
+                                                      'ds_contrib.analysis.motion.benchmark.benchmark_road_quality_pipeline': ( 'core/road_quality_benchmark.html#benchmark_road_quality_pipeline',
+                                                                                                                                'ds_contrib/analysis/motion/benchmark.py'),
+                                                      'ds_contrib.analysis.motion.benchmark.compare_benchmarks': ( 'core/road_quality_benchmark.html#compare_benchmarks',
+                                                                                                                   'ds_contrib/analysis/motion/benchmark.py'),
+                                                      'ds_contrib.analysis.motion.benchmark.run_road_quality_benchmarks': ( 'core/road_quality_benchmark.html#run_road_quality_benchmarks',
+                                                                                                                            'ds_contrib/analysis/motion/benchmark.py')},
+            'ds_contrib.analysis.motion.cells': { 'ds_contrib.analysis.motion.cells._geohash_bits': ( 'core/spatial_cells.html#_geohash_bits',
+                                                                                                      'ds_contrib/analysis/motion/cells.py'),
+                                                  'ds_contrib.analysis.motion.cells.encode_geohash': ( 'core/spatial_cells.html#encode_geohash',
+                                                                                                       'ds_contrib/analysis/motion/cells.py'),
+                                                  'ds_contrib.analysis.motion.cells.geohash_bounds': ( 'core/spatial_cells.html#geohash_bounds',
+                                                                                                       'ds_contrib/analysis/motion/cells.py')},
+            'ds_contrib.analysis.motion.distance': { 'ds_contrib.analysis.motion.distance.get_path_distances': ( 'core/path_distance.html#get_path_distances',
+                                                                                                                 'ds_contrib/analysis/motion/distance.py'),
+                                                     'ds_contrib.analysis.motion.distance.haversine_distance': ( 'core/path_distance.html#haversine_distance',
+                                                                                                                 'ds_contrib/analysis/motion/distance.py'),
+                                                     'ds_contrib.analysis.motion.distance.wgs84_distance': ( 'core/path_distance.html#wgs84_distance',
+                                                                                                             'ds_contrib/analysis/motion/distance.py')},
+            'ds_contrib.analysis.motion.iri': { 'ds_contrib.analysis.motion.iri.DtypePolicy': ( 'core/road_quality.html#dtypepolicy',
                                                                                                 'ds_contrib/analysis/motion/iri.py'),
-                                                'ds_contrib.analysis.motion.iri._default_plot_setup': ( 'core/road_quality.html#_default_plot_setup',
+                                                'ds_contrib.analysis.motion.iri.DtypePolicy.apply': ( 'core/road_quality.html#dtypepolicy.apply',
+                                                                                                      'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri.DtypePolicy.get_dtype': ( 'core/road_quality.html#dtypepolicy.get_dtype',
+                                                                                                          'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri.RideQuality': ( 'core/road_quality.html#ridequality',
+                                                                                                'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri.RoadQualityView': ( 'core/road_quality.html#roadqualityview',
+                                                                                                    'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri.RoadQualityView.__init__': ( 'core/road_quality.html#roadqualityview.__init__',
+                                                                                                             'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri.RoadQualityView._set_line': ( 'core/road_quality.html#roadqualityview._set_line',
+                                                                                                              'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri.RoadQualityView.update': ( 'core/road_quality.html#roadqualityview.update',
+                                                                                                           'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri.StageProfiler': ( 'core/road_quality.html#stageprofiler',
+                                                                                                  'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri.StageProfiler.__init__': ( 'core/road_quality.html#stageprofiler.__init__',
+                                                                                                           'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri.StageProfiler.report': ( 'core/road_quality.html#stageprofiler.report',
+                                                                                                         'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri.StageProfiler.stage': ( 'core/road_quality.html#stageprofiler.stage',
+                                                                                                        'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri.StageProfiler.to_frame': ( 'core/road_quality.html#stageprofiler.to_frame',
+                                                                                                           'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri.StageProfiler.to_json': ( 'core/road_quality.html#stageprofiler.to_json',
+                                                                                                          'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri.StageRecord': ( 'core/road_quality.html#stagerecord',
+                                                                                                'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri._add_path_to_gps': ( 'core/road_quality.html#_add_path_to_gps',
+                                                                                                     'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri._align_to_shared_index': ( 'core/road_quality.html#_align_to_shared_index',
+                                                                                                           'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri._as_shared_index_frame': ( 'core/road_quality.html#_as_shared_index_frame',
+                                                                                                           'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri._calculate_road_quality_on_windows': ( 'core/road_quality.html#_calculate_road_quality_on_windows',
+                                                                                                                       'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri._get_agg_kernel_name': ( 'core/road_quality.html#_get_agg_kernel_name',
+                                                                                                         'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri._get_asof_indexer': ( 'core/road_quality.html#_get_asof_indexer',
+                                                                                                      'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri._get_content_digest': ( 'core/road_quality.html#_get_content_digest',
                                                                                                         'ds_contrib/analysis/motion/iri.py'),
-                                                'ds_contrib.analysis.motion.iri._get_dist': ( 'core/road_quality.html#_get_dist',
-                                                                                              'ds_contrib/analysis/motion/iri.py'),
                                                 'ds_contrib.analysis.motion.iri._get_from_dfs_or_path': ( 'core/road_quality.html#_get_from_dfs_or_path',
                                                                                                           'ds_contrib/analysis/motion/iri.py'),
-                                                'ds_contrib.analysis.motion.iri._plot_anomalies': ( 'core/road_quality.html#_plot_anomalies',
+                                                'ds_contrib.analysis.motion.iri._get_peak_rss': ( 'core/road_quality.html#_get_peak_rss',
+                                                                                                  'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri._get_sensor_cache_path': ( 'core/road_quality.html#_get_sensor_cache_path',
+                                                                                                           'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri._get_shared_index_cache_path': ( 'core/road_quality.html#_get_shared_index_cache_path',
+                                                                                                                 'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri._get_source_fingerprint': ( 'core/road_quality.html#_get_source_fingerprint',
+                                                                                                            'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri._interpolate_gps_path': ( 'core/road_quality.html#_interpolate_gps_path',
+                                                                                                          'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri._parse_flat_json_arrays': ( 'core/road_quality.html#_parse_flat_json_arrays',
+                                                                                                            'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri._parse_numeric_array': ( 'core/road_quality.html#_parse_numeric_array',
+                                                                                                         'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri._parse_timestamps_json': ( 'core/road_quality.html#_parse_timestamps_json',
+                                                                                                           'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri._plot_series': ( 'core/road_quality.html#_plot_series',
+                                                                                                 'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri._read_concurrently': ( 'core/road_quality.html#_read_concurrently',
+                                                                                                       'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri._read_standard_cached': ( 'core/road_quality.html#_read_standard_cached',
+                                                                                                          'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri._rolling_mean_from_prefix_sums': ( 'core/road_quality.html#_rolling_mean_from_prefix_sums',
+                                                                                                                   'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri._segment_any': ( 'core/road_quality.html#_segment_any',
+                                                                                                 'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri._segment_centroid': ( 'core/road_quality.html#_segment_centroid',
+                                                                                                      'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri._segment_float_values': ( 'core/road_quality.html#_segment_float_values',
+                                                                                                          'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri._segment_max': ( 'core/road_quality.html#_segment_max',
+                                                                                                 'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri._segment_max_abs': ( 'core/road_quality.html#_segment_max_abs',
+                                                                                                     'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri._segment_mean': ( 'core/road_quality.html#_segment_mean',
+                                                                                                  'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri._segment_median': ( 'core/road_quality.html#_segment_median',
                                                                                                     'ds_contrib/analysis/motion/iri.py'),
-                                                'ds_contrib.analysis.motion.iri._plot_iri': ( 'core/road_quality.html#_plot_iri',
-                                                                                              'ds_contrib/analysis/motion/iri.py'),
-                                                'ds_contrib.analysis.motion.iri._plot_path_progress': ( 'core/road_quality.html#_plot_path_progress',
+                                                'ds_contrib.analysis.motion.iri._segment_source': ( 'core/road_quality.html#_segment_source',
+                                                                                                    'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri._set_source_status': ( 'core/road_quality.html#_set_source_status',
+                                                                                                       'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri._split_gps_geometry': ( 'core/road_quality.html#_split_gps_geometry',
                                                                                                         'ds_contrib/analysis/motion/iri.py'),
                                                 'ds_contrib.analysis.motion.iri._split_path_on_sections': ( 'core/road_quality.html#_split_path_on_sections',
                                                                                                             'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri._to_ns': ( 'core/road_quality.html#_to_ns',
+                                                                                           'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri.aggregate_road_quality': ( 'core/road_quality.html#aggregate_road_quality',
+                                                                                                           'ds_contrib/analysis/motion/iri.py'),
                                                 'ds_contrib.analysis.motion.iri.calculate_iri': ( 'core/road_quality.html#calculate_iri',
                                                                                                   'ds_contrib/analysis/motion/iri.py'),
                                                 'ds_contrib.analysis.motion.iri.calculate_rms_on_sections': ( 'core/road_quality.html#calculate_rms_on_sections',
                                                                                                               'ds_contrib/analysis/motion/iri.py'),
                                                 'ds_contrib.analysis.motion.iri.calculate_road_quality': ( 'core/road_quality.html#calculate_road_quality',
                                                                                                            'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri.calculate_section_statistics': ( 'core/road_quality.html#calculate_section_statistics',
+                                                                                                                 'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri.calculate_section_sums': ( 'core/road_quality.html#calculate_section_sums',
+                                                                                                           'ds_contrib/analysis/motion/iri.py'),
                                                 'ds_contrib.analysis.motion.iri.change_index': ( 'core/road_quality.html#change_index',
                                                                                                  'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri.classify_ride_quality': ( 'core/road_quality.html#classify_ride_quality',
+                                                                                                          'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri.compact_road_quality_df': ( 'core/road_quality.html#compact_road_quality_df',
+                                                                                                            'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri.decimate_min_max': ( 'core/road_quality.html#decimate_min_max',
+                                                                                                     'ds_contrib/analysis/motion/iri.py'),
                                                 'ds_contrib.analysis.motion.iri.find_bumps': ( 'core/road_quality.html#find_bumps',
                                                                                                'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri.get_gps_geometry': ( 'core/road_quality.html#get_gps_geometry',
+                                                                                                     'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri.get_memory_usage': ( 'core/road_quality.html#get_memory_usage',
+                                                                                                     'ds_contrib/analysis/motion/iri.py'),
                                                 'ds_contrib.analysis.motion.iri.get_path_from_gps': ( 'core/road_quality.html#get_path_from_gps',
                                                                                                       'ds_contrib/analysis/motion/iri.py'),
                                                 'ds_contrib.analysis.motion.iri.get_ride_quality': ( 'core/road_quality.html#get_ride_quality',
                                                                                                      'ds_contrib/analysis/motion/iri.py'),
                                                 'ds_contrib.analysis.motion.iri.get_road_qaulity_agg_func': ( 'core/road_quality.html#get_road_qaulity_agg_func',
                                                                                                               'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri.get_section_lines': ( 'core/road_quality.html#get_section_lines',
+                                                                                                      'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri.get_section_statistics': ( 'core/road_quality.html#get_section_statistics',
+                                                                                                           'ds_contrib/analysis/motion/iri.py'),
                                                 'ds_contrib.analysis.motion.iri.get_shared_index_for_sensor_data': ( 'core/road_quality.html#get_shared_index_for_sensor_data',
                                                                                                                      'ds_contrib/analysis/motion/iri.py'),
                                                 'ds_contrib.analysis.motion.iri.get_shared_time_index': ( 'core/road_quality.html#get_shared_time_index',
@@ -45,20 +179,38 @@ d = { 'settings': { 'branch': 'main',
                                                                                                       'ds_contrib/analysis/motion/iri.py'),
                                                 'ds_contrib.analysis.motion.iri.map_df_to_shared_index': ( 'core/road_quality.html#map_df_to_shared_index',
                                                                                                            'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri.map_dfs_to_shared_index': ( 'core/road_quality.html#map_dfs_to_shared_index',
+                                                                                                            'ds_contrib/analysis/motion/iri.py'),
                                                 'ds_contrib.analysis.motion.iri.plot_road_quality_on_range': ( 'core/road_quality.html#plot_road_quality_on_range',
                                                                                                                'ds_contrib/analysis/motion/iri.py'),
                                                 'ds_contrib.analysis.motion.iri.plot_road_quality_stats': ( 'core/road_quality.html#plot_road_quality_stats',
                                                                                                             'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri.profile_stage': ( 'core/road_quality.html#profile_stage',
+                                                                                                  'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri.read_recslam_detections_raw': ( 'core/road_quality.html#read_recslam_detections_raw',
+                                                                                                                'ds_contrib/analysis/motion/iri.py'),
                                                 'ds_contrib.analysis.motion.iri.read_recslam_gps_raw': ( 'core/road_quality.html#read_recslam_gps_raw',
                                                                                                          'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri.read_recslam_heading_raw': ( 'core/road_quality.html#read_recslam_heading_raw',
+                                                                                                             'ds_contrib/analysis/motion/iri.py'),
                                                 'ds_contrib.analysis.motion.iri.read_recslam_motion_raw': ( 'core/road_quality.html#read_recslam_motion_raw',
                                                                                                             'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri.read_recslam_motion_time_index': ( 'core/road_quality.html#read_recslam_motion_time_index',
+                                                                                                                   'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri.read_recslam_motion_windows': ( 'core/road_quality.html#read_recslam_motion_windows',
+                                                                                                                'ds_contrib/analysis/motion/iri.py'),
                                                 'ds_contrib.analysis.motion.iri.read_recslam_sensor_data_raw': ( 'core/road_quality.html#read_recslam_sensor_data_raw',
                                                                                                                  'ds_contrib/analysis/motion/iri.py'),
                                                 'ds_contrib.analysis.motion.iri.read_recslam_sensor_data_standard': ( 'core/road_quality.html#read_recslam_sensor_data_standard',
                                                                                                                       'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri.read_recslam_timestamps_columns': ( 'core/road_quality.html#read_recslam_timestamps_columns',
+                                                                                                                    'ds_contrib/analysis/motion/iri.py'),
                                                 'ds_contrib.analysis.motion.iri.read_recslam_timestamps_raw': ( 'core/road_quality.html#read_recslam_timestamps_raw',
                                                                                                                 'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri.read_sensor_cache': ( 'core/road_quality.html#read_sensor_cache',
+                                                                                                      'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri.read_shared_index_cache': ( 'core/road_quality.html#read_shared_index_cache',
+                                                                                                            'ds_contrib/analysis/motion/iri.py'),
                                                 'ds_contrib.analysis.motion.iri.road_quality_from_sensor_data': ( 'core/road_quality.html#road_quality_from_sensor_data',
                                                                                                                   'ds_contrib/analysis/motion/iri.py'),
                                                 'ds_contrib.analysis.motion.iri.split_imu_on_sections': ( 'core/road_quality.html#split_imu_on_sections',
@@ -69,8 +221,148 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                    'ds_contrib/analysis/motion/iri.py'),
                                                 'ds_contrib.analysis.motion.iri.standardize_recslam_sensor_data': ( 'core/road_quality.html#standardize_recslam_sensor_data',
                                                                                                                     'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri.standardize_recslam_timestamps_columns': ( 'core/road_quality.html#standardize_recslam_timestamps_columns',
+                                                                                                                           'ds_contrib/analysis/motion/iri.py'),
                                                 'ds_contrib.analysis.motion.iri.standardize_recslam_timestamps_raw': ( 'core/road_quality.html#standardize_recslam_timestamps_raw',
-                                                                                                                       'ds_contrib/analysis/motion/iri.py')},
+                                                                                                                       'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri.sweep_find_bumps': ( 'core/road_quality.html#sweep_find_bumps',
+                                                                                                     'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri.write_sensor_cache': ( 'core/road_quality.html#write_sensor_cache',
+                                                                                                       'ds_contrib/analysis/motion/iri.py'),
+                                                'ds_contrib.analysis.motion.iri.write_shared_index_cache': ( 'core/road_quality.html#write_shared_index_cache',
+                                                                                                             'ds_contrib/analysis/motion/iri.py')},
+            'ds_contrib.analysis.motion.online': { 'ds_contrib.analysis.motion.online.BumpEvent': ( 'core/online_road_quality.html#bumpevent',
+                                                                                                    'ds_contrib/analysis/motion/online.py'),
+                                                   'ds_contrib.analysis.motion.online.OnlineIRICalculator': ( 'core/online_road_quality.html#onlineiricalculator',
+                                                                                                              'ds_contrib/analysis/motion/online.py'),
+                                                   'ds_contrib.analysis.motion.online.OnlineIRICalculator.__init__': ( 'core/online_road_quality.html#onlineiricalculator.__init__',
+                                                                                                                       'ds_contrib/analysis/motion/online.py'),
+                                                   'ds_contrib.analysis.motion.online.OnlineIRICalculator._accumulate': ( 'core/online_road_quality.html#onlineiricalculator._accumulate',
+                                                                                                                          'ds_contrib/analysis/motion/online.py'),
+                                                   'ds_contrib.analysis.motion.online.OnlineIRICalculator._add_samples': ( 'core/online_road_quality.html#onlineiricalculator._add_samples',
+                                                                                                                           'ds_contrib/analysis/motion/online.py'),
+                                                   'ds_contrib.analysis.motion.online.OnlineIRICalculator._emit': ( 'core/online_road_quality.html#onlineiricalculator._emit',
+                                                                                                                    'ds_contrib/analysis/motion/online.py'),
+                                                   'ds_contrib.analysis.motion.online.OnlineIRICalculator._pop_completed': ( 'core/online_road_quality.html#onlineiricalculator._pop_completed',
+                                                                                                                             'ds_contrib/analysis/motion/online.py'),
+                                                   'ds_contrib.analysis.motion.online.OnlineIRICalculator._release_held': ( 'core/online_road_quality.html#onlineiricalculator._release_held',
+                                                                                                                            'ds_contrib/analysis/motion/online.py'),
+                                                   'ds_contrib.analysis.motion.online.OnlineIRICalculator.add_gps': ( 'core/online_road_quality.html#onlineiricalculator.add_gps',
+                                                                                                                      'ds_contrib/analysis/motion/online.py'),
+                                                   'ds_contrib.analysis.motion.online.OnlineIRICalculator.add_imu': ( 'core/online_road_quality.html#onlineiricalculator.add_imu',
+                                                                                                                      'ds_contrib/analysis/motion/online.py'),
+                                                   'ds_contrib.analysis.motion.online.OnlineIRICalculator.close': ( 'core/online_road_quality.html#onlineiricalculator.close',
+                                                                                                                    'ds_contrib/analysis/motion/online.py'),
+                                                   'ds_contrib.analysis.motion.online.OnlineIRICalculator.n_open_sections': ( 'core/online_road_quality.html#onlineiricalculator.n_open_sections',
+                                                                                                                              'ds_contrib/analysis/motion/online.py'),
+                                                   'ds_contrib.analysis.motion.online.OnlineIRICalculator.path': ( 'core/online_road_quality.html#onlineiricalculator.path',
+                                                                                                                   'ds_contrib/analysis/motion/online.py'),
+                                                   'ds_contrib.analysis.motion.online.SectionQuality': ( 'core/online_road_quality.html#sectionquality',
+                                                                                                         'ds_contrib/analysis/motion/online.py'),
+                                                   'ds_contrib.analysis.motion.online.StreamingBumpDetector': ( 'core/online_road_quality.html#streamingbumpdetector',
+                                                                                                                'ds_contrib/analysis/motion/online.py'),
+                                                   'ds_contrib.analysis.motion.online.StreamingBumpDetector.__init__': ( 'core/online_road_quality.html#streamingbumpdetector.__init__',
+                                                                                                                         'ds_contrib/analysis/motion/online.py'),
+                                                   'ds_contrib.analysis.motion.online.StreamingBumpDetector._rolling_mean': ( 'core/online_road_quality.html#streamingbumpdetector._rolling_mean',
+                                                                                                                              'ds_contrib/analysis/motion/online.py'),
+                                                   'ds_contrib.analysis.motion.online.StreamingBumpDetector.update': ( 'core/online_road_quality.html#streamingbumpdetector.update',
+                                                                                                                       'ds_contrib/analysis/motion/online.py'),
+                                                   'ds_contrib.analysis.motion.online._to_ns': ( 'core/online_road_quality.html#_to_ns',
+                                                                                                 'ds_contrib/analysis/motion/online.py')},
+            'ds_contrib.analysis.motion.pyramid': { 'ds_contrib.analysis.motion.pyramid._get_coordinates': ( 'core/section_pyramid.html#_get_coordinates',
+                                                                                                             'ds_contrib/analysis/motion/pyramid.py'),
+                                                    'ds_contrib.analysis.motion.pyramid._get_merge_func': ( 'core/section_pyramid.html#_get_merge_func',
+                                                                                                            'ds_contrib/analysis/motion/pyramid.py'),
+                                                    'ds_contrib.analysis.motion.pyramid._merge_sections': ( 'core/section_pyramid.html#_merge_sections',
+                                                                                                            'ds_contrib/analysis/motion/pyramid.py'),
+                                                    'ds_contrib.analysis.motion.pyramid.build_section_pyramid': ( 'core/section_pyramid.html#build_section_pyramid',
+                                                                                                                  'ds_contrib/analysis/motion/pyramid.py'),
+                                                    'ds_contrib.analysis.motion.pyramid.merge_section_pyramids': ( 'core/section_pyramid.html#merge_section_pyramids',
+                                                                                                                   'ds_contrib/analysis/motion/pyramid.py'),
+                                                    'ds_contrib.analysis.motion.pyramid.read_section_pyramid': ( 'core/section_pyramid.html#read_section_pyramid',
+                                                                                                                 'ds_contrib/analysis/motion/pyramid.py'),
+                                                    'ds_contrib.analysis.motion.pyramid.summarize_section_pyramid': ( 'core/section_pyramid.html#summarize_section_pyramid',
+                                                                                                                      'ds_contrib/analysis/motion/pyramid.py'),
+                                                    'ds_contrib.analysis.motion.pyramid.write_section_pyramid': ( 'core/section_pyramid.html#write_section_pyramid',
+                                                                                                                  'ds_contrib/analysis/motion/pyramid.py')},
+            'ds_contrib.analysis.motion.rollup': { 'ds_contrib.analysis.motion.rollup._empty_rollup': ( 'core/road_cell_rollup.html#_empty_rollup',
+                                                                                                        'ds_contrib/analysis/motion/rollup.py'),
+                                                   'ds_contrib.analysis.motion.rollup._rollup_session': ( 'core/road_cell_rollup.html#_rollup_session',
+                                                                                                          'ds_contrib/analysis/motion/rollup.py'),
+                                                   'ds_contrib.analysis.motion.rollup.merge_rollups': ( 'core/road_cell_rollup.html#merge_rollups',
+                                                                                                        'ds_contrib/analysis/motion/rollup.py'),
+                                                   'ds_contrib.analysis.motion.rollup.rollup_road_quality': ( 'core/road_cell_rollup.html#rollup_road_quality',
+                                                                                                              'ds_contrib/analysis/motion/rollup.py'),
+                                                   'ds_contrib.analysis.motion.rollup.rollup_road_quality_parquet': ( 'core/road_cell_rollup.html#rollup_road_quality_parquet',
+                                                                                                                      'ds_contrib/analysis/motion/rollup.py'),
+                                                   'ds_contrib.analysis.motion.rollup.summarize_rollup': ( 'core/road_cell_rollup.html#summarize_rollup',
+                                                                                                           'ds_contrib/analysis/motion/rollup.py')},
+            'ds_contrib.analysis.motion.section_index': { 'ds_contrib.analysis.motion.section_index.SectionIndex': ( 'core/section_index.html#sectionindex',
+                                                                                                                     'ds_contrib/analysis/motion/section_index.py'),
+                                                          'ds_contrib.analysis.motion.section_index.SectionIndex.__init__': ( 'core/section_index.html#sectionindex.__init__',
+                                                                                                                              'ds_contrib/analysis/motion/section_index.py'),
+                                                          'ds_contrib.analysis.motion.section_index.SectionIndex.__len__': ( 'core/section_index.html#sectionindex.__len__',
+                                                                                                                             'ds_contrib/analysis/motion/section_index.py'),
+                                                          'ds_contrib.analysis.motion.section_index.SectionIndex._get_cell': ( 'core/section_index.html#sectionindex._get_cell',
+                                                                                                                               'ds_contrib/analysis/motion/section_index.py'),
+                                                          'ds_contrib.analysis.motion.section_index.SectionIndex._get_tree': ( 'core/section_index.html#sectionindex._get_tree',
+                                                                                                                               'ds_contrib/analysis/motion/section_index.py'),
+                                                          'ds_contrib.analysis.motion.section_index.SectionIndex._query': ( 'core/section_index.html#sectionindex._query',
+                                                                                                                            'ds_contrib/analysis/motion/section_index.py'),
+                                                          'ds_contrib.analysis.motion.section_index.SectionIndex.from_road_quality': ( 'core/section_index.html#sectionindex.from_road_quality',
+                                                                                                                                       'ds_contrib/analysis/motion/section_index.py'),
+                                                          'ds_contrib.analysis.motion.section_index.SectionIndex.from_road_quality_parquet': ( 'core/section_index.html#sectionindex.from_road_quality_parquet',
+                                                                                                                                               'ds_contrib/analysis/motion/section_index.py'),
+                                                          'ds_contrib.analysis.motion.section_index.SectionIndex.load': ( 'core/section_index.html#sectionindex.load',
+                                                                                                                          'ds_contrib/analysis/motion/section_index.py'),
+                                                          'ds_contrib.analysis.motion.section_index.SectionIndex.query_bbox': ( 'core/section_index.html#sectionindex.query_bbox',
+                                                                                                                                'ds_contrib/analysis/motion/section_index.py'),
+                                                          'ds_contrib.analysis.motion.section_index.SectionIndex.query_nearest': ( 'core/section_index.html#sectionindex.query_nearest',
+                                                                                                                                   'ds_contrib/analysis/motion/section_index.py'),
+                                                          'ds_contrib.analysis.motion.section_index.SectionIndex.query_radius': ( 'core/section_index.html#sectionindex.query_radius',
+                                                                                                                                  'ds_contrib/analysis/motion/section_index.py'),
+                                                          'ds_contrib.analysis.motion.section_index.SectionIndex.save': ( 'core/section_index.html#sectionindex.save',
+                                                                                                                          'ds_contrib/analysis/motion/section_index.py'),
+                                                          'ds_contrib.analysis.motion.section_index._get_bounds_frame': ( 'core/section_index.html#_get_bounds_frame',
+                                                                                                                          'ds_contrib/analysis/motion/section_index.py'),
+                                                          'ds_contrib.analysis.motion.section_index._get_distances': ( 'core/section_index.html#_get_distances',
+                                                                                                                       'ds_contrib/analysis/motion/section_index.py'),
+                                                          'ds_contrib.analysis.motion.section_index._meters_per_degree': ( 'core/section_index.html#_meters_per_degree',
+                                                                                                                           'ds_contrib/analysis/motion/section_index.py'),
+                                                          'ds_contrib.analysis.motion.section_index._radius_bbox': ( 'core/section_index.html#_radius_bbox',
+                                                                                                                     'ds_contrib/analysis/motion/section_index.py')},
+            'ds_contrib.analysis.motion.storage': { 'ds_contrib.analysis.motion.storage._and': ( 'core/road_quality_storage.html#_and',
+                                                                                                 'ds_contrib/analysis/motion/storage.py'),
+                                                    'ds_contrib.analysis.motion.storage._cell_intersects': ( 'core/road_quality_storage.html#_cell_intersects',
+                                                                                                             'ds_contrib/analysis/motion/storage.py'),
+                                                    'ds_contrib.analysis.motion.storage._get_dataset_cells': ( 'core/road_quality_storage.html#_get_dataset_cells',
+                                                                                                               'ds_contrib/analysis/motion/storage.py'),
+                                                    'ds_contrib.analysis.motion.storage._range_expression': ( 'core/road_quality_storage.html#_range_expression',
+                                                                                                              'ds_contrib/analysis/motion/storage.py'),
+                                                    'ds_contrib.analysis.motion.storage.get_road_quality_cells': ( 'core/road_quality_storage.html#get_road_quality_cells',
+                                                                                                                   'ds_contrib/analysis/motion/storage.py'),
+                                                    'ds_contrib.analysis.motion.storage.read_road_quality_parquet': ( 'core/road_quality_storage.html#read_road_quality_parquet',
+                                                                                                                      'ds_contrib/analysis/motion/storage.py'),
+                                                    'ds_contrib.analysis.motion.storage.write_road_quality_parquet': ( 'core/road_quality_storage.html#write_road_quality_parquet',
+                                                                                                                       'ds_contrib/analysis/motion/storage.py')},
+            'ds_contrib.analysis.motion.synthetic': { 'ds_contrib.analysis.motion.synthetic._iter_motion_chunks': ( 'core/synthetic_recslam.html#_iter_motion_chunks',
+                                                                                                                    'ds_contrib/analysis/motion/synthetic.py'),
+                                                      'ds_contrib.analysis.motion.synthetic._simulate_gps': ( 'core/synthetic_recslam.html#_simulate_gps',
+                                                                                                              'ds_contrib/analysis/motion/synthetic.py'),
+                                                      'ds_contrib.analysis.motion.synthetic._simulate_motion': ( 'core/synthetic_recslam.html#_simulate_motion',
+                                                                                                                 'ds_contrib/analysis/motion/synthetic.py'),
+                                                      'ds_contrib.analysis.motion.synthetic._simulate_ride': ( 'core/synthetic_recslam.html#_simulate_ride',
+                                                                                                               'ds_contrib/analysis/motion/synthetic.py'),
+                                                      'ds_contrib.analysis.motion.synthetic._simulate_timestamps': ( 'core/synthetic_recslam.html#_simulate_timestamps',
+                                                                                                                     'ds_contrib/analysis/motion/synthetic.py'),
+                                                      'ds_contrib.analysis.motion.synthetic._simulate_trajectory': ( 'core/synthetic_recslam.html#_simulate_trajectory',
+                                                                                                                     'ds_contrib/analysis/motion/synthetic.py'),
+                                                      'ds_contrib.analysis.motion.synthetic._smooth': ( 'core/synthetic_recslam.html#_smooth',
+                                                                                                        'ds_contrib/analysis/motion/synthetic.py'),
+                                                      'ds_contrib.analysis.motion.synthetic.simulate_recslam_sensor_data': ( 'core/synthetic_recslam.html#simulate_recslam_sensor_data',
+                                                                                                                             'ds_contrib/analysis/motion/synthetic.py'),
+                                                      'ds_contrib.analysis.motion.synthetic.write_synthetic_recslam_session': ( 'core/synthetic_recslam.html#write_synthetic_recslam_session',
+                                                                                                                                'ds_contrib/analysis/motion/synthetic.py')},
             'ds_contrib.core.data.video': { 'ds_contrib.core.data.video.FramesSamplerUniform': ( 'core/video.html#framessampleruniform',
                                                                                                  'ds_contrib/core/data/video.py'),
                                             'ds_contrib.core.data.video.FramesSamplerUniform.__init__': ( 'core/video.html#framessampleruniform.__init__',
@@ -182,6 +474,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                  'ds_contrib/core/paths.py'),
                                        'ds_contrib.core.paths._list_all_paths': ( 'core/paths.html#_list_all_paths',
                                                                                   'ds_contrib/core/paths.py'),
+                                       'ds_contrib.core.paths._remove_path': ('core/paths.html#_remove_path', 'ds_contrib/core/paths.py'),
+                                       'ds_contrib.core.paths.atomic_path': ('core/paths.html#atomic_path', 'ds_contrib/core/paths.py'),
                                        'ds_contrib.core.paths.get_dir': ('core/paths.html#get_dir', 'ds_contrib/core/paths.py'),
                                        'ds_contrib.core.paths.handle_existing_path': ( 'core/paths.html#handle_existing_path',
                                                                                        'ds_contrib/core/paths.py'),
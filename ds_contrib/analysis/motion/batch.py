@@ -0,0 +1,254 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/core/08_road_quality_batch.ipynb.
+
+# %% ../../../nbs/core/08_road_quality_batch.ipynb 3
+# basic imports
+from __future__ import annotations
+
+# sys and paths imports
+import logging
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# typing imports
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Iterable
+
+import pandas as pd
+from tqdm.auto import tqdm
+
+from ds_contrib.analysis.motion.iri import (
+    StageProfiler,
+    profile_stage,
+    read_recslam_sensor_data_standard,
+    road_quality_from_sensor_data,
+)
+from ...core.files.structure import GSBrowserFileStructure
+from ...core.paths import Directory, PathLike, atomic_path, pathify
+from ...tools.io.gscloud import GSBrowser
+
+# %% auto 0
+__all__ = ['logger', 'RECSLAM_SENSOR_FILES', 'SessionResult', 'get_session_name', 'read_session_sensor_data', 'process_session',
+           'run_road_quality_batch']
+
+# %% ../../../nbs/core/08_road_quality_batch.ipynb 5
+logger = logging.getLogger(__name__)
+
+# %% ../../../nbs/core/08_road_quality_batch.ipynb 7
+RECSLAM_SENSOR_FILES = {
+    "motion_path": "motion.csv",
+    "gps_path": "gps.csv",
+    "timestamps_path": "times_full_2.json",
+}
+
+
+@dataclass
+class SessionResult:
+    session: str
+    name: str
+    output_path: Path | None = None
+    n_rows: int = 0
+    elapsed: float = 0.0
+    error: str | None = None
+    profile: dict[str, Any] | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def get_session_name(session: PathLike) -> str:
+    """Name of a session, i.e. the last part of its local path or remote prefix, safe to be used as a partition value"""
+    name = Path(str(session).rstrip("/")).name
+    return re.sub(r"[^\w.-]", "_", name)
+
+
+def read_session_sensor_data(
+    session: PathLike,
+    browser_kwargs: dict[str, Any] | None = None,
+    downloads_dir: PathLike | None = None,
+    file_structure_path: PathLike | None = None,
+    use_cache: bool = True,
+    n_workers: int = 1,
+) -> dict[str, pd.DataFrame]:
+    """Read standardized sensor data of a local or remote session
+
+    Parameters
+    ----------
+    session : PathLike
+        local directory with recslam files or a Google Storage prefix if `browser_kwargs` is provided
+    browser_kwargs : dict[str, Any] | None, optional
+        `project` and `credentials` of `GSBrowser` to read remote sessions, by default None
+    downloads_dir : PathLike | None, optional
+        directory to download remote files to, by default a temporary directory
+    file_structure_path : PathLike | None, optional
+        path to recslam structure json, required for remote sessions, by default None
+    use_cache : bool, optional
+        whether to use the parquet cache of standardized data, by default True
+    n_workers : int, optional
+        number of threads downloading and reading files of the session at once, by default 1
+
+    Returns
+    -------
+    dict[str, pd.DataFrame]
+        standardized motion, gps and timestamps dataframes
+    """
+    if browser_kwargs is None:
+        session = pathify(session)
+        paths = {key: session / name for key, name in RECSLAM_SENSOR_FILES.items()}
+        return read_recslam_sensor_data_standard(paths=paths, use_cache=use_cache, n_workers=n_workers)
+    if file_structure_path is None:
+        raise ValueError("`file_structure_path` must be provided to read remote sessions")
+    downloads_dir = Directory(downloads_dir, temporary=downloads_dir is None)
+    browser = GSBrowser(**browser_kwargs, downloads_dir=downloads_dir)
+    dfs = GSBrowserFileStructure(browser, downloads_dir, file_structure_path, str(session))
+    return read_recslam_sensor_data_standard(dfs=dfs, use_cache=use_cache, n_workers=n_workers)
+
+
+def _write_partition(df: pd.DataFrame, output_dir: Path, name: str) -> Path:
+    partition_dir = output_dir / f"session={name}"
+    partition_dir.mkdir(parents=True, exist_ok=True)
+    output_path = partition_dir / "part-0.parquet"
+    with atomic_path(output_path) as tmp_path:
+        df.to_parquet(tmp_path)
+    return output_path
+
+
+def process_session(
+    session: PathLike, output_dir: PathLike, profile: bool = False, **read_kwargs
+) -> SessionResult:
+    """Calculate road quality of a single session and write it to the partitioned dataset,
+    errors are not raised but returned in `SessionResult.error`
+
+    Parameters
+    ----------
+    session : PathLike
+        local directory or remote prefix of the session, see `read_session_sensor_data`
+    output_dir : PathLike
+        root directory of the partitioned parquet dataset
+    profile : bool, optional
+        whether to profile stages of the session with `StageProfiler`, the report is logged
+        and returned in `SessionResult.profile`, by default False
+    **read_kwargs
+        keyword arguments of `read_session_sensor_data`
+
+    Returns
+    -------
+    SessionResult
+        output path, number of rows and elapsed time or an error of the session
+    """
+    name = get_session_name(session)
+    profiler = StageProfiler() if profile else None
+    start = time.perf_counter()
+    try:
+        with profile_stage(profiler, "read_session_sensor_data") as record:
+            sensor_data = read_session_sensor_data(session, **read_kwargs)
+            record.rows_out = sum(len(df) for df in sensor_data.values())
+        road_quality_df = road_quality_from_sensor_data(
+            sensor_data, compact=True, geometry=False, profiler=profiler
+        )
+        with profile_stage(profiler, "write_partition", rows_in=len(road_quality_df)):
+            output_path = _write_partition(road_quality_df, pathify(output_dir), name)
+    except Exception as e:
+        logger.warning(f"Session `{session}` failed", exc_info=True)
+        result = SessionResult(
+            str(session),
+            name,
+            elapsed=time.perf_counter() - start,
+            error=f"{type(e).__name__}: {e}",
+        )
+    else:
+        result = SessionResult(
+            str(session),
+            name,
+            output_path=output_path,
+            n_rows=len(road_quality_df),
+            elapsed=time.perf_counter() - start,
+        )
+    if profiler is not None:
+        result.profile = profiler.report()
+        logger.info(f"Session `{name}` profile: {profiler.to_json()}")
+    return result
+
+# %% ../../../nbs/core/08_road_quality_batch.ipynb 9
+def run_road_quality_batch(
+    sessions: Iterable[PathLike],
+    output_dir: PathLike,
+    n_workers: int | None = None,
+    progress: bool = True,
+    profile: bool = False,
+    **read_kwargs,
+) -> pd.DataFrame:
+    """Calculate road quality for many sessions in parallel and write results to a partitioned parquet dataset
+
+    Parameters
+    ----------
+    sessions : Iterable[PathLike]
+        local directories or remote prefixes of sessions, see `read_session_sensor_data`
+    output_dir : PathLike
+        root directory of the partitioned parquet dataset, a partition `session=<name>` is written per session
+    n_workers : int | None, optional
+        number of worker processes, by default the number of CPUs
+    progress : bool, optional
+        whether to show a progress bar over all sessions, by default True
+    profile : bool, optional
+        whether to profile stages of every session, see `process_session`, by default False
+    **read_kwargs
+        keyword arguments of `read_session_sensor_data`, e.g. `browser_kwargs` for remote sessions
+
+    Returns
+    -------
+    pd.DataFrame
+        summary with a row per session: `name`, `output_path`, `n_rows`, `elapsed`, `error`
+        and `profile` report if `profile` is True
+
+    Raises
+    ------
+    ValueError
+        if several sessions have the same name, their partitions would overwrite each other
+    """
+    sessions = [str(s) for s in sessions]
+    names = pd.Series([get_session_name(s) for s in sessions])
+    if names.duplicated().any():
+        raise ValueError(
+            f"Session names must be unique, duplicated: {names[names.duplicated()].unique().tolist()}"
+        )
+    output_dir = pathify(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    n_workers = n_workers or os.cpu_count() or 1
+    results: dict[str, SessionResult] = {}
+    progress_bar = tqdm(total=len(sessions), desc="sessions", disable=not progress)
+
+    def _collect(result: SessionResult):
+        results[result.session] = result
+        progress_bar.update()
+        progress_bar.set_postfix(failed=sum(not r.ok for r in results.values()))
+
+    if n_workers == 1:
+        for session in sessions:
+            _collect(process_session(session, output_dir, profile, **read_kwargs))
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            futures = {
+                executor.submit(process_session, session, output_dir, profile, **read_kwargs): session
+                for session in sessions
+            }
+            for future in as_completed(futures):
+                session = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # the worker itself died, e.g. killed for running out of memory
+                    result = SessionResult(
+                        session, get_session_name(session), error=f"{type(e).__name__}: {e}"
+                    )
+                _collect(result)
+    progress_bar.close()
+
+    summary = pd.DataFrame([asdict(results[s]) for s in sessions]).set_index("session")
+    n_failed = summary["error"].notna().sum()
+    if n_failed:
+        logger.warning(f"{n_failed} of {len(sessions)} sessions failed")
+    return summary
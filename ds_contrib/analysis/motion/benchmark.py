@@ -0,0 +1,186 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/core/15_road_quality_benchmark.ipynb.
+
+# %% ../../../nbs/core/15_road_quality_benchmark.ipynb 3
+# basic imports
+from __future__ import annotations
+
+# sys and paths imports
+import logging
+from time import perf_counter
+
+# typing imports
+from typing import Iterable
+
+import pandas as pd
+
+from ds_contrib.analysis.motion.iri import (
+    DEFAULT_DTYPE_POLICY,
+    aggregate_road_quality,
+    calculate_road_quality,
+    change_index,
+    get_road_qaulity_agg_func,
+    get_shared_index_for_sensor_data,
+    read_recslam_gps_raw,
+    read_recslam_motion_raw,
+    read_recslam_timestamps_columns,
+    standardize_recslam_gps_raw,
+    standardize_recslam_motion_raw,
+    standardize_recslam_timestamps_columns,
+)
+from .synthetic import write_synthetic_recslam_session
+from ...core.paths import PathLike, pathify
+
+# %% auto 0
+__all__ = ['logger', 'BENCHMARK_STAGES', 'benchmark_road_quality_pipeline', 'run_road_quality_benchmarks', 'compare_benchmarks']
+
+# %% ../../../nbs/core/15_road_quality_benchmark.ipynb 5
+logger = logging.getLogger(__name__)
+
+# %% ../../../nbs/core/15_road_quality_benchmark.ipynb 7
+BENCHMARK_STAGES = ["read", "standardize", "shared_index", "road_quality", "change_index", "aggregate"]
+
+
+def _count_rows(value: pd.DataFrame | dict) -> int:
+    # timestamps are read as a dict of per frame arrays
+    return len(value["time"]) if isinstance(value, dict) else len(value)
+
+
+def _run_pipeline_once(paths: dict[str, PathLike]) -> list[dict]:
+    records = []
+
+    def timed(stage, func, *args, **kwargs):
+        start = perf_counter()
+        result = func(*args, **kwargs)
+        seconds = perf_counter() - start
+        rows = sum(map(_count_rows, result.values())) if isinstance(result, dict) else len(result)
+        records.append({"stage": stage, "seconds": seconds, "rows": rows})
+        return result
+
+    def read_raw():
+        return {
+            "motion_df": read_recslam_motion_raw(path=paths["motion_path"]),
+            "gps_df": read_recslam_gps_raw(path=paths["gps_path"]),
+            "timestamps_columns": read_recslam_timestamps_columns(path=paths["timestamps_path"]),
+        }
+
+    def standardize(raw):
+        sensor_data = {
+            "motion": standardize_recslam_motion_raw(raw["motion_df"]),
+            "gps": standardize_recslam_gps_raw(raw["gps_df"]),
+            "timestamps": standardize_recslam_timestamps_columns(raw["timestamps_columns"]),
+        }
+        return {key: DEFAULT_DTYPE_POLICY.apply(df) for key, df in sensor_data.items()}
+
+    raw = timed("read", read_raw)
+    sensor_data = timed("standardize", standardize, raw)
+    shared_index = timed(
+        "shared_index",
+        get_shared_index_for_sensor_data,
+        sensor_data["gps"],
+        sensor_data["timestamps"],
+        sensor_data["motion"],
+        use_cache=False,
+    )
+    road_quality_df = timed("road_quality", calculate_road_quality, shared_index, sensor_data["motion"])
+    timed(
+        "change_index",
+        change_index,
+        road_quality_df,
+        "frame_number",
+        get_road_qaulity_agg_func(road_quality_df, "frame_number"),
+    )
+    timed("aggregate", aggregate_road_quality, road_quality_df, "frame_number")
+    return records
+
+
+def benchmark_road_quality_pipeline(paths: dict[str, PathLike], repeat: int = 3) -> pd.DataFrame:
+    """Times every stage of the road quality pipeline on local recslam files, see `BENCHMARK_STAGES`
+
+    Parameters
+    ----------
+    paths : dict[str, PathLike]
+        local paths with keys `motion_path`, `gps_path` and `timestamps_path`,
+        e.g. from `write_synthetic_recslam_session`
+    repeat : int, optional
+        number of runs of the whole pipeline, by default 3
+
+    Returns
+    -------
+    pd.DataFrame
+        dataframe indexed by `stage` with `min`, `median` and `max` wall time in seconds and number of output `rows`
+    """
+    paths = {k: pathify(v) for k, v in paths.items()}
+    records = []
+    for run in range(repeat):
+        records.extend(_run_pipeline_once(paths))
+        logger.debug(f"Finished run {run + 1}/{repeat} on {paths['motion_path'].parent}")
+    results = pd.DataFrame(records).groupby("stage", sort=False)
+    return pd.concat(
+        [results["seconds"].agg(["min", "median", "max"]), results["rows"].max()],
+        axis=1,
+    )
+
+# %% ../../../nbs/core/15_road_quality_benchmark.ipynb 10
+def run_road_quality_benchmarks(
+    work_dir: PathLike,
+    hours: Iterable[float] = (1, 10),
+    repeat: int = 3,
+    seed: int = 0,
+) -> pd.DataFrame:
+    """Benchmarks the road quality pipeline on synthetic rides of different durations
+
+    Parameters
+    ----------
+    work_dir : PathLike
+        directory for synthetic sessions, existing sessions are reused
+    hours : Iterable[float], optional
+        durations of rides, by default (1, 10)
+    repeat : int, optional
+        number of runs of the pipeline on each ride, by default 3
+    seed : int, optional
+        seed of synthetic rides, by default 0
+
+    Returns
+    -------
+    pd.DataFrame
+        results of `benchmark_road_quality_pipeline` indexed by `hours` and `stage`
+    """
+    work_dir = pathify(work_dir)
+    results = {}
+    for ride_hours in hours:
+        session_dir = work_dir / f"synthetic_{ride_hours:g}h_seed{seed}"
+        paths = {
+            "motion_path": session_dir / "motion.csv",
+            "gps_path": session_dir / "gps.csv",
+            "timestamps_path": session_dir / "times_full_2.json",
+        }
+        if not all(path.exists() for path in paths.values()):
+            paths = write_synthetic_recslam_session(session_dir, hours=ride_hours, seed=seed)
+        results[ride_hours] = benchmark_road_quality_pipeline(paths, repeat=repeat)
+        logger.info(f"Benchmarked {ride_hours:g}h ride:\n{results[ride_hours]}")
+    return pd.concat(results, names=["hours", "stage"])
+
+
+def compare_benchmarks(results: pd.DataFrame, baseline: pd.DataFrame, tolerance: float = 1.2) -> pd.DataFrame:
+    """Compares median times of benchmark results with a baseline
+
+    Parameters
+    ----------
+    results : pd.DataFrame
+        results of `benchmark_road_quality_pipeline` or `run_road_quality_benchmarks`
+    baseline : pd.DataFrame
+        results of a previous run with the same index, e.g. read back by `pd.read_csv(path, index_col=[...])`
+    tolerance : float, optional
+        allowed ratio of the current median time to the baseline one, by default 1.2
+
+    Returns
+    -------
+    pd.DataFrame
+        `baseline` and `current` median times, their `ratio` and whether it is a `regression`, for stages present in both
+    """
+    comparison = pd.concat(
+        {"baseline": baseline["median"], "current": results["median"]}, axis=1, join="inner"
+    )
+    comparison["ratio"] = comparison["current"] / comparison["baseline"]
+    comparison["regression"] = comparison["ratio"] > tolerance
+    return comparison
@@ -0,0 +1,89 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/core/10_spatial_cells.ipynb.
+
+# %% ../../../nbs/core/10_spatial_cells.ipynb 3
+# basic imports
+from __future__ import annotations
+
+import numpy as np
+
+# %% auto 0
+__all__ = ['GEOHASH_ALPHABET', 'encode_geohash', 'geohash_bounds']
+
+# %% ../../../nbs/core/10_spatial_cells.ipynb 6
+GEOHASH_ALPHABET = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+def _geohash_bits(precision: int) -> tuple[int, int]:
+    n_bits = 5 * precision
+    return (n_bits + 1) // 2, n_bits // 2
+
+
+def encode_geohash(
+    lon: np.ndarray | float, lat: np.ndarray | float, precision: int = 6
+) -> np.ndarray:
+    """Geohashes of points
+
+    Parameters
+    ----------
+    lon : np.ndarray | float
+        longitudes in degrees
+    lat : np.ndarray | float
+        latitudes in degrees
+    precision : int, optional
+        number of characters of geohashes, by default 6
+
+    Returns
+    -------
+    np.ndarray
+        object array of geohash strings, None for points with missing coordinates
+    """
+    lon = np.atleast_1d(np.asarray(lon, dtype=np.float64))
+    lat = np.atleast_1d(np.asarray(lat, dtype=np.float64))
+    lon_bits, lat_bits = _geohash_bits(precision)
+    valid = ~(np.isnan(lon) | np.isnan(lat))
+    x = np.clip(
+        np.floor((np.where(valid, lon, 0) + 180) / 360 * 2**lon_bits), 0, 2**lon_bits - 1
+    ).astype(np.int64)
+    y = np.clip(
+        np.floor((np.where(valid, lat, 0) + 90) / 180 * 2**lat_bits), 0, 2**lat_bits - 1
+    ).astype(np.int64)
+    # bits are interleaved starting with the longitude
+    code = np.zeros(len(lon), dtype=np.int64)
+    for i in range(5 * precision):
+        value, n_bits = (x, lon_bits) if i % 2 == 0 else (y, lat_bits)
+        code = (code << 1) | ((value >> (n_bits - 1 - i // 2)) & 1)
+    alphabet = np.frombuffer(GEOHASH_ALPHABET.encode(), dtype=np.uint8)
+    shifts = 5 * np.arange(precision - 1, -1, -1)
+    chars = alphabet[(code[:, None] >> shifts) & 31]
+    geohashes = chars.view(f"S{precision}").ravel().astype(str).astype(object)
+    geohashes[~valid] = None
+    return geohashes
+
+
+def geohash_bounds(geohash: str) -> tuple[float, float, float, float]:
+    """Bounds of a geohash cell
+
+    Parameters
+    ----------
+    geohash : str
+        geohash string
+
+    Returns
+    -------
+    tuple[float, float, float, float]
+        `(min_lon, min_lat, max_lon, max_lat)` in degrees
+    """
+    lon_bits, lat_bits = _geohash_bits(len(geohash))
+    x = y = 0
+    i = 0
+    for char in geohash:
+        value = GEOHASH_ALPHABET.index(char)
+        for shift in range(4, -1, -1):
+            bit = (value >> shift) & 1
+            if i % 2 == 0:
+                x = (x << 1) | bit
+            else:
+                y = (y << 1) | bit
+            i += 1
+    width, height = 360 / 2**lon_bits, 180 / 2**lat_bits
+    return (-180 + x * width, -90 + y * height, -180 + (x + 1) * width, -90 + (y + 1) * height)
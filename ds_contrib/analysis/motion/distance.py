@@ -0,0 +1,107 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/core/07_path_distance.ipynb.
+
+# %% ../../../nbs/core/07_path_distance.ipynb 3
+# basic imports
+from __future__ import annotations
+
+# typing imports
+from typing import Literal
+
+import numpy as np
+from pyproj import Geod
+
+# %% auto 0
+__all__ = ['EARTH_RADIUS', 'geod', 'DISTANCE_KERNELS', 'haversine_distance', 'wgs84_distance', 'get_path_distances']
+
+# %% ../../../nbs/core/07_path_distance.ipynb 6
+EARTH_RADIUS = 6_371_008.8  # mean Earth radius in meters
+geod = Geod(ellps="WGS84")
+
+
+def haversine_distance(
+    lon1: np.ndarray, lat1: np.ndarray, lon2: np.ndarray, lat2: np.ndarray
+) -> np.ndarray:
+    """Great-circle distance between points on a sphere with the mean Earth radius
+
+    Parameters
+    ----------
+    lon1, lat1 : np.ndarray
+        coordinates of the first points in degrees
+    lon2, lat2 : np.ndarray
+        coordinates of the second points in degrees
+
+    Returns
+    -------
+    np.ndarray
+        distances in meters, NaN if any of the coordinates is NaN
+    """
+    lon1, lat1, lon2, lat2 = (
+        np.radians(np.asarray(x, dtype=np.float64)) for x in (lon1, lat1, lon2, lat2)
+    )
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS * np.arcsin(np.sqrt(a))
+
+
+def wgs84_distance(
+    lon1: np.ndarray, lat1: np.ndarray, lon2: np.ndarray, lat2: np.ndarray
+) -> np.ndarray:
+    """Geodesic distance between points on the WGS84 ellipsoid
+
+    Parameters
+    ----------
+    lon1, lat1 : np.ndarray
+        coordinates of the first points in degrees
+    lon2, lat2 : np.ndarray
+        coordinates of the second points in degrees
+
+    Returns
+    -------
+    np.ndarray
+        distances in meters, NaN if any of the coordinates is NaN
+    """
+    lon1, lat1, lon2, lat2 = (
+        np.ascontiguousarray(x, dtype=np.float64) for x in (lon1, lat1, lon2, lat2)
+    )
+    _, _, dist = geod.inv(lon1, lat1, lon2, lat2)
+    return np.asarray(dist, dtype=np.float64)
+
+# %% ../../../nbs/core/07_path_distance.ipynb 9
+DISTANCE_KERNELS = {"wgs84": wgs84_distance, "haversine": haversine_distance}
+
+
+def get_path_distances(
+    lon: np.ndarray,
+    lat: np.ndarray,
+    method: Literal["wgs84", "haversine"] = "wgs84",
+) -> tuple[np.ndarray, np.ndarray]:
+    """Distances between consecutive points of a track and the cumulative distance (path) from its start
+
+    Parameters
+    ----------
+    lon : np.ndarray
+        longitudes of the track points in degrees
+    lat : np.ndarray
+        latitudes of the track points in degrees
+    method : Literal["wgs84", "haversine"], optional
+        distance kernel, `haversine` is faster but less accurate, by default "wgs84"
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        path and per-step distances in meters, both of the same length as the input,
+        the first step and steps from or to missing points are 0
+    """
+    lon = np.ascontiguousarray(lon, dtype=np.float64)
+    lat = np.ascontiguousarray(lat, dtype=np.float64)
+    if method not in DISTANCE_KERNELS:
+        raise ValueError(
+            f"Unknown distance method `{method}`, choose from {list(DISTANCE_KERNELS)}"
+        )
+    dist_delta = np.zeros_like(lon)
+    if len(lon) > 1:
+        dist_delta[1:] = DISTANCE_KERNELS[method](lon[1:], lat[1:], lon[:-1], lat[:-1])
+    dist_delta[np.isnan(dist_delta)] = 0
+    return np.cumsum(dist_delta), dist_delta
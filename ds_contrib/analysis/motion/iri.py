@@ -5,19 +5,27 @@
 from __future__ import annotations
 
 # sys and paths imports
+import hashlib
 import json
 import logging
 import os
+import sys
+import time
 
 # typing imports
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass, replace
 from enum import Enum
 from pathlib import Path
-from typing import Literal
+from typing import Any, Callable, Iterable, Iterator, Literal
 
 # cv and image imports
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from dotenv import load_dotenv
 
 # widgets imports
@@ -25,10 +33,12 @@ from matplotlib.ticker import PercentFormatter
 from pyproj import Geod
 from scipy.signal import find_peaks
 
+from .distance import get_path_distances
 from ...core.files.structure import GSBrowserFileStructure
 from ds_contrib.core.paths import (
     Directory,
     PathLike,
+    atomic_path,
     pathify,
 )
 
@@ -37,27 +47,149 @@ from ...core.utils import Iterifiable, exclusive_args, listify
 from ...tools.io.gscloud import GSBrowser
 
 # %% auto 0
-__all__ = ['logger', 'geod', 'g', 'read_recslam_gps_raw', 'read_recslam_motion_raw', 'read_recslam_timestamps_raw',
-           'standardize_recslam_gps_raw', 'standardize_recslam_motion_raw', 'standardize_recslam_timestamps_raw',
-           'read_recslam_sensor_data_raw', 'standardize_recslam_sensor_data', 'read_recslam_sensor_data_standard',
-           'get_shared_time_index', 'map_df_to_shared_index', 'interpolate_inner', 'get_path_from_gps',
-           'get_shared_index_for_sensor_data', 'get_road_qaulity_agg_func', 'change_index', 'RideQuality',
-           'get_ride_quality', 'split_imu_on_sections', 'calculate_rms_on_sections', 'calculate_iri', 'find_bumps',
-           'calculate_road_quality', 'road_quality_from_sensor_data', 'plot_road_quality_stats',
+__all__ = ['logger', 'geod', 'g', 'SOURCE_DTYPE', 'COORDINATE_COLUMNS', 'DEFAULT_DTYPE_POLICY', 'COMPACT_DTYPE_POLICY',
+           'RECSLAM_SENSOR_DATA', 'SENSOR_CACHE_VERSION', 'GPS_COORDINATE_COLUMNS', 'GPS_PATH_COLUMNS',
+           'SHARED_INDEX_CACHE_VERSION', 'ROAD_QUALITY_AGG_KERNELS', 'RIDE_QUALITY_THRESHOLDS', 'IMU_COLUMNS',
+           'SECTION_SUMS', 'SECTION_STATISTICS', 'GEOMETRY_OVERHEAD_BYTES', 'DtypePolicy', 'StageRecord',
+           'StageProfiler', 'profile_stage', 'read_recslam_gps_raw', 'read_recslam_motion_raw',
+           'read_recslam_motion_windows', 'read_recslam_motion_time_index', 'read_recslam_timestamps_raw',
+           'read_recslam_heading_raw', 'read_recslam_detections_raw', 'standardize_recslam_gps_raw',
+           'standardize_recslam_motion_raw', 'standardize_recslam_timestamps_raw', 'read_recslam_timestamps_columns',
+           'standardize_recslam_timestamps_columns', 'read_recslam_sensor_data_raw', 'standardize_recslam_sensor_data',
+           'read_sensor_cache', 'write_sensor_cache', 'read_recslam_sensor_data_standard', 'get_shared_time_index',
+           'map_dfs_to_shared_index', 'map_df_to_shared_index', 'interpolate_inner', 'get_path_from_gps',
+           'get_gps_geometry', 'get_shared_index_for_sensor_data', 'read_shared_index_cache',
+           'write_shared_index_cache', 'get_road_qaulity_agg_func', 'change_index', 'aggregate_road_quality',
+           'RideQuality', 'get_ride_quality', 'classify_ride_quality', 'split_imu_on_sections',
+           'calculate_section_sums', 'get_section_statistics', 'calculate_section_statistics',
+           'calculate_rms_on_sections', 'calculate_iri', 'find_bumps', 'calculate_road_quality',
+           'road_quality_from_sensor_data', 'sweep_find_bumps', 'get_memory_usage', 'compact_road_quality_df',
+           'get_section_lines', 'decimate_min_max', 'plot_road_quality_stats', 'RoadQualityView',
            'plot_road_quality_on_range']
 
-# %% ../../../nbs/core/05_road_quality.ipynb 4
+# %% ../../../nbs/core/05_road_quality.ipynb 5
 os.environ["USE_PYGEOS"] = "0"
 import geopandas as gpd
+import shapely
 
-# %% ../../../nbs/core/05_road_quality.ipynb 5
+# %% ../../../nbs/core/05_road_quality.ipynb 6
 logger = logging.getLogger(__name__)
 
-# %% ../../../nbs/core/05_road_quality.ipynb 8
+# %% ../../../nbs/core/05_road_quality.ipynb 9
 geod = Geod(ellps="WGS84")
 g = 9.80665
 
-# %% ../../../nbs/core/05_road_quality.ipynb 10
+# %% ../../../nbs/core/05_road_quality.ipynb 11
+SOURCE_DTYPE = pd.CategoricalDtype(["original", "interpolated", "extrapolated"])
+COORDINATE_COLUMNS = ["lon", "lat"]
+
+
+@dataclass(frozen=True)
+class DtypePolicy:
+    """Dtypes of column families of sensor, shared index and road quality dataframes"""
+
+    float_dtype: np.dtype | str = np.float64
+    coordinate_dtype: np.dtype | str = np.float64
+    frame_number_dtype: str = "Int32"
+    categorical_sources: bool = False
+
+    def get_dtype(self, column: str, dtype) -> Any:
+        """Dtype of a column under the policy, None if the column is kept as is"""
+        if column == "frame_number":
+            return self.frame_number_dtype
+        if column.startswith("source_"):
+            return SOURCE_DTYPE if self.categorical_sources else None
+        if column.startswith("original_time_"):
+            return "datetime64[ns]"
+        if column in COORDINATE_COLUMNS:
+            return self.coordinate_dtype
+        if isinstance(dtype, np.dtype) and dtype.kind == "f":
+            return self.float_dtype
+        return None
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Cast columns of a dataframe to dtypes of the policy, the dataframe is returned as is if nothing changes"""
+        dtypes = {}
+        for column, dtype in df.dtypes.items():
+            target = self.get_dtype(column, dtype)
+            if target is not None and dtype != target:
+                dtypes[column] = target
+        return df.astype(dtypes) if dtypes else df
+
+
+DEFAULT_DTYPE_POLICY = DtypePolicy()
+COMPACT_DTYPE_POLICY = DtypePolicy(float_dtype=np.float32, categorical_sources=True)
+
+# %% ../../../nbs/core/05_road_quality.ipynb 14
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+
+def _get_peak_rss() -> int | None:
+    if resource is None:
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak_rss if sys.platform == "darwin" else peak_rss * 1024
+
+
+@dataclass
+class StageRecord:
+    """Measurements of a single stage of the pipeline, memory in bytes"""
+
+    stage: str
+    seconds: float = 0.0
+    peak_rss_delta: int | None = None
+    rows_in: int | None = None
+    rows_out: int | None = None
+
+
+class StageProfiler:
+    """Opt-in collector of wall time, peak memory growth and row counts of pipeline stages,
+    stages are recorded in the order they finish, including the failed ones
+    """
+
+    def __init__(self):
+        self.records: list[StageRecord] = []
+
+    @contextmanager
+    def stage(self, stage: str, rows_in: int | None = None) -> Iterator[StageRecord]:
+        """Measures the body of the `with` block, `rows_out` is set on the yielded record by the caller"""
+        record = StageRecord(stage, rows_in=rows_in)
+        peak_rss = _get_peak_rss()
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record.seconds = time.perf_counter() - start
+            if peak_rss is not None:
+                record.peak_rss_delta = _get_peak_rss() - peak_rss
+            self.records.append(record)
+
+    def report(self) -> dict[str, Any]:
+        """JSON serializable report: `stages` with measurements of every stage, their total `seconds` and `peak_rss` of the process"""
+        return {
+            "stages": [asdict(record) for record in self.records],
+            "seconds": sum(record.seconds for record in self.records),
+            "peak_rss": _get_peak_rss(),
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.report())
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame([asdict(record) for record in self.records])
+
+
+def profile_stage(profiler: StageProfiler | None, stage: str, rows_in: int | None = None):
+    """`profiler.stage(stage, rows_in)` or a no-op context yielding a detached record if `profiler` is None"""
+    if profiler is None:
+        return nullcontext(StageRecord(stage))
+    return profiler.stage(stage, rows_in)
+
+# %% ../../../nbs/core/05_road_quality.ipynb 17
 @exclusive_args(["recslam_file_structure", "path"])
 def _get_from_dfs_or_path(
     recslam_file_structure: GSBrowserFileStructure | None = None,
@@ -96,6 +228,80 @@ def read_recslam_motion_raw(
     return motion_df
 
 
+@exclusive_args(["recslam_file_structure", "path"])
+def read_recslam_motion_windows(
+    recslam_file_structure: GSBrowserFileStructure | None = None,
+    path: PathLike | None = None,
+    window: float = 60,
+    chunksize: int = 10_000,
+    dtypes: DtypePolicy | None = None,
+) -> Iterator[pd.DataFrame]:
+    """Reads motion data in chunks and yields standardized windows of `window` seconds,
+    so that only a single window (plus a chunk) is kept in memory at once.
+
+    Parameters
+    ----------
+    recslam_file_structure : GSBrowserFileStructure | None, optional
+        file structure with recslam data, by default None
+    path : PathLike | None, optional
+        path to the `motion.csv` file, by default None
+    window : float, optional
+        duration of a window in seconds, windows are aligned to the first timestamp, by default 60
+    chunksize : int, optional
+        number of rows parsed from csv at once, by default 10_000
+    dtypes : DtypePolicy | None, optional
+        dtypes of columns, by default DEFAULT_DTYPE_POLICY
+
+    Yields
+    ------
+    pd.DataFrame
+        standardized motion dataframe with DatetimeIndex covering a single window
+    """
+    path = _get_from_dfs_or_path(recslam_file_structure, path, "common/motion")
+    window = pd.Timedelta(seconds=window)
+    # chunks of the current window, concatenated once when the window is complete
+    chunks: list[pd.DataFrame] = []
+    window_end = None
+    dtypes = dtypes or DEFAULT_DTYPE_POLICY
+    for chunk in pd.read_csv(path, chunksize=chunksize):
+        chunk = dtypes.apply(standardize_recslam_motion_raw(chunk))
+        if window_end is None:
+            window_end = chunk.index[0] + window
+        chunks.append(chunk)
+        if chunk.index[-1] < window_end:
+            continue
+        buffer = pd.concat(chunks)
+        while len(buffer) and buffer.index[-1] >= window_end:
+            split = buffer.index.searchsorted(window_end)
+            if split:
+                yield buffer.iloc[:split]
+            buffer = buffer.iloc[split:]
+            window_end += window
+        chunks = [buffer] if len(buffer) else []
+    if chunks:
+        yield pd.concat(chunks)
+
+
+@exclusive_args(["recslam_file_structure", "path"])
+def read_recslam_motion_time_index(
+    recslam_file_structure: GSBrowserFileStructure | None = None,
+    path: PathLike | None = None,
+) -> pd.DataFrame:
+    """Reads only timestamps of motion data, which is enough to build a shared index
+    with `get_shared_index_for_sensor_data` without loading the whole motion data
+
+    Returns
+    -------
+    pd.DataFrame
+        dataframe without columns and with DatetimeIndex of motion data
+    """
+    path = _get_from_dfs_or_path(recslam_file_structure, path, "common/motion")
+    motion_df = pd.read_csv(path, usecols=["time"])
+    motion_df = standardize_recslam_motion_raw(motion_df)
+    motion_df.attrs["source_path"] = str(path)
+    return motion_df
+
+
 @exclusive_args(["recslam_file_structure", "path"])
 def read_recslam_timestamps_raw(
     recslam_file_structure: GSBrowserFileStructure | None = None,
@@ -110,6 +316,27 @@ def read_recslam_timestamps_raw(
     return timestamps_json
 
 
+@exclusive_args(["recslam_file_structure", "path"])
+def read_recslam_heading_raw(
+    recslam_file_structure: GSBrowserFileStructure | None = None,
+    path: PathLike | None = None,
+) -> pd.DataFrame:
+    path = _get_from_dfs_or_path(recslam_file_structure, path, "common/heading")
+    heading_df = pd.read_csv(path)
+    return heading_df
+
+
+@exclusive_args(["recslam_file_structure", "path"])
+def read_recslam_detections_raw(
+    recslam_file_structure: GSBrowserFileStructure | None = None,
+    path: PathLike | None = None,
+) -> dict | list:
+    path = _get_from_dfs_or_path(recslam_file_structure, path, "common/detections")
+    with open(path) as f:
+        detections_json = json.load(f)
+    return detections_json
+
+
 def standardize_recslam_gps_raw(gps_df: pd.DataFrame):
     gps_df["time"] = pd.to_datetime(gps_df["time"], unit="s")
     gps_df.set_index("time", inplace=True)
@@ -130,45 +357,174 @@ def standardize_recslam_timestamps_raw(timestamps_json: dict):
     return timestamps_df
 
 
+def _parse_numeric_array(text: str, sep: str) -> np.ndarray | None:
+    # parsed in C, None if the text is not a plain list of numbers
+    text = text.strip()
+    if not text:
+        return np.empty(0, dtype=np.float64)
+    values = np.fromstring(text, sep=sep)
+    if len(values) != text.count(sep) + 1:
+        return None
+    if not any(c in text for c in ".eEn"):
+        values = values.astype(np.int64)
+    return values
+
+
+def _parse_flat_json_arrays(text: str) -> dict[str, np.ndarray] | None:
+    # `{"key": [numbers, ...], ...}` scanned with `str.find`, None on anything else
+    columns = {}
+    pos = text.find("{") + 1
+    while (start := text.find("[", pos)) != -1:
+        key_end = text.rfind('"', pos, start)
+        key_start = text.rfind('"', pos, key_end)
+        end = text.find("]", start)
+        if -1 in (key_end, key_start, end) or text[pos:key_start].strip(", \n\t\r"):
+            return None
+        if text[key_end + 1 : start].strip(": \n\t\r") or any(c in text[start + 1 : end] for c in '[{"'):
+            return None
+        values = _parse_numeric_array(text[start + 1 : end], ",")
+        if values is None:
+            return None
+        columns[text[key_start + 1 : key_end]] = values
+        pos = end + 1
+    if pos == 0 or text[pos:].strip("}, \n\t\r"):
+        return None
+    return columns
+
+
+def _parse_timestamps_json(text: str) -> dict[str, np.ndarray]:
+    columns = _parse_flat_json_arrays(text)
+    if columns and "time" in columns and len({len(v) for v in columns.values()}) == 1:
+        return columns
+    # anything but flat arrays of numbers of the same length falls back to the json parser
+    logger.debug("Timestamps are not flat numeric arrays, parsing them with json")
+    return {key: np.asarray(values) for key, values in json.loads(text).items()}
+
+
+@exclusive_args(["recslam_file_structure", "path"])
+def read_recslam_timestamps_columns(
+    recslam_file_structure: GSBrowserFileStructure | None = None,
+    path: PathLike | None = None,
+    camera: Literal["wide", "ultrawide"] = "wide",
+    old_format: bool = False,
+) -> dict[str, np.ndarray]:
+    """Reads camera timestamps straight into numpy arrays without Python objects per frame
+
+    Both formats declared in `recslam_structure.json` are supported, the format of a local path is chosen by its suffix:
+    - `times_full_2.json` / `times_full.json` - an object with `time` (unix time in seconds) and other per frame arrays,
+        e.g. `exp`, `iso` and `brightness`, every array is parsed in C by `np.fromstring`
+    - `times_2.txt` / `times.txt` (old format) - unix time of a frame in seconds per line
+
+    Parameters
+    ----------
+    recslam_file_structure : GSBrowserFileStructure | None, optional
+        file structure with recslam data, by default None
+    path : PathLike | None, optional
+        path to a timestamps file, by default None
+    camera : Literal["wide", "ultrawide"], optional
+        camera of the file structure, by default "wide"
+    old_format : bool, optional
+        whether to read `timestamps_old` of the file structure instead of `timestamps`, by default False
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        `time` as int64 nanoseconds, `frame_number` as int64 and other per frame arrays of the json format
+    """
+    prefix = f"camera_{camera}/timestamps_old" if old_format else f"camera_{camera}/timestamps"
+    path = _get_from_dfs_or_path(recslam_file_structure, path, prefix)
+    with open(path) as f:
+        text = f.read()
+    if path.suffix == ".json":
+        columns = _parse_timestamps_json(text)
+    else:
+        time = _parse_numeric_array(text, "\n")
+        if time is None:
+            raise ValueError(f"{path} is expected to contain a unix time in seconds per line")
+        columns = {"time": time}
+    # the same conversion as `pd.to_datetime(..., unit="s")` of the json format
+    columns["time"] = pd.to_datetime(columns["time"].astype(np.float64), unit="s").asi8
+    columns["frame_number"] = np.arange(len(columns["time"]), dtype=np.int64)
+    return columns
+
+
+def standardize_recslam_timestamps_columns(timestamps_columns: dict[str, np.ndarray]) -> pd.DataFrame:
+    """The same dataframe as `standardize_recslam_timestamps_raw` from arrays of `read_recslam_timestamps_columns`"""
+    time_index = pd.DatetimeIndex(timestamps_columns["time"].view("datetime64[ns]"), name="time")
+    columns = [c for c in timestamps_columns if c not in ("time", "frame_number")] + ["frame_number"]
+    return pd.DataFrame({c: timestamps_columns[c] for c in columns}, index=time_index)
+
+
+RECSLAM_SENSOR_DATA = ["motion", "gps", "timestamps"]
+
+
+def _read_concurrently(
+    readers: dict[str, Callable[[], Any]], n_workers: int = 1
+) -> dict[str, Any]:
+    """Calls `readers` one after another or in a pool of `n_workers` threads,
+    so downloads and parsing of different files overlap, results keep the order of `readers`
+    """
+    if n_workers == 1 or len(readers) < 2:
+        return {key: read() for key, read in readers.items()}
+    with ThreadPoolExecutor(max_workers=min(n_workers, len(readers))) as executor:
+        futures = {key: executor.submit(read) for key, read in readers.items()}
+        return {key: future.result() for key, future in futures.items()}
+
+
 def read_recslam_sensor_data_raw(
     reclsam_file_structure: GSBrowserFileStructure,
     camera: Literal["wide", "ultrawide"] = "wide",
-    sensor_data: Literal["motion", "gps", "timestamps", "all"] = "all",
+    sensor_data: Iterifiable[
+        Literal["motion", "gps", "timestamps", "heading", "detections", "all"]
+    ] = "all",
+    n_workers: int = 1,
 ) -> dict[str, pd.DataFrame | dict]:
     """Reads recslam sensor data from a GSBrowserFileStructure, downloading it if necessary.
 
+    With `n_workers` > 1 all files are downloaded at once and each one is parsed as soon as it lands,
+    so the session is loaded in about the time of its slowest file instead of the sum of all of them.
+
     Parameters
     ----------
     reclsam_file_structure : GSBrowserFileStructure
         A GSBrowserFileStructure object containing the recslam data.
     camera : Literal['wide', 'ultrawide'], optional
         The camera to use, by default 'wide'
-    sensor_data : Literal['motion', 'gps', 'timestamps', 'all'], optional
-        The sensor data to read, by default 'all'
+    sensor_data : Iterifiable[Literal['motion', 'gps', 'timestamps', 'heading', 'detections', 'all']], optional
+        The sensor data to read, one or several of them, 'all' stands for `RECSLAM_SENSOR_DATA`:
+        motion, gps and timestamps, by default 'all'
+    n_workers : int, optional
+        number of threads fetching and parsing files at once, 1 reads them one after another, by default 1
 
     Returns
     -------
     dict[str, pd.DataFrame|dict]
-        A dictionary containing the motion, gps and timestamps dataframes.
+        A dictionary containing the motion, gps and timestamps dataframes,
+        and `heading_df` and `detections_json` if requested.
     """
-    # load data, skip if already loaded
-    raw_sensor_data = {}
-    if sensor_data == "all" or sensor_data == "gps":
-        gps_df = read_recslam_gps_raw(reclsam_file_structure)
-        raw_sensor_data["gps_df"] = gps_df
-    if sensor_data == "all" or sensor_data == "motion":
-        motion_df = read_recslam_motion_raw(reclsam_file_structure)
-        raw_sensor_data["motion_df"] = motion_df
-    if sensor_data == "all" or sensor_data == "timestamps":
-        timestamps_json = read_recslam_timestamps_raw(
-            reclsam_file_structure, camera=camera
-        )
-        raw_sensor_data["timestamps_json"] = timestamps_json
-    return raw_sensor_data
+    sensor_data = listify(sensor_data)
+    if "all" in sensor_data:
+        sensor_data = RECSLAM_SENSOR_DATA + sensor_data
+    readers = {
+        "gps_df": ("gps", lambda: read_recslam_gps_raw(reclsam_file_structure)),
+        "motion_df": ("motion", lambda: read_recslam_motion_raw(reclsam_file_structure)),
+        "timestamps_json": (
+            "timestamps",
+            lambda: read_recslam_timestamps_raw(reclsam_file_structure, camera=camera),
+        ),
+        "heading_df": ("heading", lambda: read_recslam_heading_raw(reclsam_file_structure)),
+        "detections_json": (
+            "detections",
+            lambda: read_recslam_detections_raw(reclsam_file_structure),
+        ),
+    }
+    readers = {key: read for key, (name, read) in readers.items() if name in sensor_data}
+    return _read_concurrently(readers, n_workers)
 
 
 def standardize_recslam_sensor_data(
-    raw_sensor_data: dict[str, pd.DataFrame | dict]
+    raw_sensor_data: dict[str, pd.DataFrame | dict],
+    dtypes: DtypePolicy | None = None,
 ) -> dict[str, pd.DataFrame]:
     """Makes the raw sensor data consistent with each other.
     Converts all data to dataframes with DateTime index and timestamps to datetime objects.
@@ -178,6 +534,8 @@ def standardize_recslam_sensor_data(
     raw_sensor_data : dict[str, pd.DataFrame|dict]
         A dictionary containing the motion, gps and timestamps dataframes optionally with corresponding names. The dict is expected to contain at least one of the following keys: 'motion_df', 'gps_df', 'timestamps_json'.
         This dict may be built using the `read_raw_recslam_sensor_data` or separately by `read_recslam_...` function.
+    dtypes : DtypePolicy | None, optional
+        dtypes of columns, by default DEFAULT_DTYPE_POLICY
 
     Returns
     -------
@@ -200,39 +558,155 @@ def standardize_recslam_sensor_data(
             raw_sensor_data["timestamps_json"]
         )
 
-    return standardized_data
+    dtypes = dtypes or DEFAULT_DTYPE_POLICY
+    return {key: dtypes.apply(df) for key, df in standardized_data.items()}
+
+
+SENSOR_CACHE_VERSION = 1
+
+
+def _get_sensor_cache_path(source_path: Path) -> Path:
+    return source_path.with_name(f"{source_path.name}.standard.parquet")
+
+
+def _get_source_fingerprint(source_path: Path) -> dict[str, str]:
+    stat = source_path.stat()
+    return {
+        "version": str(SENSOR_CACHE_VERSION),
+        "source_size": str(stat.st_size),
+        "source_mtime_ns": str(stat.st_mtime_ns),
+    }
+
+
+def read_sensor_cache(source_path: PathLike) -> pd.DataFrame | None:
+    """Reads a standardized sensor dataframe cached next to the source file
+
+    The cache is valid only if the size and modification time of the source file
+    are the same as at the moment of writing the cache.
+
+    Parameters
+    ----------
+    source_path : PathLike
+        path to the source file (e.g. `motion.csv`), not to the cache itself
+
+    Returns
+    -------
+    pd.DataFrame | None
+        standardized dataframe or None if the cache does not exist or is outdated
+    """
+    source_path = pathify(source_path)
+    cache_path = _get_sensor_cache_path(source_path)
+    if not cache_path.exists():
+        return None
+    metadata = pq.read_schema(cache_path).metadata or {}
+    cached_fingerprint = json.loads(metadata.get(b"ds_contrib", b"{}"))
+    if cached_fingerprint != _get_source_fingerprint(source_path):
+        logger.info(f"Cache `{cache_path}` is outdated, skipping")
+        return None
+    logger.debug(f"Reading cached sensor data from `{cache_path}`")
+    return pq.read_table(cache_path).to_pandas()
+
+
+def write_sensor_cache(df: pd.DataFrame, source_path: PathLike) -> Path | None:
+    """Writes a standardized sensor dataframe to parquet next to the source file,
+    the cache is keyed by the size and modification time of the source file
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        standardized dataframe with DatetimeIndex
+    source_path : PathLike
+        path to the source file the dataframe was read from
+
+    Returns
+    -------
+    Path | None
+        path to the cache or None if the cache could not be written
+    """
+    source_path = pathify(source_path)
+    cache_path = _get_sensor_cache_path(source_path)
+    table = pa.Table.from_pandas(df)
+    metadata = {
+        **(table.schema.metadata or {}),
+        b"ds_contrib": json.dumps(_get_source_fingerprint(source_path)).encode(),
+    }
+    table = table.replace_schema_metadata(metadata)
+    try:
+        with atomic_path(cache_path) as tmp_path:
+            pq.write_table(table, tmp_path)
+    except OSError as e:
+        logger.warning(f"Could not write cache `{cache_path}`: {e}")
+        return None
+    return cache_path
+
+
+def _read_standard_cached(path: Path, read_raw, standardize, use_cache: bool):
+    df = read_sensor_cache(path) if use_cache else None
+    if df is None:
+        df = standardize(read_raw(path=path))
+        if use_cache:
+            write_sensor_cache(df, path)
+    # the source file identifies the data for caches of derived dataframes, e.g. the shared index
+    df.attrs["source_path"] = str(path)
+    return df
 
 
 @exclusive_args(["dfs", "paths"], may_be_empty=False)
 def read_recslam_sensor_data_standard(
-    dfs: GSBrowserFileStructure | None = None, paths: dict[str, PathLike] | None = None
-):
-    if dfs:
-        raw_sensor_data = read_recslam_sensor_data_raw(dfs)
-    else:
-        paths = {k: pathify(v) for k, v in paths.items()}
-        raw_sensor_data = {}
-        if "motion_path" in paths:
-            raw_sensor_data["motion_df"] = read_recslam_motion_raw(
-                path=paths["motion_path"]
-            )
-        if "gps_path" in paths:
-            raw_sensor_data["gps_df"] = read_recslam_gps_raw(path=paths["gps_path"])
-        if "timestamps_path" in paths:
-            raw_sensor_data["timestamps_json"] = read_recslam_timestamps_raw(
-                path=paths["timestamps_path"]
-            )
+    dfs: GSBrowserFileStructure | None = None,
+    paths: dict[str, PathLike] | None = None,
+    use_cache: bool = True,
+    dtypes: DtypePolicy | None = None,
+    n_workers: int = 1,
+) -> dict[str, pd.DataFrame]:
+    """Reads standardized recslam sensor data either from a GSBrowserFileStructure or from local paths.
 
-    standardized_data = standardize_recslam_sensor_data(raw_sensor_data)
-    return standardized_data
+    Standardized dataframes are cached as parquet files next to the source files
+    (e.g. `motion.csv.standard.parquet`) and reused on the next read while the source file is unchanged.
 
-# %% ../../../nbs/core/05_road_quality.ipynb 20
-def _get_dist(df):
-    # Helper function to compute distance between two GPS coordinates
-    _, _, dist = geod.inv(df["lon"], df["lat"], df["lon"].shift(), df["lat"].shift())
-    return dist
+    Parameters
+    ----------
+    dfs : GSBrowserFileStructure | None, optional
+        file structure with recslam data, files are downloaded if necessary, by default None
+    paths : dict[str, PathLike] | None, optional
+        local paths with keys `motion_path`, `gps_path` and `timestamps_path`, by default None
+    use_cache : bool, optional
+        whether to read and write the parquet cache of standardized data, by default True
+    dtypes : DtypePolicy | None, optional
+        dtypes of columns, applied after reading, the cache always keeps the original precision, by default DEFAULT_DTYPE_POLICY
+    n_workers : int, optional
+        number of threads downloading and reading files at once, see `read_recslam_sensor_data_raw`, by default 1
 
-# %% ../../../nbs/core/05_road_quality.ipynb 21
+    Returns
+    -------
+    dict[str, pd.DataFrame]
+        A dictionary containing the motion, gps and timestamps dataframes.
+    """
+    sources = {
+        "motion": ("motion_path", "common/motion", read_recslam_motion_raw, standardize_recslam_motion_raw),
+        "gps": ("gps_path", "common/gps", read_recslam_gps_raw, standardize_recslam_gps_raw),
+        "timestamps": (
+            "timestamps_path",
+            "camera_wide/timestamps",
+            read_recslam_timestamps_columns,
+            standardize_recslam_timestamps_columns,
+        ),
+    }
+
+    def _get_reader(path_key: str, dfs_prefix: str, read_raw, standardize):
+        def read() -> pd.DataFrame:
+            # resolved in the worker, so downloads of different files overlap
+            path = _get_from_dfs_or_path(dfs, None, dfs_prefix) if dfs else pathify(paths[path_key])
+            return _read_standard_cached(path, read_raw, standardize, use_cache)
+
+        return read
+
+    readers = {key: _get_reader(*source) for key, source in sources.items() if dfs or source[0] in paths}
+    standardized_data = _read_concurrently(readers, n_workers)
+    dtypes = dtypes or DEFAULT_DTYPE_POLICY
+    return {key: dtypes.apply(df) for key, df in standardized_data.items()}
+
+# %% ../../../nbs/core/05_road_quality.ipynb 36
 def get_shared_time_index(dataframes: list[pd.DataFrame]):
     """Get shared time index for a list of dataframes
 
@@ -265,6 +739,139 @@ def get_shared_time_index(dataframes: list[pd.DataFrame]):
     return shared_time_index
 
 
+def _set_source_status(result_df: pd.DataFrame, original_time_str: str, source_str: str):
+    # add interpolation status: original points, interpolated between the first and last original points, extrapolated otherwise
+    original_time = result_df[original_time_str]
+    timestamps = result_df.index
+    is_inner = (timestamps >= original_time.min()) & (timestamps <= original_time.max())
+    result_df[source_str] = np.where(
+        original_time.notna(),
+        "original",
+        np.where(is_inner, "interpolated", "extrapolated"),
+    ).astype(object)
+    return result_df
+
+
+def _to_ns(index: pd.DatetimeIndex) -> np.ndarray:
+    return index.to_numpy(dtype="datetime64[ns]").view(np.int64)
+
+
+def _get_asof_indexer(
+    left: np.ndarray,
+    right: np.ndarray,
+    tolerance: int,
+    direction: Literal["nearest", "backward", "forward"] = "nearest",
+) -> np.ndarray:
+    # same matching as `pd.merge_asof` on sorted int64 keys, -1 means no match
+    n = len(right)
+    if n == 0:
+        return np.full(len(left), -1, dtype=np.int64)
+    backward = np.searchsorted(right, left, side="right") - 1
+    backward_diff = left - right[np.maximum(backward, 0)]
+    backward = np.where((backward >= 0) & (backward_diff <= tolerance), backward, -1)
+    forward = np.searchsorted(right, left, side="left")
+    forward_diff = right[np.minimum(forward, n - 1)] - left
+    forward = np.where((forward < n) & (forward_diff <= tolerance), forward, -1)
+    if direction == "backward":
+        return backward
+    if direction == "forward":
+        return forward
+    # on ties the backward match wins
+    use_backward = (backward >= 0) & ((forward < 0) | (backward_diff <= forward_diff))
+    return np.where(use_backward, backward, forward)
+
+
+def _as_shared_index_frame(
+    shared_time_index: pd.DatetimeIndex | pd.DataFrame | pd.Series,
+) -> pd.DataFrame:
+    if isinstance(shared_time_index, (pd.DatetimeIndex, pd.Series)):
+        shared_time_index = pd.DataFrame(index=shared_time_index)
+        shared_time_index.index.name = "timestamp"
+    else:
+        if not isinstance(shared_time_index, pd.DataFrame):
+            raise TypeError(
+                f"`shared_time_index` should be pd.DatetimeIndex, pd.Series or pd.DataFrame, but got `{type(shared_time_index)}`"
+            )
+    return shared_time_index
+
+
+def _align_to_shared_index(
+    dfs: dict[str | None, pd.Series | pd.DataFrame],
+    shared_time_index: pd.DatetimeIndex | pd.DataFrame | pd.Series,
+    direction: Literal["nearest", "backward", "forward"] = "nearest",
+) -> pd.DataFrame:
+    shared_time_index = _as_shared_index_frame(shared_time_index)
+    shared_ns = _to_ns(shared_time_index.index)
+    tolerance = pd.Timedelta(shared_time_index.index.freq / 2).value
+    aligned = {}
+    for column_suffix, df in dfs.items():
+        if isinstance(df, pd.Series):
+            df = df.to_frame()
+        elif not isinstance(df, pd.DataFrame):
+            raise TypeError(
+                f"`df` should be pd.Series or pd.DataFrame, but got {type(df)}"
+            )
+        original_time_str = (
+            "original_time"
+            if column_suffix is None
+            else f"original_time_{column_suffix}"
+        )
+        source_str = "source" if column_suffix is None else f"source_{column_suffix}"
+        indexer = _get_asof_indexer(shared_ns, _to_ns(df.index), tolerance, direction)
+        stream_columns = {
+            column: df[column].array.take(indexer, allow_fill=True)
+            for column in df.columns
+        }
+        stream_columns[original_time_str] = df.index.array.take(
+            indexer, allow_fill=True
+        )
+        duplicates = set(stream_columns) & (
+            set(aligned) | set(shared_time_index.columns)
+        )
+        if duplicates:
+            raise ValueError(f"Columns {sorted(duplicates)} are present in several dataframes")
+        stream_df = pd.DataFrame(stream_columns, index=shared_time_index.index)
+        _set_source_status(stream_df, original_time_str, source_str)
+        aligned.update(stream_df.items())
+    result_df = pd.concat(
+        [shared_time_index, pd.DataFrame(aligned, index=shared_time_index.index)],
+        axis=1,
+    )
+    return result_df
+
+
+def map_dfs_to_shared_index(
+    dfs: dict[str, pd.Series | pd.DataFrame],
+    shared_time_index: pd.DatetimeIndex | pd.DataFrame | pd.Series,
+    direction: Literal["nearest", "backward", "forward"] = "nearest",
+) -> pd.DataFrame:
+    """Map several dataframes with DateTime index to a shared time index in a single pass
+
+    Equivalent to merging the results of `map_df_to_shared_index` for every dataframe with its name as `column_suffix`,
+    but the matching is done with `np.searchsorted` on int64 timestamps and no intermediate dataframes are merged.
+
+    Parameters
+    ----------
+    dfs : dict[str, pd.Series | pd.DataFrame]
+        time-sorted dataframes with DatetimeIndex by names, which are used as suffixes of `original_time` and `source` columns
+    shared_time_index : pd.DatetimeIndex | pd.DataFrame | pd.Series
+        shared time index to map the dataframes to
+    direction : Literal[&quot;nearest&quot;, &quot;backward&quot;, &quot;forward&quot;], optional
+        direction to map the dataframes to the shared time index, by default &quot;nearest&quot;
+
+    Returns
+    -------
+    pd.DataFrame
+        dataframe with shared time index, columns of all dataframes and `original_time_{name}`, `source_{name}` columns
+
+    Raises
+    ------
+    ValueError
+        if the same column is present in several dataframes
+    """
+    return _align_to_shared_index(dfs, shared_time_index, direction)
+
+
 def map_df_to_shared_index(
     df: pd.Series | pd.DataFrame,
     shared_time_index: pd.DatetimeIndex | pd.DataFrame | pd.Series,
@@ -304,44 +911,7 @@ def map_df_to_shared_index(
     TypeError
         if `df` is not pd.Series or pd.DataFrame
     """
-    if isinstance(shared_time_index, (pd.DatetimeIndex, pd.Series)):
-        shared_time_index = pd.DataFrame(index=shared_time_index)
-        shared_time_index.index.name = "timestamp"
-    else:
-        if not isinstance(shared_time_index, pd.DataFrame):
-            raise TypeError(
-                f"`shared_time_index` should be pd.DatetimeIndex, pd.Series or pd.DataFrame, but got `{type(shared_time_index)}`"
-            )
-    if isinstance(df, pd.Series):
-        df = df.to_frame()
-    else:
-        if not isinstance(df, pd.DataFrame):
-            raise TypeError(
-                f"`df` should be pd.Series or pd.DataFrame, but got {type(df)}"
-            )
-        df = df.copy()
-    original_time_str = (
-        "original_time" if column_suffix is None else f"original_time_{column_suffix}"
-    )
-    source_str = "source" if column_suffix is None else f"source_{column_suffix}"
-    df[original_time_str] = df.index.to_series()
-
-    result_df = pd.merge_asof(
-        shared_time_index,
-        right=df,
-        left_index=True,
-        right_index=True,
-        tolerance=pd.Timedelta(shared_time_index.index.freq / 2),
-        direction=direction,
-    )
-    # add interpolation status
-    interpolation_slice = slice(
-        result_df[original_time_str].min(), result_df[original_time_str].max()
-    )
-    result_df.loc[interpolation_slice, source_str] = "interpolated"
-    result_df.loc[result_df[original_time_str].notna(), source_str] = "original"
-    result_df.loc[result_df[source_str].isna(), source_str] = "extrapolated"
-    return result_df
+    return _align_to_shared_index({column_suffix: df}, shared_time_index, direction)
 
 
 def interpolate_inner(
@@ -374,7 +944,16 @@ def interpolate_inner(
     return df
 
 
-def get_path_from_gps(pd_gps: pd.DataFrame, shared_time_index) -> gpd.GeoDataFrame:
+GPS_COORDINATE_COLUMNS = ["lon", "lat", "altitude"]
+GPS_PATH_COLUMNS = ["path", *GPS_COORDINATE_COLUMNS]
+
+
+def get_path_from_gps(
+    pd_gps: pd.DataFrame,
+    shared_time_index,
+    distance_method: Literal["wgs84", "haversine"] = "wgs84",
+    geometry: bool = True,
+) -> gpd.GeoDataFrame | pd.DataFrame:
     """Convert GPS data to a GeoDataFrame with a shared time index,
     also computes the cumulative distance - `path` for each GPS data point and `path_progress` (from 0 to 1)
 
@@ -384,39 +963,94 @@ def get_path_from_gps(pd_gps: pd.DataFrame, shared_time_index) -> gpd.GeoDataFra
         dataframe with GPS data, must have a DatetimeIndex
     shared_time_index : pd.DatetimeIndex
         shared time index to map the dataframe to
+    distance_method : Literal["wgs84", "haversine"], optional
+        how to compute distances between GPS points, see `get_path_distances`, by default "wgs84"
+    geometry : bool, optional
+        whether to convert coordinates to a `gps` geometry column, otherwise `lon`, `lat` and `altitude`
+        are kept as float columns and geometry may be built later with `get_gps_geometry`, by default True
 
     Returns
     -------
-    gpd.GeoDataFrame
+    gpd.GeoDataFrame | pd.DataFrame
         GeoDataFrame with shared time index and `path` and `path_progress` columns,
-        lon, lat and altitude columns are interpolated to the shared time index and converted to a geometry column
+        lon, lat and altitude columns are interpolated to the shared time index and converted to a geometry column,
+        DataFrame with `lon`, `lat` and `altitude` columns if `geometry` is False
     """
-    # Compute distance and cumulative distance for each GPS data point
-    pd_gps["dist_delta"] = _get_dist(pd_gps).astype(pd.Float32Dtype)
-    pd_gps["dist_delta"].fillna(0, inplace=True)
-    pd_gps["path"] = pd_gps["dist_delta"].cumsum()
-
+    _add_path_to_gps(pd_gps, distance_method)
     # Interpolate the GPS time and total distance data
     mapped_gps = map_df_to_shared_index(
-        pd_gps[["path", "lon", "lat", "altitude"]],
+        pd_gps[GPS_PATH_COLUMNS],
         shared_time_index,
         column_suffix="gps",
     )
+    return _interpolate_gps_path(mapped_gps, geometry=geometry)
+
+
+def _add_path_to_gps(
+    pd_gps: pd.DataFrame, distance_method: Literal["wgs84", "haversine"] = "wgs84"
+) -> pd.DataFrame:
+    # Compute distance and cumulative distance for each GPS data point
+    path, dist_delta = get_path_distances(
+        pd_gps["lon"].to_numpy(), pd_gps["lat"].to_numpy(), method=distance_method
+    )
+    pd_gps["dist_delta"] = dist_delta
+    pd_gps["path"] = path
+    return pd_gps
+
+
+def _interpolate_gps_path(
+    mapped_gps: pd.DataFrame, geometry: bool = True
+) -> gpd.GeoDataFrame | pd.DataFrame:
     interpolate_inner(mapped_gps, "path", "linear", "both")
     interpolate_inner(mapped_gps, "lon", "linear", "both")
     interpolate_inner(mapped_gps, "lat", "linear", "both")
     interpolate_inner(mapped_gps, "altitude", "linear", "both")
+    # coordinates take the place of the geometry column
+    coordinates = mapped_gps[GPS_COORDINATE_COLUMNS]
+    mapped_gps.drop(columns=GPS_COORDINATE_COLUMNS, inplace=True)
+    mapped_gps[GPS_COORDINATE_COLUMNS] = coordinates
+    mapped_gps["path_progress"] = mapped_gps["path"] / mapped_gps["path"].max()
+    if geometry:
+        return get_gps_geometry(mapped_gps)
+    return mapped_gps
+
+
+def get_gps_geometry(df: pd.DataFrame) -> gpd.GeoDataFrame:
+    """Build the `gps` geometry column from `lon`, `lat` and `altitude` columns,
+    e.g. to export a dataframe created with `geometry=False`
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        dataframe with `lon`, `lat` and optional `altitude` columns
+
+    Returns
+    -------
+    gpd.GeoDataFrame
+        GeoDataFrame with `gps` geometry column in place of the coordinate columns
+    """
+    if isinstance(df, gpd.GeoDataFrame) and "gps" in df.columns:
+        return df
+    df = df.copy()
+    position = df.columns.get_loc("lon")
     # TODO[High](Buggy): check crs
-    mapped_gps["gps"] = gpd.points_from_xy(
-        mapped_gps["lon"], mapped_gps["lat"], mapped_gps["altitude"], crs="EPSG:4326"
+    points = gpd.points_from_xy(
+        df["lon"], df["lat"], df["altitude"] if "altitude" in df else None, crs="EPSG:4326"
     )
-    mapped_gps.drop(columns=["lon", "lat", "altitude"], inplace=True)
-    mapped_gps["path_progress"] = mapped_gps["path"] / mapped_gps["path"].max()
-    return gpd.GeoDataFrame(mapped_gps, geometry="gps")
+    df.drop(columns=[c for c in GPS_COORDINATE_COLUMNS if c in df], inplace=True)
+    df.insert(position, "gps", points)
+    return gpd.GeoDataFrame(df, geometry="gps")
 
-# %% ../../../nbs/core/05_road_quality.ipynb 22
+# %% ../../../nbs/core/05_road_quality.ipynb 37
 def get_shared_index_for_sensor_data(
-    pd_gps: pd.DataFrame, pd_timestamps: pd.DataFrame, pd_motion: pd.DataFrame
+    pd_gps: pd.DataFrame,
+    pd_timestamps: pd.DataFrame,
+    pd_motion: pd.DataFrame,
+    distance_method: Literal["wgs84", "haversine"] = "wgs84",
+    geometry: bool = True,
+    use_cache: bool = False,
+    dtypes: DtypePolicy | None = None,
+    profiler: StageProfiler | None = None,
 ) -> pd.DataFrame:
     """Get a shared index for all sensor data, including GPS, timestamps and motion data.
     All the dataframes will be interpolated to the shared index with frequency of the motion data (10ms).
@@ -429,6 +1063,7 @@ def get_shared_index_for_sensor_data(
     - `path` - cumulative distance from the start of the path
     - `path_progress` - cumulative distance from the start of the path normalized to [0, 1]
     - `frame_number` - frame number from the camera timestamps
+    - `gps` - point geometry, or `lon`, `lat` and `altitude` columns if `geometry` is False
 
     Parameters
     ----------
@@ -438,28 +1073,184 @@ def get_shared_index_for_sensor_data(
         original timestamps dataframe
     pd_motion : pd.DataFrame
         original motion dataframe
+    distance_method : Literal["wgs84", "haversine"], optional
+        how to compute distances between GPS points, see `get_path_distances`, by default "wgs84"
+    geometry : bool, optional
+        whether to build a point per row, see `get_path_from_gps`, by default True
+    use_cache : bool, optional
+        whether to read and write the shared index cached next to the motion file,
+        only for dataframes which know their source files, e.g. from `read_recslam_sensor_data_standard`,
+        outdated caches of the same motion file are removed, by default False
+    dtypes : DtypePolicy | None, optional
+        dtypes of columns, applied after reading or writing the cache, by default DEFAULT_DTYPE_POLICY
+    profiler : StageProfiler | None, optional
+        profiler to record stages to, see `StageProfiler`, by default None
 
     Returns
     -------
     pd.DataFrame
         shared index dataframe
     """
+    dtypes = dtypes or DEFAULT_DTYPE_POLICY
+    cache_path = None
+    if use_cache:
+        # only the index of motion data and the columns read below make the shared index
+        cache_path = _get_shared_index_cache_path(
+            [(pd_gps, GPS_COORDINATE_COLUMNS), (pd_timestamps, ["frame_number"]), (pd_motion, [])],
+            distance_method=distance_method,
+            geometry=geometry,
+        )
+    if cache_path is not None:
+        with profile_stage(profiler, "read_shared_index_cache") as record:
+            shared_index = read_shared_index_cache(cache_path)
+            record.rows_out = None if shared_index is None else len(shared_index)
+        if shared_index is not None:
+            with profile_stage(profiler, "apply_dtypes", rows_in=len(shared_index)) as record:
+                shared_index = dtypes.apply(shared_index)
+                record.rows_out = len(shared_index)
+            return shared_index
     # get shared timestamps index, which is the intersection of all timestamps with the smallest delta
-    shared_time_index = get_shared_time_index([pd_timestamps, pd_gps, pd_motion])
-    # map timestamps to shared index
-    shared_index_frames = map_df_to_shared_index(
-        pd_timestamps["frame_number"], shared_time_index, column_suffix="frames"
+    with profile_stage(
+        profiler, "get_shared_time_index", rows_in=len(pd_timestamps) + len(pd_gps) + len(pd_motion)
+    ) as record:
+        shared_time_index = get_shared_time_index([pd_timestamps, pd_gps, pd_motion])
+        record.rows_out = len(shared_time_index)
+    # map timestamps and gps to shared index at once
+    with profile_stage(profiler, "get_path_from_gps", rows_in=len(pd_gps)) as record:
+        _add_path_to_gps(pd_gps, distance_method)
+        record.rows_out = len(pd_gps)
+    # frame numbers are interpolated as floats, integers are restored by the dtype policy
+    frame_number = pd.Series(
+        pd_timestamps["frame_number"].to_numpy(dtype=np.float64, na_value=np.nan),
+        index=pd_timestamps.index,
+        name="frame_number",
     )
-    # map gps to shared index
-    shared_index_gps = get_path_from_gps(pd_gps, shared_time_index)
-    # compose shared index from frames and gps
-    shared_index = shared_index_frames.merge(
-        shared_index_gps, left_index=True, right_index=True
+    with profile_stage(profiler, "map_dfs_to_shared_index", rows_in=len(frame_number) + len(pd_gps)) as record:
+        shared_index = map_dfs_to_shared_index(
+            {
+                "frames": frame_number,
+                "gps": pd_gps[GPS_PATH_COLUMNS],
+            },
+            shared_time_index,
+        )
+        record.rows_out = len(shared_index)
+    with profile_stage(profiler, "interpolate_gps_path", rows_in=len(shared_index)) as record:
+        shared_index = _interpolate_gps_path(shared_index, geometry=geometry)
+        record.rows_out = len(shared_index)
+    with profile_stage(profiler, "interpolate_frame_number", rows_in=len(shared_index)) as record:
+        shared_index = interpolate_inner(shared_index, "frame_number", "nearest", "both")
+        record.rows_out = len(shared_index)
+    if cache_path is not None:
+        with profile_stage(profiler, "write_shared_index_cache", rows_in=len(shared_index)):
+            write_shared_index_cache(shared_index, cache_path)
+    with profile_stage(profiler, "apply_dtypes", rows_in=len(shared_index)) as record:
+        shared_index = dtypes.apply(shared_index)
+        record.rows_out = len(shared_index)
+    return shared_index
+
+# %% ../../../nbs/core/05_road_quality.ipynb 41
+SHARED_INDEX_CACHE_VERSION = 1
+
+
+def _get_content_digest(df: pd.DataFrame, columns: list[str]) -> str:
+    # attrs survive edits of the dataframe in memory, so the data itself is a part of the key
+    hashes = pd.util.hash_pandas_object(df[columns], index=True)
+    return hashlib.sha1(hashes.to_numpy().tobytes()).hexdigest()
+
+
+def _get_shared_index_cache_path(
+    dataframes: list[tuple[pd.DataFrame, list[str]]], **params
+) -> Path | None:
+    sources = []
+    for df, columns in dataframes:
+        source_path = df.attrs.get("source_path")
+        if source_path is None or not Path(source_path).exists():
+            return None
+        sources.append(
+            {
+                "path": str(Path(source_path).resolve()),
+                **_get_source_fingerprint(Path(source_path)),
+                "content": _get_content_digest(df, columns),
+            }
+        )
+    params_digest, sources_digest = (
+        hashlib.sha1(json.dumps(value, sort_keys=True).encode()).hexdigest()[:length]
+        for value, length in [
+            ({"version": SHARED_INDEX_CACHE_VERSION, **params}, 8),
+            (sources, 16),
+        ]
     )
-    shared_index = interpolate_inner(shared_index, "frame_number", "nearest", "both")
-    return gpd.GeoDataFrame(shared_index, geometry="gps")
+    # the cache is stored next to the motion data, the last of the dataframes
+    motion_path = Path(sources[-1]["path"])
+    return motion_path.with_name(
+        f"{motion_path.name}.shared_index.{params_digest}.{sources_digest}.parquet"
+    )
+
+
+def read_shared_index_cache(cache_path: PathLike) -> pd.DataFrame | None:
+    """Reads a shared index written by `write_shared_index_cache`
+
+    Parameters
+    ----------
+    cache_path : PathLike
+        path to the parquet file
+
+    Returns
+    -------
+    pd.DataFrame | None
+        shared index, GeoDataFrame if it has geometry, or None if the cache does not exist
+    """
+    cache_path = pathify(cache_path)
+    if not cache_path.exists():
+        return None
+    logger.debug(f"Reading cached shared index from `{cache_path}`")
+    if b"geo" in (pq.read_schema(cache_path).metadata or {}):
+        shared_index = gpd.read_parquet(cache_path)
+        # points with missing coordinates are stored as empty points, a fresh shared index keeps NaN points
+        empty = shared_index.geometry.is_empty.to_numpy()
+        if empty.any():
+            shared_index.loc[empty, shared_index.geometry.name] = shapely.points(np.full((empty.sum(), 3), np.nan))
+    else:
+        shared_index = pd.read_parquet(cache_path)
+    # parquet does not keep the frequency of the index, which is used to map data to it
+    shared_index.index = pd.DatetimeIndex(shared_index.index, freq="infer")
+    return shared_index
 
-# %% ../../../nbs/core/05_road_quality.ipynb 33
+
+def write_shared_index_cache(
+    shared_index: pd.DataFrame, cache_path: PathLike
+) -> Path | None:
+    """Writes a shared index to parquet, GeoParquet if it has geometry,
+    and removes outdated caches of the same motion file with the same parameters
+
+    Parameters
+    ----------
+    shared_index : pd.DataFrame
+        shared index from `get_shared_index_for_sensor_data`
+    cache_path : PathLike
+        path to the parquet file
+
+    Returns
+    -------
+    Path | None
+        path to the cache or None if the cache could not be written
+    """
+    cache_path = pathify(cache_path)
+    try:
+        with atomic_path(cache_path) as tmp_path:
+            shared_index.to_parquet(tmp_path)
+    except OSError as e:
+        logger.warning(f"Could not write cache `{cache_path}`: {e}")
+        return None
+    # `<motion file>.shared_index.<params digest>.<sources digest>.parquet`
+    prefix = cache_path.name.rsplit(".", 2)[0]
+    for outdated_path in cache_path.parent.glob(f"{prefix}.*.parquet"):
+        if outdated_path != cache_path:
+            outdated_path.unlink(missing_ok=True)
+    return cache_path
+
+
+# %% ../../../nbs/core/05_road_quality.ipynb 53
 def get_road_qaulity_agg_func(
     shared_index: pd.DataFrame,
     index: Literal[
@@ -527,7 +1318,214 @@ def change_index(shared_index_df: pd.DataFrame, new_index: str, agg_func=None):
         shared_index_df = shared_index_df.groupby(new_index).agg(agg_func)
     return shared_index_df
 
-# %% ../../../nbs/core/05_road_quality.ipynb 37
+# %% ../../../nbs/core/05_road_quality.ipynb 55
+ROAD_QUALITY_AGG_KERNELS = {
+    "frame_number": "median",
+    "timestamp": "mean",
+    "path": "mean",
+    "gps": "centroid",
+    "lon": "mean",
+    "lat": "mean",
+    "altitude": "mean",
+    "path_progress": "mean",
+    "accel_x": "max_abs",
+    "section_number": "median",
+    "rms": "mean",
+    "iri": "mean",
+    "rolling_accel_x": "mean",
+    "ride_quality": "mean",
+    "anomalies": "max",
+    "bump": "any",
+}
+
+
+def _get_agg_kernel_name(column: str) -> str:
+    if column.startswith("original_time_"):
+        return "mean"
+    if column.startswith("source_"):
+        return "source"
+    return ROAD_QUALITY_AGG_KERNELS[column]
+
+
+def _segment_float_values(series: pd.Series) -> tuple[np.ndarray, Any]:
+    # returns float values and a function to restore the original dtype
+    if pd.api.types.is_datetime64_any_dtype(series):
+        ns = series.to_numpy(dtype="datetime64[ns]").view(np.int64)
+        valid = ~series.isna().to_numpy()
+        # offsets from the minimum are exactly representable as float64
+        origin = ns[valid].min() if valid.any() else 0
+        values = np.where(valid, ns - origin, np.nan).astype(np.float64)
+
+        def restore(x):
+            return pd.DatetimeIndex(
+                np.where(np.isnan(x), np.iinfo(np.int64).min, np.round(x) + origin)
+                .astype(np.int64)
+                .view("datetime64[ns]")
+            )
+
+        return values, restore
+    if isinstance(series.dtype, pd.api.extensions.ExtensionDtype) and not isinstance(
+        series.dtype, pd.CategoricalDtype
+    ):
+        return series.to_numpy(dtype=np.float64, na_value=np.nan), lambda x: pd.array(
+            x, dtype="Float64"
+        )
+    return series.to_numpy(dtype=np.float64), lambda x: x
+
+
+def _segment_mean(values, codes, starts, n_groups):
+    valid = ~np.isnan(values)
+    sums = np.bincount(codes, weights=np.where(valid, values, 0), minlength=n_groups)
+    counts = np.bincount(codes, weights=valid, minlength=n_groups)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return sums / counts
+
+
+def _segment_median(values, codes, starts, n_groups):
+    # NaNs are sorted to the end of each segment
+    order = np.lexsort((values, codes))
+    values = values[order]
+    counts = np.bincount(codes, weights=~np.isnan(values), minlength=n_groups).astype(
+        np.int64
+    )
+    lo = starts + np.maximum(counts - 1, 0) // 2
+    hi = starts + counts // 2
+    return np.where(counts > 0, (values[lo] + values[hi]) / 2, np.nan)
+
+
+def _segment_max(values, codes, starts, n_groups):
+    return np.fmax.reduceat(values, starts)
+
+
+def _segment_max_abs(values, codes, starts, n_groups):
+    # as `x.iloc[x.abs().argmax()]`, a NaN in a segment wins
+    abs_values = np.abs(values)
+    max_abs = np.maximum.reduceat(abs_values, starts)
+    positions = np.where(
+        abs_values == max_abs[codes], np.arange(len(values)), len(values) - 1
+    )
+    first = np.minimum.reduceat(positions, starts)
+    return np.where(np.isnan(max_abs), np.nan, values[first])
+
+
+_NUMERIC_SEGMENT_KERNELS = {
+    "mean": _segment_mean,
+    "median": _segment_median,
+    "max": _segment_max,
+    "max_abs": _segment_max_abs,
+}
+
+
+def _segment_any(series: pd.Series, codes, starts, n_groups):
+    values = series.notna().to_numpy() & series.fillna(False).to_numpy(dtype=bool)
+    return np.logical_or.reduceat(values, starts)
+
+
+def _segment_source(series: pd.Series, codes, starts, n_groups):
+    # "original" if any point in the segment is original, otherwise the most frequent value
+    categories, value_codes = np.unique(
+        series.astype(object).fillna("").to_numpy(dtype=str), return_inverse=True
+    )
+    counts = np.bincount(
+        codes * len(categories) + value_codes, minlength=n_groups * len(categories)
+    ).reshape(n_groups, len(categories))
+    if categories[0] == "":
+        counts[:, 0] = 0
+    result = categories[counts.argmax(axis=1)].astype(object)
+    if "original" in categories:
+        result[counts[:, np.searchsorted(categories, "original")] > 0] = "original"
+    result[counts.sum(axis=1) == 0] = np.nan
+    return result
+
+
+def _segment_centroid(series: pd.Series, codes, starts, n_groups):
+    # centroid of the union of points, i.e. the mean of unique points ignoring missing ones
+    geometry = gpd.GeoSeries(series)
+    x, y = geometry.x.to_numpy(), geometry.y.to_numpy()
+    valid = ~(np.isnan(x) | np.isnan(y))
+    order = np.lexsort((y, x, codes))
+    x, y, valid, sorted_codes = x[order], y[order], valid[order], codes[order]
+    unique = valid & np.r_[
+        True,
+        (sorted_codes[1:] != sorted_codes[:-1]) | (x[1:] != x[:-1]) | (y[1:] != y[:-1]),
+    ]
+    counts = np.bincount(sorted_codes, weights=unique, minlength=n_groups)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        centroid_x = np.bincount(sorted_codes, weights=np.where(unique, x, 0), minlength=n_groups) / counts
+        centroid_y = np.bincount(sorted_codes, weights=np.where(unique, y, 0), minlength=n_groups) / counts
+    points = gpd.points_from_xy(centroid_x, centroid_y, crs=geometry.crs)
+    points[counts == 0] = None
+    return points
+
+
+def aggregate_road_quality(
+    road_quality_df: pd.DataFrame,
+    new_index: Literal["timestamp", "path_progress", "frame_number"] = "frame_number",
+    geometry: bool = False,
+) -> pd.DataFrame:
+    """Vectorized equivalent of `change_index(df, new_index, get_road_qaulity_agg_func(df, new_index))`
+
+    Rows are sorted by the new index once and every column is reduced over the sorted segments with numpy kernels
+    (see `ROAD_QUALITY_AGG_KERNELS`), source columns keep `original` if any of the aggregated points is original.
+    Missing points are ignored when computing the centroid of `gps`, plain `lon`, `lat` and `altitude` columns are averaged.
+
+    Parameters
+    ----------
+    road_quality_df : pd.DataFrame
+        shared index or road quality dataframe, e.g. from `road_quality_from_sensor_data`
+    new_index : Literal["timestamp", "path_progress", "frame_number"], optional
+        column to aggregate on, by default "frame_number"
+    geometry : bool, optional
+        whether to build `gps` points from the aggregated `lon`, `lat` and `altitude` columns,
+        i.e. a centroid per aggregated row, see `get_gps_geometry`, by default False
+
+    Returns
+    -------
+    pd.DataFrame
+        aggregated dataframe indexed by unique values of `new_index`, rows with missing `new_index` are dropped
+    """
+    if road_quality_df.index.name == new_index:
+        return road_quality_df
+    assert new_index in road_quality_df.columns, f"Index {new_index} is not in columns"
+    road_quality_df = road_quality_df.reset_index(names=[road_quality_df.index.name])
+    keys = road_quality_df[new_index]
+    road_quality_df = road_quality_df.loc[keys.notna().to_numpy()]
+    keys_dtype = road_quality_df[new_index].dtype
+    # nullable integer keys, e.g. frame numbers, have no missing values at this point
+    keys = road_quality_df[new_index].to_numpy(dtype=getattr(keys_dtype, "numpy_dtype", None))
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    boundaries = np.r_[True, sorted_keys[1:] != sorted_keys[:-1]]
+    starts = np.flatnonzero(boundaries)
+    codes = np.cumsum(boundaries) - 1
+    n_groups = len(starts)
+
+    aggregated = {}
+    for column in road_quality_df.columns:
+        if column == new_index:
+            continue
+        kernel_name = _get_agg_kernel_name(column)
+        series = road_quality_df[column].iloc[order]
+        if kernel_name in _NUMERIC_SEGMENT_KERNELS:
+            values, restore = _segment_float_values(series)
+            aggregated[column] = restore(
+                _NUMERIC_SEGMENT_KERNELS[kernel_name](values, codes, starts, n_groups)
+            )
+        elif kernel_name == "any":
+            aggregated[column] = _segment_any(series, codes, starts, n_groups)
+        elif kernel_name == "source":
+            aggregated[column] = _segment_source(series, codes, starts, n_groups)
+        elif kernel_name == "centroid":
+            aggregated[column] = _segment_centroid(series, codes, starts, n_groups)
+        else:
+            raise ValueError(f"Unknown aggregation kernel `{kernel_name}`")
+    index = pd.Index(sorted_keys[starts], name=new_index, dtype=keys_dtype)
+    aggregated = pd.DataFrame(aggregated, index=index)
+    if geometry and "lon" in aggregated.columns:
+        return get_gps_geometry(aggregated)
+    return aggregated
+
+# %% ../../../nbs/core/05_road_quality.ipynb 60
 class RideQuality(Enum):
     POOR = 1
     BAD = 2
@@ -546,6 +1544,43 @@ def get_ride_quality(iri):
         return RideQuality.POOR.value
 
 
+RIDE_QUALITY_THRESHOLDS = (4, 8, 12)
+
+
+def classify_ride_quality(
+    iri: pd.Series | np.ndarray,
+    thresholds: tuple[float, ...] = RIDE_QUALITY_THRESHOLDS,
+) -> pd.Series:
+    """Vectorized version of `get_ride_quality` for a whole column of IRI values
+
+    Parameters
+    ----------
+    iri : pd.Series | np.ndarray
+        IRI values, NaN values are kept as missing
+    thresholds : tuple[float, ...], optional
+        increasing IRI thresholds between `GOOD`, `FAIR`, `BAD` and `POOR` ride quality,
+        a value equal to a threshold falls into the worse class, by default RIDE_QUALITY_THRESHOLDS
+
+    Returns
+    -------
+    pd.Series
+        `RideQuality` values as a nullable `Int8` series, indexed as the input series
+    """
+    assert len(thresholds) == len(RideQuality) - 1, (
+        f"Expected {len(RideQuality) - 1} thresholds, but got {len(thresholds)}"
+    )
+    values = np.asarray(iri, dtype=np.float64)
+    ride_quality = RideQuality.GOOD.value - np.digitize(values, thresholds)
+    ride_quality = pd.arrays.IntegerArray(
+        ride_quality.astype(np.int8), mask=np.isnan(values)
+    )
+    return pd.Series(
+        ride_quality,
+        index=iri.index if isinstance(iri, pd.Series) else None,
+        name="ride_quality",
+    )
+
+
 def _split_path_on_sections(path: pd.Series, section_len=100):
     return (path[path < path.max()] // section_len).astype(int)
 
@@ -560,14 +1595,158 @@ def split_imu_on_sections(
     return pd_motion
 
 
-def calculate_rms_on_sections(pd_motion_with_sections: pd.DataFrame):
-    return pd_motion_with_sections.groupby("section_number", dropna=True).agg(
-        rms=pd.NamedAgg(
-            column="accel_x", aggfunc=lambda x: np.sqrt(np.mean(np.square(g * x)))
+IMU_COLUMNS = ["accel_x", "accel_y", "accel_z", "rrate_x", "rrate_y", "rrate_z"]
+SECTION_SUMS = ["count", "sum", "sum_sq", "max_abs"]
+SECTION_STATISTICS = ["count", "mean", "rms", "max_abs"]
+
+
+def calculate_section_sums(
+    pd_motion_with_sections: pd.DataFrame,
+    columns: list[str] | None = None,
+) -> pd.DataFrame:
+    """Mergeable sums of any number of channels per road section in a single vectorized pass
+
+    Section numbers are factorized into integer codes, rows are sorted by them only if they are not sorted yet
+    (motion data is sorted by path, hence by section) and every sum of all channels is reduced
+    over the segments of codes at once with `np.add.reduceat` / `np.fmax.reduceat`.
+    Missing values are ignored, rows without a section are dropped.
+
+    Sums of several sections (or of the same section in several parts) are merged by adding `count`, `sum`
+    and `sum_sq` and taking the maximum of `max_abs`.
+
+    Parameters
+    ----------
+    pd_motion_with_sections : pd.DataFrame
+        motion data with `section_number` column, e.g. from `split_imu_on_sections`
+    columns : list[str] | None, optional
+        channels to sum, by default columns of `IMU_COLUMNS` present in the dataframe
+
+    Returns
+    -------
+    pd.DataFrame
+        wide dataframe indexed by `section_number` with `<column>_<sum>` columns for `SECTION_SUMS`: `count` of
+        non-missing values, `sum`, `sum_sq` (sum of squares) and `max_abs` (maximum absolute value)
+    """
+    if columns is None:
+        columns = [c for c in IMU_COLUMNS if c in pd_motion_with_sections.columns]
+    codes, section_numbers = pd.factorize(pd_motion_with_sections["section_number"], sort=True)
+    in_section = codes >= 0
+    codes = codes[in_section]
+    values = pd_motion_with_sections[columns].to_numpy(dtype=np.float64, na_value=np.nan)[in_section]
+    if np.any(codes[1:] < codes[:-1]):
+        order = np.argsort(codes, kind="stable")
+        codes, values = codes[order], values[order]
+
+    index = pd.Index(section_numbers, name="section_number")
+    if len(index) == 0:
+        return pd.DataFrame(
+            {
+                f"{c}_{s}": pd.Series(dtype=np.int64 if s == "count" else np.float64)
+                for c in columns
+                for s in SECTION_SUMS
+            },
+            index=index,
         )
+    # every code is present after factorization, so segments are never empty
+    starts = np.searchsorted(codes, np.arange(len(section_numbers)))
+    valid = ~np.isnan(values)
+    filled = np.where(valid, values, 0.0)
+    sums = {
+        "count": np.add.reduceat(valid.astype(np.int64), starts, axis=0),
+        "sum": np.add.reduceat(filled, starts, axis=0),
+        "sum_sq": np.add.reduceat(filled * filled, starts, axis=0),
+        "max_abs": np.fmax.reduceat(np.abs(values), starts, axis=0),
+    }
+    return pd.DataFrame(
+        {f"{c}_{s}": sums[s][:, i] for i, c in enumerate(columns) for s in SECTION_SUMS},
+        index=index,
     )
 
 
+def get_section_statistics(
+    section_sums: pd.DataFrame,
+    columns: list[str],
+    statistics: Iterable[str] = SECTION_STATISTICS,
+) -> pd.DataFrame:
+    """Statistics of channels from their section sums, see `calculate_section_sums`
+
+    Parameters
+    ----------
+    section_sums : pd.DataFrame
+        sums from `calculate_section_sums` or merged sums
+    columns : list[str]
+        channels to compute statistics of
+    statistics : Iterable[str], optional
+        statistics from `SECTION_STATISTICS`, by default all of them
+
+    Returns
+    -------
+    pd.DataFrame
+        wide dataframe with the index of `section_sums` and `<column>_<statistic>` columns
+
+    Raises
+    ------
+    ValueError
+        if an unknown statistic is requested
+    """
+    statistics = list(statistics)
+    unknown = [s for s in statistics if s not in SECTION_STATISTICS]
+    if unknown:
+        raise ValueError(f"Unknown statistics {unknown}, expected some of {SECTION_STATISTICS}")
+    result = {}
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for c in columns:
+            count = section_sums[f"{c}_count"].to_numpy()
+            derived = {
+                "count": count,
+                "mean": section_sums[f"{c}_sum"].to_numpy() / count,
+                "rms": np.sqrt(section_sums[f"{c}_sum_sq"].to_numpy() / count),
+                "max_abs": section_sums[f"{c}_max_abs"].to_numpy(),
+            }
+            for s in statistics:
+                result[f"{c}_{s}"] = derived[s]
+    return pd.DataFrame(result, index=section_sums.index)
+
+
+def calculate_section_statistics(
+    pd_motion_with_sections: pd.DataFrame,
+    columns: list[str] | None = None,
+    statistics: Iterable[str] = SECTION_STATISTICS,
+) -> pd.DataFrame:
+    """Statistics of any number of channels per road section in a single vectorized pass,
+    see `calculate_section_sums` and `get_section_statistics`
+
+    Parameters
+    ----------
+    pd_motion_with_sections : pd.DataFrame
+        motion data with `section_number` column, e.g. from `split_imu_on_sections`
+    columns : list[str] | None, optional
+        channels to compute statistics of, by default columns of `IMU_COLUMNS` present in the dataframe
+    statistics : Iterable[str], optional
+        statistics to compute from `SECTION_STATISTICS`: `count` of non-missing values, `mean`,
+        `rms` (root mean square) and `max_abs` (maximum absolute value), by default all of them
+
+    Returns
+    -------
+    pd.DataFrame
+        wide dataframe indexed by `section_number` with `<column>_<statistic>` columns
+
+    Raises
+    ------
+    ValueError
+        if an unknown statistic is requested
+    """
+    if columns is None:
+        columns = [c for c in IMU_COLUMNS if c in pd_motion_with_sections.columns]
+    section_sums = calculate_section_sums(pd_motion_with_sections, columns)
+    return get_section_statistics(section_sums, columns, statistics)
+
+
+def calculate_rms_on_sections(pd_motion_with_sections: pd.DataFrame):
+    section_statistics = calculate_section_statistics(pd_motion_with_sections, ["accel_x"], ["rms"])
+    return (g * section_statistics["accel_x_rms"]).rename("rms").to_frame()
+
+
 def calculate_iri(rms: pd.DataFrame):
     iri = 4.19 * rms + 1.73
     return iri
@@ -584,134 +1763,580 @@ def find_bumps(pd_motion, window_size=45, height=0.8):
     return bumps_df
 
 
-def calculate_road_quality(shared_index: pd.DataFrame, pd_motion: pd.DataFrame):
+def _calculate_road_quality_on_windows(
+    shared_index: pd.DataFrame,
+    motion_windows: Iterable[pd.DataFrame],
+    window_size: int = 45,
+    height: float = 0.3,
+) -> pd.DataFrame:
+    # sections are defined by the whole path, so they are computed once on the shared index
+    section_numbers = _split_path_on_sections(shared_index["path"])
+    timestamps = shared_index.index
+    bump_columns = ["rolling_accel_x", "anomalies", "bump"]
+    road_quality_chunks, section_stats = [], []
+    tail: pd.Series | None = None
+    start = 0
+    motion_windows = iter(motion_windows)
+    window = next(motion_windows, None)
+    while window is not None:
+        next_window = next(motion_windows, None)
+        accel = window["accel_x"] if tail is None else pd.concat([tail, window["accel_x"]])
+        if next_window is not None and len(accel) < 2:
+            tail, window = accel, next_window
+            continue
+        # the last sample is not confirmed as a peak (or not) until the next window,
+        # therefore only rows which can not be mapped to it are processed now
+        stop = (
+            len(timestamps)
+            if next_window is None
+            else timestamps.searchsorted(accel.index[-2], side="right")
+        )
+        bumps_df = find_bumps(accel.to_frame(), window_size=window_size, height=height)
+        chunk = split_imu_on_sections(accel, shared_index.iloc[start:stop])
+        # a window may add no rows, an empty frame would take the whole index of the assigned series
+        chunk["section_number"] = section_numbers.reindex(chunk.index)
+        chunk = chunk.merge(
+            bumps_df, left_on="original_time_imu", right_index=True, how="left"
+        )
+        squares = (g * chunk["accel_x"]) ** 2
+        section_stats.append(
+            squares.groupby(chunk["section_number"]).agg(["sum", "count"])
+        )
+        road_quality_chunks.append(chunk)
+        # keep enough history for the rolling mean and peak detection: the first row processed
+        # with the next window (the last but one here) and its left neighbour need a full rolling window
+        tail = accel.iloc[-(window_size + 2) :]
+        start = stop
+        window = next_window
+
+    road_quality_data = pd.concat(road_quality_chunks)
+    # sources are relative to the whole ride, not to a single window
+    columns = road_quality_data.columns
+    road_quality_data.drop(columns=["source_imu"], inplace=True)
+    _set_source_status(road_quality_data, "original_time_imu", "source_imu")
+    road_quality_data = road_quality_data[columns]
+
+    section_stats = pd.concat(section_stats).groupby(level=0).sum()
+    rms = np.sqrt(section_stats["sum"] / section_stats["count"]).rename("rms")
+    road_quality_data = road_quality_data.merge(
+        rms, left_on="section_number", right_index=True, how="left"
+    )
+    road_quality_data["iri"] = calculate_iri(road_quality_data["rms"])
+    road_quality_data["ride_quality"] = classify_ride_quality(road_quality_data["iri"])
+    return road_quality_data[
+        [c for c in road_quality_data.columns if c not in bump_columns] + bump_columns
+    ]
+
+
+def calculate_road_quality(
+    shared_index: pd.DataFrame,
+    pd_motion: pd.DataFrame | Iterable[pd.DataFrame],
+    dtypes: DtypePolicy | None = None,
+    profiler: StageProfiler | None = None,
+):
     """Calculate road quality from motion data and maps them to shared index
 
     Parameters
     ----------
     shared_index : pd.DataFrame
         shared index dataframe
-    pd_motion : pd.DataFrame
-        original motion dataframe
+    pd_motion : pd.DataFrame | Iterable[pd.DataFrame]
+        original motion dataframe or an iterable of consecutive motion windows, e.g. from `read_recslam_motion_windows`,
+        in the latter case the motion data is processed window by window and the whole motion data is never loaded into memory
+    dtypes : DtypePolicy | None, optional
+        dtypes of columns of the result, by default DEFAULT_DTYPE_POLICY
+    profiler : StageProfiler | None, optional
+        profiler to record stages to, see `StageProfiler`, by default None
 
     Returns
     -------
     pd.DataFrame
         shared index dataframe with road quality data
     """
-    pd_motion_with_sections = split_imu_on_sections(pd_motion["accel_x"], shared_index)
-    rms = calculate_rms_on_sections(pd_motion_with_sections)
-    road_quality_data = pd_motion_with_sections.merge(
-        rms, left_on="section_number", right_index=True, how="left"
-    )
-    # add iri
-    road_quality_data["iri"] = road_quality_data["rms"].apply(calculate_iri)
-    # add ride quality
-    road_quality_data["ride_quality"] = road_quality_data["iri"].apply(get_ride_quality)
-
-    # add bumps and anomalies
-    bumps_df = find_bumps(pd_motion, height=0.3)
-
-    road_quality_data = road_quality_data.merge(
-        bumps_df, left_on="original_time_imu", right_index=True, how="left"
-    )
+    dtypes = dtypes or DEFAULT_DTYPE_POLICY
+    if not isinstance(pd_motion, pd.DataFrame):
+        with profile_stage(profiler, "calculate_road_quality_on_windows", rows_in=len(shared_index)) as record:
+            road_quality_data = _calculate_road_quality_on_windows(shared_index, pd_motion)
+            record.rows_out = len(road_quality_data)
+    else:
+        # the same as `split_imu_on_sections`, mapping and splitting are profiled separately
+        with profile_stage(profiler, "map_df_to_shared_index", rows_in=len(pd_motion)) as record:
+            pd_motion_with_sections = map_df_to_shared_index(pd_motion["accel_x"], shared_index, column_suffix="imu")
+            record.rows_out = len(pd_motion_with_sections)
+        with profile_stage(profiler, "split_on_sections", rows_in=len(pd_motion_with_sections)) as record:
+            pd_motion_with_sections["section_number"] = _split_path_on_sections(pd_motion_with_sections["path"])
+            record.rows_out = len(pd_motion_with_sections)
+        with profile_stage(profiler, "calculate_rms_on_sections", rows_in=len(pd_motion_with_sections)) as record:
+            rms = calculate_rms_on_sections(pd_motion_with_sections)
+            record.rows_out = len(rms)
+        with profile_stage(profiler, "calculate_iri", rows_in=len(pd_motion_with_sections)) as record:
+            road_quality_data = pd_motion_with_sections.merge(
+                rms, left_on="section_number", right_index=True, how="left"
+            )
+            # add iri
+            road_quality_data["iri"] = calculate_iri(road_quality_data["rms"])
+            # add ride quality
+            road_quality_data["ride_quality"] = classify_ride_quality(road_quality_data["iri"])
+            record.rows_out = len(road_quality_data)
+
+        # add bumps and anomalies
+        with profile_stage(profiler, "find_bumps", rows_in=len(pd_motion)) as record:
+            bumps_df = find_bumps(pd_motion, height=0.3)
+            record.rows_out = len(bumps_df)
+        with profile_stage(profiler, "merge_bumps", rows_in=len(road_quality_data)) as record:
+            road_quality_data = road_quality_data.merge(
+                bumps_df, left_on="original_time_imu", right_index=True, how="left"
+            )
+            record.rows_out = len(road_quality_data)
+    with profile_stage(profiler, "apply_dtypes", rows_in=len(road_quality_data)) as record:
+        road_quality_data = dtypes.apply(road_quality_data)
+        record.rows_out = len(road_quality_data)
     return road_quality_data
 
 
 def road_quality_from_sensor_data(
     sensor_data_df_dict: dict[str, pd.DataFrame],
     shared_index: pd.DataFrame | None = None,
+    compact: bool = False,
+    geometry: bool = True,
+    use_cache: bool = False,
+    dtypes: DtypePolicy | None = None,
+    profiler: StageProfiler | None = None,
+    distance_method: Literal["wgs84", "haversine"] = "wgs84",
 ) -> pd.DataFrame:
     """Calculate road quality from sensor data
 
     Parameters
     ----------
     sensor_data_df_dict : dict
-        dictionary with motion, gps and timestamps dataframes
+        dictionary with motion, gps and timestamps dataframes,
+        motion may be an iterable of motion windows (see `read_recslam_motion_windows`) to bound the memory usage
     shared_index : pd.DataFrame | None, optional
-        shared index dataframe if previously calculated, by default None
+        shared index dataframe if previously calculated, by default None,
+        must be provided if motion is an iterable of windows
+    compact : bool, optional
+        whether to return the compact layout, see `compact_road_quality_df`, implies `COMPACT_DTYPE_POLICY`
+        if `dtypes` is not provided, by default False
+    geometry : bool, optional
+        whether to build a point per row when the shared index is computed here,
+        see `get_shared_index_for_sensor_data`, by default True
+    use_cache : bool, optional
+        whether to read and write the cached shared index, see `get_shared_index_for_sensor_data`, by default False
+    dtypes : DtypePolicy | None, optional
+        dtypes of columns of the shared index and the result, by default DEFAULT_DTYPE_POLICY
+    profiler : StageProfiler | None, optional
+        profiler to record stages of building the shared index and road quality to, see `StageProfiler`, by default None
+    distance_method : Literal["wgs84", "haversine"], optional
+        how to measure distances between GPS points when the shared index is computed here,
+        see `get_path_from_gps`, by default "wgs84"
 
     Returns
     -------
     pd.DataFrame
         shared index dataframe with road quality data
+
+    Raises
+    ------
+    ValueError
+        if motion is an iterable of windows and shared_index is not provided
     """
+    if dtypes is None:
+        dtypes = COMPACT_DTYPE_POLICY if compact else DEFAULT_DTYPE_POLICY
     # get_shared_index
     if shared_index is None:
+        if not isinstance(sensor_data_df_dict["motion"], pd.DataFrame):
+            raise ValueError(
+                "`shared_index` must be provided if motion data is an iterable of windows, "
+                "it may be built using `read_recslam_motion_time_index`"
+            )
         shared_index = get_shared_index_for_sensor_data(
             sensor_data_df_dict["gps"],
             sensor_data_df_dict["timestamps"],
             sensor_data_df_dict["motion"],
+            distance_method=distance_method,
+            geometry=geometry,
+            use_cache=use_cache,
+            dtypes=dtypes,
+            profiler=profiler,
         )
 
     # calculate road_quality
     road_quality_data = calculate_road_quality(
-        shared_index, sensor_data_df_dict["motion"]
+        shared_index, sensor_data_df_dict["motion"], dtypes=dtypes, profiler=profiler
     )
+    if compact:
+        with profile_stage(profiler, "compact_road_quality_df", rows_in=len(road_quality_data)) as record:
+            road_quality_data = compact_road_quality_df(road_quality_data, dtypes=dtypes)
+            record.rows_out = len(road_quality_data)
     return road_quality_data
 
-# %% ../../../nbs/core/05_road_quality.ipynb 39
-def plot_road_quality_stats(road_quality_df: pd.DataFrame):
+# %% ../../../nbs/core/05_road_quality.ipynb 74
+def _rolling_mean_from_prefix_sums(
+    prefix_sums: np.ndarray, prefix_nans: np.ndarray, window_size: int
+) -> np.ndarray:
+    # rolling mean of values with their prefix sums, NaN for incomplete windows or windows with NaN
+    n = len(prefix_sums) - 1
+    rolling = np.full(n, np.nan)
+    if window_size <= n:
+        sums = prefix_sums[window_size:] - prefix_sums[:-window_size]
+        nans = prefix_nans[window_size:] - prefix_nans[:-window_size]
+        rolling[window_size - 1 :] = np.where(nans > 0, np.nan, sums / window_size)
+    return rolling
+
+
+def sweep_find_bumps(
+    pd_motion: pd.DataFrame,
+    window_sizes: Iterable[int],
+    heights: Iterable[float],
+) -> pd.DataFrame:
+    """Run `find_bumps` for a grid of window sizes and heights sharing statistics between parameter pairs
+
+    Parameters
+    ----------
+    pd_motion : pd.DataFrame
+        motion dataframe with `accel_x` column
+    window_sizes : Iterable[int]
+        window sizes of the rolling mean
+    heights : Iterable[float]
+        minimal heights of anomaly peaks
+
+    Returns
+    -------
+    pd.DataFrame
+        a row per `(window_size, height)` pair with `n_bumps` and `bump_positions`,
+        integer positions of bumps in `pd_motion`
+    """
+    accel_x = pd_motion["accel_x"].to_numpy(dtype=np.float64)
+    is_nan = np.isnan(accel_x)
+    # centering keeps prefix sums small and differences of them precise
+    offset = np.nanmean(accel_x) if (~is_nan).any() else 0.0
+    centered = np.where(is_nan, 0, accel_x - offset)
+    prefix_sums = np.r_[0, np.cumsum(centered)]
+    prefix_nans = np.r_[0, np.cumsum(is_nan)]
+    heights = sorted(heights)
+
+    rows = []
+    for window_size in window_sizes:
+        rolling = _rolling_mean_from_prefix_sums(prefix_sums, prefix_nans, window_size)
+        anomalies = (rolling - (accel_x - offset)) ** 2
+        peaks, _ = find_peaks(anomalies)
+        peak_heights = anomalies[peaks]
+        for height in heights:
+            bump_positions = peaks[peak_heights >= height]
+            rows.append((window_size, height, len(bump_positions), bump_positions))
+    return pd.DataFrame(
+        rows, columns=["window_size", "height", "n_bumps", "bump_positions"]
+    )
+
+
+# %% ../../../nbs/core/05_road_quality.ipynb 79
+# measured size of a shapely point without its coordinates, GEOS memory is not visible to pandas
+GEOMETRY_OVERHEAD_BYTES = 192
+
+
+def get_memory_usage(df: pd.DataFrame) -> int:
+    """Memory usage of a dataframe in bytes, including its index and the contents of object columns,
+    memory of geometries is estimated from the number of their coordinates"""
+    memory = int(df.memory_usage(index=True, deep=True).sum())
+    for column in df.columns:
+        if isinstance(df[column].dtype, gpd.array.GeometryDtype):
+            geometries = df[column].to_numpy()
+            n_geometries = int(np.count_nonzero(~shapely.is_missing(geometries)))
+            n_coordinates = int(shapely.get_num_coordinates(geometries).sum())
+            memory += n_geometries * GEOMETRY_OVERHEAD_BYTES + n_coordinates * 3 * 8
+    return memory
+
+
+def _split_gps_geometry(df: pd.DataFrame, geometry_column: str = "gps") -> pd.DataFrame:
+    geometry = gpd.GeoSeries(df[geometry_column])
+    coordinates = {
+        "lon": geometry.x.to_numpy(),
+        "lat": geometry.y.to_numpy(),
+    }
+    if geometry.has_z.any():
+        coordinates["altitude"] = geometry.z.to_numpy()
+    position = df.columns.get_loc(geometry_column)
+    df = pd.DataFrame(df.drop(columns=geometry_column))
+    for offset, (column, values) in enumerate(coordinates.items()):
+        df.insert(position + offset, column, values)
+    return df
+
+
+def compact_road_quality_df(
+    df: pd.DataFrame,
+    float_dtype: np.dtype | str = np.float32,
+    dtypes: DtypePolicy | None = None,
+) -> pd.DataFrame:
+    """Convert a shared index or road quality dataframe to a compact memory layout
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        shared index or road quality dataframe, e.g. from `get_shared_index_for_sensor_data` or `road_quality_from_sensor_data`
+    float_dtype : np.dtype | str, optional
+        dtype of float measurements including `altitude`, `lon` and `lat` are always kept as float64, by default np.float32
+    dtypes : DtypePolicy | None, optional
+        policy to use instead of `COMPACT_DTYPE_POLICY` with `float_dtype`, by default None
+
+    Returns
+    -------
+    pd.DataFrame
+        dataframe without geometry, with categorical `source_*` columns and downcast measurements
+    """
+    memory_before = get_memory_usage(df)
+    if "gps" in df.columns:
+        df = _split_gps_geometry(df, "gps")
+    dtypes = dtypes or replace(COMPACT_DTYPE_POLICY, float_dtype=float_dtype)
+    df = dtypes.apply(pd.DataFrame(df))
+    logger.info(
+        f"Compact layout: {memory_before / 2**20:.1f}MiB -> {get_memory_usage(df) / 2**20:.1f}MiB"
+    )
+    return df
+
+
+# %% ../../../nbs/core/05_road_quality.ipynb 86
+def get_section_lines(road_quality_df: pd.DataFrame) -> gpd.GeoDataFrame:
+    """Build a LineString per road section from the points of a road quality dataframe
+
+    Parameters
+    ----------
+    road_quality_df : pd.DataFrame
+        road quality dataframe with `section_number` and either `gps` geometry or `lon` and `lat` columns
+
+    Returns
+    -------
+    gpd.GeoDataFrame
+        GeoDataFrame indexed by `section_number` with `rms`, `iri`, `ride_quality`, number of `bumps`
+        and a `section` LineString geometry, sections with less than two points have no geometry
+    """
+    if "gps" in road_quality_df.columns:
+        geometry = gpd.GeoSeries(road_quality_df["gps"])
+        x, y = geometry.x.to_numpy(), geometry.y.to_numpy()
+    else:
+        x, y = road_quality_df["lon"].to_numpy(), road_quality_df["lat"].to_numpy()
+    sections = road_quality_df["section_number"].to_numpy(dtype=np.float64)
+    valid = ~np.isnan(sections)
+    order = np.flatnonzero(valid)[np.argsort(sections[valid], kind="stable")]
+    sorted_sections = sections[order]
+    boundaries = np.r_[True, sorted_sections[1:] != sorted_sections[:-1]]
+    starts = np.flatnonzero(boundaries)
+    codes = np.cumsum(boundaries) - 1
+
+    x, y = x[order], y[order]
+    has_point = ~(np.isnan(x) | np.isnan(y))
+    counts = np.bincount(codes[has_point], minlength=len(starts))
+    is_line = counts >= 2
+    in_line = has_point & is_line[codes]
+    lines = np.full(len(starts), None, dtype=object)
+    if in_line.any():
+        lines[is_line] = shapely.linestrings(
+            np.column_stack([x[in_line], y[in_line]]), indices=codes[in_line]
+        )
+
+    sections_df = pd.DataFrame(
+        {
+            column: road_quality_df[column].iloc[order[starts]].to_numpy()
+            for column in ["rms", "iri", "ride_quality"]
+            if column in road_quality_df.columns
+        },
+        index=pd.Index(sorted_sections[starts], name="section_number"),
+    )
+    if "bump" in road_quality_df.columns:
+        bumps = road_quality_df["bump"].fillna(False).to_numpy(dtype=bool)[order]
+        sections_df["bumps"] = np.add.reduceat(bumps.astype(np.int64), starts)
+    # TODO[High](Buggy): check crs
+    return gpd.GeoDataFrame(
+        sections_df, geometry=gpd.GeoSeries(lines, index=sections_df.index, crs="EPSG:4326")
+    ).rename_geometry("section")
+
+
+# %% ../../../nbs/core/05_road_quality.ipynb 90
+def decimate_min_max(x: np.ndarray, y: np.ndarray, n_bins: int) -> tuple[np.ndarray, np.ndarray]:
+    """Keep the minimum and the maximum of every one of `n_bins` consecutive bins of a series
+
+    Parameters
+    ----------
+    x : np.ndarray
+        x values of the series
+    y : np.ndarray
+        y values of the series, bins with missing values only are kept as a single gap
+    n_bins : int
+        number of bins, e.g. the width of a plot in pixels
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        x and y values of at most `2 * n_bins` points in the original order
+    """
+    x, y = np.asarray(x), np.asarray(y, dtype=np.float64)
+    if len(y) <= 2 * n_bins:
+        return x, y
+    bin_size = -(-len(y) // n_bins)
+    n_bins = -(-len(y) // bin_size)
+    padded = np.full(n_bins * bin_size, np.nan)
+    padded[: len(y)] = y
+    bins = padded.reshape(n_bins, bin_size)
+    missing = np.isnan(bins)
+    offsets = np.arange(n_bins) * bin_size
+    argmin = np.where(missing, np.inf, bins).argmin(axis=1) + offsets
+    argmax = np.where(missing, -np.inf, bins).argmax(axis=1) + offsets
+    indices = np.sort(np.column_stack([argmin, argmax]), axis=1).ravel()
+    indices = np.unique(np.minimum(indices, len(y) - 1))
+    return x[indices], y[indices]
+
+
+def _plot_series(ax, x, y: pd.Series, title: str, xlabel: str | None = None, max_points: int | None = None):
+    n_bins = max_points or max(int(ax.bbox.width), 1)
+    x, y = decimate_min_max(np.asarray(x), y.to_numpy(dtype=np.float64, na_value=np.nan), n_bins)
+    ax.plot(x, y)
+    ax.set_title(title)
+    ax.set_xlabel(xlabel)
+
+# %% ../../../nbs/core/05_road_quality.ipynb 92
+def plot_road_quality_stats(road_quality_df: pd.DataFrame, max_points: int | None = None):
     """Plots the road quality overall stats for the whole dataframe
 
     Parameters
     ----------
     road_quality_df : pd.DataFrame
         road quality dataframe, calculated with `road_quality_from_sensor_data` function
+    max_points : int | None, optional
+        number of min-max bins of every series, by default the pixel width of its subplot
     """
     fig, axs = plt.subplots(nrows=3, ncols=2, figsize=(20, 7))
-    road_quality_df["iri"].plot(ax=axs[0, 0], title="iri[time]")
-    change_index(road_quality_df, "path")["iri"].plot(
-        ax=axs[0, 1], title="iri[distance]"
-    )
-    road_quality_by_frame = change_index(road_quality_df, "frame_number")
-
-    road_quality_by_frame["iri"].plot(ax=axs[1, 0], title="iri[frame_number]")
-    road_quality_by_frame["ride_quality"].plot(
-        ax=axs[1, 1], ylim=(0, 5), title="ride_quality"
-    )
-    road_quality_by_frame["anomalies"].plot(ax=axs[2, 0], title="anomalies")
-    (road_quality_by_frame["bump"] * 1).plot(ax=axs[2, 1], title="bumps")
+    # series are plotted against columns, the frame is never re-indexed
+    time = road_quality_df.index.to_numpy()
+    path = road_quality_df["path"].to_numpy()
+    frame_number = road_quality_df["frame_number"].to_numpy(dtype=np.float64, na_value=np.nan)
+    iri = road_quality_df["iri"]
+    _plot_series(axs[0, 0], time, iri, "iri[time]", road_quality_df.index.name, max_points)
+    _plot_series(axs[0, 1], path, iri, "iri[distance]", "path", max_points)
+    _plot_series(axs[1, 0], frame_number, iri, "iri[frame_number]", "frame_number", max_points)
+    _plot_series(axs[1, 1], frame_number, road_quality_df["ride_quality"], "ride_quality", "frame_number", max_points)
+    axs[1, 1].set_ylim(0, 5)
+    _plot_series(axs[2, 0], frame_number, road_quality_df["anomalies"], "anomalies", "frame_number", max_points)
+    _plot_series(axs[2, 1], frame_number, road_quality_df["bump"], "bumps", "frame_number", max_points)
     plt.tight_layout()
     plt.show()
 
 
-def _default_plot_setup(ax, range, current_index):
-    ax.grid(True)
-    ax.set_xlim(range.start, range.stop)
-    ax.axvline(x=current_index, color="r", linestyle="--")
-
-
-def _plot_iri(ax, road_quality, range, current_index, max_val):
-    road_quality["iri"].plot(ax=ax, title="iri")
-    ax.set_ylim(0, max_val)
-    _default_plot_setup(ax, range, current_index)
+class RoadQualityView:
+    """Plots of road quality on a range of frames with a cursor at the current frame, updated in place
 
+    Frame indexed series and their maxima are computed once, `update` only replaces the data of existing artists,
+    so scrubbing through frames with a slider and an interactive matplotlib backend (e.g. `%matplotlib widget`) is fast.
+    `update` itself takes about 0.5 ms, a full redraw of the figure with the Agg backend takes about 165 ms,
+    so steps under 20 ms need an interactive backend where `fig.canvas.draw_idle` redraws only on idle.
 
-def _plot_anomalies(ax, road_quality, range, current_index, max_val=None):
-    max_val = road_quality["anomalies"].max() if max_val is None else max_val
-    road_quality["anomalies"].groupby("frame_number").max().plot(ax=ax)
-    (road_quality["bump"] * max_val).plot(ax=ax, title="anomalies")
-    ax.legend(["anomalies", "bumps"])
-    ax.set_ylim(0, max_val)
-    _default_plot_setup(ax, range, current_index)
+    Parameters
+    ----------
+    road_quality_df : pd.DataFrame
+        road quality dataframe, calculated with `road_quality_from_sensor_data` function
+    figsize : tuple[float, float], optional
+        size of the figure, by default (20, 3)
+    """
 
+    def __init__(self, road_quality_df: pd.DataFrame, figsize: tuple[float, float] = (20, 3)):
+        if road_quality_df.index.name == "frame_number":
+            frame_number = road_quality_df.index.to_numpy(dtype=np.float64, na_value=np.nan)
+        else:
+            frame_number = road_quality_df["frame_number"].to_numpy(dtype=np.float64, na_value=np.nan)
+        order = np.argsort(frame_number, kind="stable")
+        order = order[~np.isnan(frame_number[order])]
+        self.frames = frame_number[order]
+        self.series = {
+            column: road_quality_df[column].to_numpy(dtype=np.float64, na_value=np.nan)[order]
+            for column in ["iri", "anomalies", "bump", "path_progress"]
+        }
+        self.max_iri = np.nanmax(self.series["iri"])
+        self.max_anomaly = np.nanmax(self.series["anomalies"])
+
+        # anomalies and path progress aggregated per frame
+        starts = np.flatnonzero(np.r_[True, self.frames[1:] != self.frames[:-1]])
+        self.frame_values = self.frames[starts]
+        anomalies = np.where(np.isnan(self.series["anomalies"]), -np.inf, self.series["anomalies"])
+        self.frame_anomalies = np.maximum.reduceat(anomalies, starts)
+        self.frame_anomalies[np.isinf(self.frame_anomalies)] = np.nan
+        path_progress = self.series["path_progress"]
+        counts = np.add.reduceat((~np.isnan(path_progress)).astype(np.int64), starts)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            self.frame_path_progress = np.add.reduceat(np.nan_to_num(path_progress), starts) / counts
+
+        self.fig, self.axs = plt.subplots(nrows=1, ncols=3, figsize=figsize)
+        iri_ax, anomalies_ax, path_progress_ax = self.axs
+        (self._iri_line,) = iri_ax.plot([], [])
+        iri_ax.set_title("iri")
+        iri_ax.set_ylim(0, self.max_iri)
+        (self._anomalies_line,) = anomalies_ax.plot([], [])
+        (self._bumps_line,) = anomalies_ax.plot([], [])
+        anomalies_ax.set_title("anomalies")
+        anomalies_ax.legend(["anomalies", "bumps"])
+        anomalies_ax.set_ylim(0, self.max_anomaly)
+        (self._path_progress_line,) = path_progress_ax.plot([], [])
+        path_progress_ax.set_title("path_progress")
+        path_progress_ax.yaxis.set_major_formatter(PercentFormatter(1))
+        self._path_progress_cursor = path_progress_ax.axhline(y=0, color="r", linestyle="--")
+        self._cursors = [ax.axvline(x=0, color="r", linestyle="--") for ax in self.axs]
+        for ax in self.axs:
+            ax.grid(True)
+            ax.set_xlabel("frame_number")
+        self.fig.tight_layout()
+
+    def _set_line(self, line, frames: np.ndarray, values: np.ndarray):
+        n_bins = max(int(line.axes.bbox.width), 1)
+        line.set_data(*decimate_min_max(frames, values, n_bins))
+
+    def update(self, range: slice, current_index=0):
+        """Show a range of frames with a cursor at the current index
+
+        Parameters
+        ----------
+        range : slice
+            range of frames to plot
+        current_index : int, optional
+            current index, by default 0
+        """
+        assert range.start <= current_index and (
+            range.stop is None or current_index < range.stop
+        ), f"Current index {current_index} is not in range {range}"
+        stop = self.frames[-1] + 1 if range.stop is None else range.stop
+        # same rows as `.loc[range.start : stop - 1]` of a frame indexed dataframe
+        low, high = np.searchsorted(self.frames, range.start), np.searchsorted(self.frames, stop - 1, side="right")
+        frames = self.frames[low:high]
+        frame_low, frame_high = (
+            np.searchsorted(self.frame_values, range.start),
+            np.searchsorted(self.frame_values, stop - 1, side="right"),
+        )
 
-def _plot_path_progress(ax, road_quality, range, current_index):
-    road_quality["path_progress"].plot(title="path_progress", ax=ax)
-    _default_plot_setup(ax, range, current_index)
-    ax.yaxis.set_major_formatter(PercentFormatter(1))
-    ax.axhline(
-        y=road_quality.loc[current_index]["path_progress"].mean(),
-        color="r",
-        linestyle="--",
-    )
+        self._set_line(self._iri_line, frames, self.series["iri"][low:high])
+        self._set_line(
+            self._anomalies_line,
+            self.frame_values[frame_low:frame_high],
+            self.frame_anomalies[frame_low:frame_high],
+        )
+        self._set_line(self._bumps_line, frames, self.series["bump"][low:high] * self.max_anomaly)
+        path_progress = self.series["path_progress"][low:high]
+        self._set_line(self._path_progress_line, frames, path_progress)
+        if not np.isnan(path_progress).all():
+            low_value, high_value = np.nanmin(path_progress), np.nanmax(path_progress)
+            margin = max((high_value - low_value) * 0.05, 1e-6)
+            self.axs[2].set_ylim(low_value - margin, high_value + margin)
+
+        for ax, cursor in zip(self.axs, self._cursors):
+            ax.set_xlim(range.start, stop)
+            cursor.set_xdata([current_index, current_index])
+        position = np.searchsorted(self.frame_values, current_index)
+        is_frame = position < len(self.frame_values) and self.frame_values[position] == current_index
+        path_progress_at_index = self.frame_path_progress[position] if is_frame else np.nan
+        self._path_progress_cursor.set_ydata([path_progress_at_index, path_progress_at_index])
+        self.fig.canvas.draw_idle()
 
 
 def plot_road_quality_on_range(
     road_quality_df: pd.DataFrame, range: slice, current_index=0
 ):
-    """Plots the road quality data on a given range with a vertical line at the current index
+    """Plots the road quality data on a given range with a vertical line at the current index,
+    use `RoadQualityView` to plot many ranges of the same dataframe
 
     Parameters
     ----------
@@ -722,19 +2347,5 @@ def plot_road_quality_on_range(
     current_index : int, optional
         current index, by default 0
     """
-    assert range.start <= current_index and (
-        range.stop is None or current_index < range.stop
-    ), f"Current index {current_index} is not in range {range}"
-    if road_quality_df.index.name != "frame_number":
-        road_quality_df = change_index(road_quality_df, "frame_number")
-    max_val_anomaly = road_quality_df["anomalies"].max()
-    max_val_iri = road_quality_df["iri"].max()
-    road_quality_df = road_quality_df.loc[
-        range.start : (None if range.stop is None else range.stop - 1)
-    ]  # -1 because loc operator is inclusive
-    fig, axs = plt.subplots(nrows=1, ncols=3, figsize=(20, 3))
-    _plot_iri(axs[0], road_quality_df, range, current_index, max_val_iri)
-    _plot_anomalies(axs[1], road_quality_df, range, current_index, max_val_anomaly)
-    _plot_path_progress(axs[2], road_quality_df, range, current_index)
-    plt.tight_layout()
+    RoadQualityView(road_quality_df).update(range, current_index)
     plt.show()
@@ -0,0 +1,301 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/core/09_online_road_quality.ipynb.
+
+# %% ../../../nbs/core/09_online_road_quality.ipynb 3
+# basic imports
+from __future__ import annotations
+
+# sys and paths imports
+import logging
+
+# typing imports
+from dataclasses import dataclass
+from typing import Literal
+
+import numpy as np
+import pandas as pd
+
+from .distance import DISTANCE_KERNELS
+from scipy.signal import find_peaks
+
+from ds_contrib.analysis.motion.iri import (
+    RIDE_QUALITY_THRESHOLDS,
+    RideQuality,
+    calculate_iri,
+    g,
+)
+
+# %% auto 0
+__all__ = ['logger', 'SectionQuality', 'OnlineIRICalculator', 'BumpEvent', 'StreamingBumpDetector']
+
+# %% ../../../nbs/core/09_online_road_quality.ipynb 5
+logger = logging.getLogger(__name__)
+
+# %% ../../../nbs/core/09_online_road_quality.ipynb 6
+def _to_ns(time) -> np.ndarray:
+    return np.atleast_1d(np.asarray(time, dtype="datetime64[ns]")).view(np.int64)
+
+# %% ../../../nbs/core/09_online_road_quality.ipynb 8
+@dataclass(frozen=True)
+class SectionQuality:
+    section_number: int
+    rms: float
+    iri: float
+    ride_quality: int
+    n_samples: int
+
+
+class OnlineIRICalculator:
+    def __init__(
+        self,
+        section_len: float = 100,
+        distance_method: Literal["wgs84", "haversine"] = "wgs84",
+        thresholds: tuple[float, ...] = RIDE_QUALITY_THRESHOLDS,
+    ):
+        """Incremental IRI calculator, emits road sections as soon as they are complete
+
+        Parameters
+        ----------
+        section_len : float, optional
+            length of a road section in meters, by default 100
+        distance_method : Literal["wgs84", "haversine"], optional
+            how to compute distances between GPS fixes, see `get_path_distances`, by default "wgs84"
+        thresholds : tuple[float, ...], optional
+            IRI thresholds of ride quality classes, see `classify_ride_quality`, by default RIDE_QUALITY_THRESHOLDS
+        """
+        if distance_method not in DISTANCE_KERNELS:
+            raise ValueError(
+                f"Unknown distance method `{distance_method}`, choose from {list(DISTANCE_KERNELS)}"
+            )
+        self.section_len = section_len
+        self.thresholds = thresholds
+        self._distance = DISTANCE_KERNELS[distance_method]
+        # (time in ns, lon, lat, path) of the last two GPS fixes
+        self._prev_fix: tuple[int, float, float, float] | None = None
+        self._last_fix: tuple[int, float, float, float] | None = None
+        # IMU samples received after the last fix
+        self._pending_time: list[np.ndarray] = []
+        self._pending_accel: list[np.ndarray] = []
+        # path, sum of squares and number of samples at the current end of the path,
+        # they belong to a section only if the path grows further
+        self._held = [0.0, 0.0, 0]
+        # running sum of squared accelerations and number of samples of open sections
+        self._sections: dict[int, list[float | int]] = {}
+
+    @property
+    def path(self) -> float:
+        """Current length of the path in meters"""
+        return 0.0 if self._last_fix is None else self._last_fix[3]
+
+    @property
+    def n_open_sections(self) -> int:
+        return len(self._sections)
+
+    def add_imu(self, time, accel_x) -> list[SectionQuality]:
+        """Add IMU samples, sections are emitted by GPS fixes, so nothing is emitted here
+
+        Parameters
+        ----------
+        time : datetime-like or array of datetime-like
+            timestamps of the samples
+        accel_x : float | np.ndarray
+            acceleration along the x axis in g
+
+        Returns
+        -------
+        list[SectionQuality]
+            always empty, for symmetry with `add_gps`
+        """
+        time = _to_ns(time)
+        accel_x = np.atleast_1d(np.asarray(accel_x, dtype=np.float64))
+        if self._last_fix is not None:
+            # late samples are placed between the last two fixes, a sample at the first fix is at the start of the path
+            late = time <= self._last_fix[0] if self._prev_fix is not None else time < self._last_fix[0]
+            if late.any() and self._prev_fix is not None:
+                self._add_samples(time[late], accel_x[late], self._prev_fix, self._last_fix)
+            time, accel_x = time[~late], accel_x[~late]
+        self._pending_time.append(time)
+        self._pending_accel.append(accel_x)
+        return []
+
+    def add_gps(self, time, lon, lat) -> list[SectionQuality]:
+        """Add GPS fixes in chronological order and emit sections completed by them
+
+        Parameters
+        ----------
+        time : datetime-like or array of datetime-like
+            timestamps of the fixes
+        lon : float | np.ndarray
+            longitudes in degrees
+        lat : float | np.ndarray
+            latitudes in degrees
+
+        Returns
+        -------
+        list[SectionQuality]
+            completed sections in order of their numbers
+        """
+        time = _to_ns(time)
+        lon = np.atleast_1d(np.asarray(lon, dtype=np.float64))
+        lat = np.atleast_1d(np.asarray(lat, dtype=np.float64))
+        pending_time = np.concatenate(self._pending_time) if self._pending_time else np.empty(0, np.int64)
+        pending_accel = np.concatenate(self._pending_accel) if self._pending_accel else np.empty(0)
+        completed = []
+        for fix_time, fix_lon, fix_lat in zip(time, lon, lat):
+            if self._last_fix is None:
+                fix = (fix_time, fix_lon, fix_lat, 0.0)
+                # samples before the first fix have no position
+                keep = pending_time >= fix_time
+            else:
+                step = self._distance(fix_lon, fix_lat, self._last_fix[1], self._last_fix[2])
+                step = np.nan_to_num(np.asarray(step, dtype=np.float64)).item()
+                fix = (fix_time, fix_lon, fix_lat, self._last_fix[3] + step)
+                if fix[3] > self._held[0]:
+                    self._release_held()
+                keep = pending_time > fix_time
+                self._add_samples(pending_time[~keep], pending_accel[~keep], self._last_fix, fix)
+            pending_time, pending_accel = pending_time[keep], pending_accel[keep]
+            self._prev_fix, self._last_fix = self._last_fix, fix
+            completed.extend(self._pop_completed())
+        self._pending_time, self._pending_accel = [pending_time], [pending_accel]
+        return completed
+
+    def close(self) -> list[SectionQuality]:
+        """Emit the last, incomplete section, samples after the last fix or at the end of the path are dropped
+
+        Returns
+        -------
+        list[SectionQuality]
+            remaining sections in order of their numbers
+        """
+        completed = [self._emit(number) for number in sorted(self._sections)]
+        self._pending_time, self._pending_accel = [], []
+        self._held = [self.path, 0.0, 0]
+        return completed
+
+    def _add_samples(self, time, accel_x, start_fix, end_fix):
+        # `end_fix` is always the latest fix, i.e. the current end of the path
+        valid = ~np.isnan(accel_x)
+        time, squares = time[valid], (g * accel_x[valid]) ** 2
+        if not len(time):
+            return
+        start_time, *_, start_path = start_fix
+        end_time, *_, end_path = end_fix
+        paths = np.interp(time, [start_time, end_time], [start_path, end_path])
+        at_end = paths >= end_path
+        self._held = [
+            end_path,
+            self._held[1] + squares[at_end].sum(),
+            self._held[2] + int(at_end.sum()),
+        ]
+        self._accumulate(paths[~at_end], squares[~at_end], np.ones((~at_end).sum()))
+
+    def _release_held(self):
+        path, sum_squares, n_samples = self._held
+        if n_samples:
+            self._accumulate(np.array([path]), np.array([sum_squares]), np.array([n_samples]))
+        self._held = [path, 0.0, 0]
+
+    def _accumulate(self, paths, sums, counts):
+        if not len(paths):
+            return
+        numbers, codes = np.unique((paths // self.section_len).astype(np.int64), return_inverse=True)
+        section_sums = np.bincount(codes, weights=sums)
+        section_counts = np.bincount(codes, weights=counts)
+        for number, section_sum, section_count in zip(numbers, section_sums, section_counts):
+            section = self._sections.setdefault(int(number), [0.0, 0])
+            section[0] += section_sum
+            section[1] += int(section_count)
+
+    def _pop_completed(self) -> list[SectionQuality]:
+        current = int(self.path // self.section_len)
+        return [self._emit(number) for number in sorted(self._sections) if number < current]
+
+    def _emit(self, number: int) -> SectionQuality:
+        sum_squares, n_samples = self._sections.pop(number)
+        rms = float(np.sqrt(sum_squares / n_samples))
+        iri = float(calculate_iri(rms))
+        ride_quality = int(RideQuality.GOOD.value - np.digitize(iri, self.thresholds))
+        return SectionQuality(number, rms, iri, ride_quality, n_samples)
+
+# %% ../../../nbs/core/09_online_road_quality.ipynb 18
+@dataclass(frozen=True)
+class BumpEvent:
+    time: pd.Timestamp
+    accel_x: float
+    rolling_accel_x: float
+    anomaly: float
+
+
+class StreamingBumpDetector:
+    def __init__(self, window_size: int = 45, height: float = 0.8):
+        """Online version of `find_bumps`, emits bumps as soon as they are confirmed
+
+        Parameters
+        ----------
+        window_size : int, optional
+            window of the rolling mean of accelerations, by default 45
+        height : float, optional
+            minimal squared deviation from the rolling mean to consider a peak a bump, by default 0.8
+        """
+        self.window_size = window_size
+        self.height = height
+        # ring buffer of the last `window_size - 1` accelerations
+        self._history = np.empty(0)
+        # samples from the last one which may still become a peak: time, acceleration, rolling mean, anomaly
+        self._tail_time = np.empty(0, dtype=np.int64)
+        self._tail = np.empty((0, 3))
+
+    def update(self, time, accel_x) -> list[BumpEvent]:
+        """Add accelerations and return bumps confirmed by them
+
+        Parameters
+        ----------
+        time : datetime-like or array of datetime-like
+            timestamps of the samples
+        accel_x : float | np.ndarray
+            acceleration along the x axis in g
+
+        Returns
+        -------
+        list[BumpEvent]
+            confirmed bumps in chronological order, they may belong to samples of previous updates
+        """
+        time = _to_ns(time)
+        accel_x = np.atleast_1d(np.asarray(accel_x, dtype=np.float64))
+        rolling_accel_x = self._rolling_mean(accel_x)
+        anomalies = (rolling_accel_x - accel_x) ** 2
+
+        time = np.concatenate([self._tail_time, time])
+        samples = np.concatenate(
+            [self._tail, np.column_stack([accel_x, rolling_accel_x, anomalies])]
+        )
+        if not len(samples):
+            return []
+        anomalies = samples[:, 2]
+        peak_indices, _ = find_peaks(anomalies, height=self.height)
+        # the last run of equal anomalies may still become a peak if a lower anomaly precedes it,
+        # then it is kept together with the preceding sample, otherwise the last sample is enough
+        run_start = len(anomalies) - 1
+        while run_start > 0 and anomalies[run_start - 1] == anomalies[-1]:
+            run_start -= 1
+        rising = run_start > 0 and anomalies[run_start - 1] < anomalies[run_start]
+        tail_start = run_start - 1 if rising else len(anomalies) - 1
+        self._tail_time, self._tail = time[tail_start:], samples[tail_start:]
+        return [BumpEvent(pd.Timestamp(time[i]), *samples[i]) for i in peak_indices]
+
+    def _rolling_mean(self, accel_x: np.ndarray) -> np.ndarray:
+        values = np.concatenate([self._history, accel_x])
+        is_nan = np.isnan(values)
+        sums = np.r_[0, np.cumsum(np.where(is_nan, 0, values))]
+        nans = np.r_[0, np.cumsum(is_nan)]
+        # window ending at every new sample, shorter at the very beginning of the ride
+        ends = np.arange(len(self._history), len(values)) + 1
+        starts = ends - self.window_size
+        full = starts >= 0
+        starts = np.maximum(starts, 0)
+        with np.errstate(invalid="ignore"):
+            rolling = (sums[ends] - sums[starts]) / self.window_size
+        rolling[~full | (nans[ends] - nans[starts] > 0)] = np.nan
+        self._history = values[-(self.window_size - 1) :] if self.window_size > 1 else values[:0]
+        return rolling
+
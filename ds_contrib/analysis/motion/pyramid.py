@@ -0,0 +1,219 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/core/16_section_pyramid.ipynb.
+
+# %% ../../../nbs/core/16_section_pyramid.ipynb 3
+# basic imports
+from __future__ import annotations
+
+# sys and paths imports
+import logging
+
+# typing imports
+from typing import Iterable
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+
+from ds_contrib.analysis.motion.iri import (
+    calculate_iri,
+    calculate_section_sums,
+    classify_ride_quality,
+    g,
+)
+from ...core.paths import PathLike, atomic_path, pathify
+
+# %% auto 0
+__all__ = ['logger', 'PYRAMID_SECTION_LENGTHS', 'build_section_pyramid', 'merge_section_pyramids', 'summarize_section_pyramid',
+           'write_section_pyramid', 'read_section_pyramid']
+
+# %% ../../../nbs/core/16_section_pyramid.ipynb 5
+logger = logging.getLogger(__name__)
+
+# %% ../../../nbs/core/16_section_pyramid.ipynb 7
+PYRAMID_SECTION_LENGTHS = [10, 100, 1000]  # meters
+
+
+def _get_merge_func(column: str) -> str:
+    if column.endswith("_min"):
+        return "min"
+    if column.endswith("_max") or column.endswith("_max_abs"):
+        return "max"
+    return "sum"
+
+
+def _merge_sections(section_sums: pd.DataFrame, groups) -> pd.DataFrame:
+    return section_sums.groupby(groups).agg({c: _get_merge_func(c) for c in section_sums.columns})
+
+
+def _get_coordinates(road_quality_df: pd.DataFrame) -> tuple[np.ndarray, np.ndarray] | None:
+    if "gps" in road_quality_df.columns:
+        geometry = gpd.GeoSeries(road_quality_df["gps"])
+        return geometry.x.to_numpy(), geometry.y.to_numpy()
+    if "lon" in road_quality_df.columns and "lat" in road_quality_df.columns:
+        return (
+            road_quality_df["lon"].to_numpy(dtype=np.float64, na_value=np.nan),
+            road_quality_df["lat"].to_numpy(dtype=np.float64, na_value=np.nan),
+        )
+    return None
+
+
+def build_section_pyramid(
+    road_quality_df: pd.DataFrame,
+    section_lengths: Iterable[float] = PYRAMID_SECTION_LENGTHS,
+    columns: list[str] | None = None,
+    path_end: float | None = None,
+) -> pd.DataFrame:
+    """Sums of channels per section for several section lengths, computed from samples once at the finest length
+
+    Parameters
+    ----------
+    road_quality_df : pd.DataFrame
+        dataframe with DatetimeIndex, `path` and channels, optionally with `gps` points or `lon` and `lat` columns,
+        e.g. from `calculate_road_quality` or `map_df_to_shared_index` of motion data with all IMU axes
+    section_lengths : Iterable[float], optional
+        section lengths in meters, multiples of the smallest one, by default PYRAMID_SECTION_LENGTHS
+    columns : list[str] | None, optional
+        channels to sum, by default ["accel_x"]
+    path_end : float | None, optional
+        length of the whole ride, samples at its end are not in any section as in `calculate_road_quality`,
+        must be provided to build pyramids of parts of a ride, by default the maximum of `path`
+
+    Returns
+    -------
+    pd.DataFrame
+        pyramid indexed by `section_len` and `section_number` with sums of channels (see `calculate_section_sums`),
+        `path_min`, `path_max`, `time_min`, `time_max` and `lon_sum`, `lat_sum` and `coordinate_count` of points
+
+    Raises
+    ------
+    ValueError
+        if section lengths are not multiples of the smallest one
+    """
+    columns = columns or ["accel_x"]
+    section_lengths = sorted(section_lengths)
+    finest = section_lengths[0]
+    factors = np.array(section_lengths) / finest
+    if not np.allclose(factors, np.round(factors)):
+        raise ValueError(f"Section lengths {section_lengths} must be multiples of the smallest one")
+
+    # the same sections as `_split_path_on_sections`, the end of the path does not start a new section
+    path = road_quality_df["path"].to_numpy(dtype=np.float64, na_value=np.nan)
+    if path_end is None:
+        path_end = np.nanmax(path) if len(path) and not np.isnan(path).all() else np.nan
+    in_path = path < path_end
+    section_numbers = pd.Series(np.where(in_path, path // finest, np.nan), index=road_quality_df.index)
+
+    channels = road_quality_df[columns].assign(section_number=section_numbers)
+    finest_sums = calculate_section_sums(channels, columns)
+    extras = pd.DataFrame(
+        {"path": path, "time": road_quality_df.index, "section_number": section_numbers.to_numpy()}
+    )
+    coordinates = _get_coordinates(road_quality_df)
+    if coordinates is not None:
+        lon, lat = coordinates
+        valid = ~(np.isnan(lon) | np.isnan(lat))
+        extras["lon"] = np.where(valid, lon, 0.0)
+        extras["lat"] = np.where(valid, lat, 0.0)
+        extras["coordinate"] = valid.astype(np.int64)
+    aggregations = {
+        "path_min": ("path", "min"),
+        "path_max": ("path", "max"),
+        "time_min": ("time", "min"),
+        "time_max": ("time", "max"),
+    }
+    if coordinates is not None:
+        aggregations.update(
+            lon_sum=("lon", "sum"), lat_sum=("lat", "sum"), coordinate_count=("coordinate", "sum")
+        )
+    finest_sums = finest_sums.join(extras.groupby("section_number").agg(**aggregations))
+    finest_sums.index = finest_sums.index.astype(np.int64)
+
+    levels = {}
+    for section_len, factor in zip(section_lengths, np.round(factors).astype(np.int64)):
+        levels[section_len] = finest_sums if factor == 1 else _merge_sections(finest_sums, finest_sums.index // factor)
+    pyramid = pd.concat(levels, names=["section_len", "section_number"])
+    logger.debug(f"Built a pyramid of {len(pyramid)} sections at {section_lengths}m")
+    return pyramid
+
+
+def merge_section_pyramids(pyramids: Iterable[pd.DataFrame]) -> pd.DataFrame:
+    """Merges pyramids of consecutive parts of the same ride built with the same section lengths
+
+    Parameters
+    ----------
+    pyramids : Iterable[pd.DataFrame]
+        pyramids from `build_section_pyramid`, e.g. of motion windows of a ride mapped to its shared index
+
+    Returns
+    -------
+    pd.DataFrame
+        pyramid of the whole ride
+    """
+    return _merge_sections(pd.concat(pyramids), ["section_len", "section_number"])
+
+# %% ../../../nbs/core/16_section_pyramid.ipynb 13
+def summarize_section_pyramid(pyramid: pd.DataFrame, column: str = "accel_x") -> gpd.GeoDataFrame:
+    """RMS, IRI and ride quality of all sections of a pyramid with their centroids
+
+    Parameters
+    ----------
+    pyramid : pd.DataFrame
+        pyramid from `build_section_pyramid` or `merge_section_pyramids`
+    column : str, optional
+        vertical acceleration channel in g, by default "accel_x"
+
+    Returns
+    -------
+    gpd.GeoDataFrame
+        dataframe with the index of the pyramid, `rms`, `iri`, `ride_quality`, `length` of the covered path,
+        `time_min`, `time_max` and `centroid` point geometry (empty for pyramids without coordinates)
+    """
+    count = pyramid[f"{column}_count"].to_numpy()
+    with np.errstate(invalid="ignore", divide="ignore"):
+        rms = g * np.sqrt(pyramid[f"{column}_sum_sq"].to_numpy() / count)
+    summary = pd.DataFrame({"rms": rms}, index=pyramid.index)
+    summary["iri"] = calculate_iri(summary["rms"])
+    summary["ride_quality"] = classify_ride_quality(summary["iri"])
+    summary["length"] = pyramid["path_max"] - pyramid["path_min"]
+    summary[["time_min", "time_max"]] = pyramid[["time_min", "time_max"]]
+    centroids = None
+    if "coordinate_count" in pyramid.columns:
+        coordinate_count = pyramid["coordinate_count"].to_numpy()
+        with np.errstate(invalid="ignore", divide="ignore"):
+            centroids = gpd.points_from_xy(
+                pyramid["lon_sum"].to_numpy() / coordinate_count,
+                pyramid["lat_sum"].to_numpy() / coordinate_count,
+            )
+        centroids[coordinate_count == 0] = None
+    return gpd.GeoDataFrame(
+        summary, geometry=gpd.GeoSeries(centroids, index=summary.index, crs="EPSG:4326")
+    ).rename_geometry("centroid")
+
+# %% ../../../nbs/core/16_section_pyramid.ipynb 16
+def write_section_pyramid(pyramid: pd.DataFrame, path: PathLike) -> None:
+    """Writes all levels of a pyramid to a single parquet file, row groups never mix levels"""
+    path = pathify(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    levels = pyramid.index.get_level_values("section_len")
+    row_group_size = int(pd.Series(levels).value_counts().max()) if len(pyramid) else None
+    with atomic_path(path) as tmp_path:
+        pyramid.sort_index().to_parquet(tmp_path, row_group_size=row_group_size)
+
+
+def read_section_pyramid(path: PathLike, section_lengths: Iterable[float] | None = None) -> pd.DataFrame:
+    """Reads a pyramid written by `write_section_pyramid`
+
+    Parameters
+    ----------
+    path : PathLike
+        path to the parquet file
+    section_lengths : Iterable[float] | None, optional
+        levels to read, by default all of them
+
+    Returns
+    -------
+    pd.DataFrame
+        pyramid indexed by `section_len` and `section_number`
+    """
+    filters = None if section_lengths is None else [("section_len", "in", list(section_lengths))]
+    return pd.read_parquet(pathify(path), filters=filters)
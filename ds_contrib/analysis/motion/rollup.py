@@ -0,0 +1,212 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/core/13_road_cell_rollup.ipynb.
+
+# %% ../../../nbs/core/13_road_cell_rollup.ipynb 3
+# basic imports
+from __future__ import annotations
+
+# sys and paths imports
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# typing imports
+from typing import Iterable
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import shapely
+from tqdm.auto import tqdm
+
+from .cells import geohash_bounds
+from ds_contrib.analysis.motion.storage import (
+    UNKNOWN_CELL,
+    get_road_quality_cells,
+    read_road_quality_parquet,
+)
+from ...core.paths import PathLike, pathify
+
+# %% auto 0
+__all__ = ['logger', 'ROLLUP_CELL_PRECISION', 'ROLLUP_STATISTICS', 'rollup_road_quality', 'merge_rollups', 'summarize_rollup',
+           'rollup_road_quality_parquet']
+
+# %% ../../../nbs/core/13_road_cell_rollup.ipynb 5
+logger = logging.getLogger(__name__)
+
+# %% ../../../nbs/core/13_road_cell_rollup.ipynb 7
+ROLLUP_CELL_PRECISION = 7
+ROLLUP_STATISTICS = ["count", "sum", "sum_sq", "max"]
+
+
+def _empty_rollup() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "count": pd.Series(dtype=np.int64),
+            "sum": pd.Series(dtype=np.float64),
+            "sum_sq": pd.Series(dtype=np.float64),
+            "max": pd.Series(dtype=np.float64),
+        },
+        index=pd.Index([], dtype=object, name="cell"),
+    )
+
+
+def rollup_road_quality(
+    road_quality_df: pd.DataFrame,
+    cell_precision: int = ROLLUP_CELL_PRECISION,
+    value: str = "iri",
+) -> pd.DataFrame:
+    """Statistics of a value of sections of a ride per spatial cell
+
+    Parameters
+    ----------
+    road_quality_df : pd.DataFrame
+        road quality dataframe with `section_number`, the value column and either `gps` geometry or `lon` and `lat` columns
+    cell_precision : int, optional
+        number of geohash characters of cells, by default ROLLUP_CELL_PRECISION
+    value : str, optional
+        column with a value of sections, by default "iri"
+
+    Returns
+    -------
+    pd.DataFrame
+        rollup indexed by `cell` with `count`, `sum`, `sum_sq` and `max` columns
+    """
+    contributions = pd.DataFrame(
+        {
+            "cell": get_road_quality_cells(road_quality_df, cell_precision),
+            "section_number": road_quality_df["section_number"].to_numpy(dtype=np.float64),
+            "value": road_quality_df[value].to_numpy(dtype=np.float64),
+        }
+    )
+    contributions = contributions[
+        (contributions["cell"] != UNKNOWN_CELL)
+        & contributions["section_number"].notna()
+        & contributions["value"].notna()
+    ].drop_duplicates(["section_number", "cell"])
+    if contributions.empty:
+        return _empty_rollup()
+    values = contributions.groupby("cell", sort=True)["value"]
+    rollup = pd.DataFrame(
+        {
+            "count": values.size().astype(np.int64),
+            "sum": values.sum(),
+            "sum_sq": (contributions["value"] ** 2).groupby(contributions["cell"], sort=True).sum(),
+            "max": values.max(),
+        }
+    )
+    rollup.index.name = "cell"
+    return rollup
+
+
+def merge_rollups(rollups: Iterable[pd.DataFrame]) -> pd.DataFrame:
+    """Merge rollups of rides or groups of rides made with the same cell precision and value
+
+    Parameters
+    ----------
+    rollups : Iterable[pd.DataFrame]
+        rollups from `rollup_road_quality` or `merge_rollups`
+
+    Returns
+    -------
+    pd.DataFrame
+        rollup with statistics over all rides
+    """
+    rollups = [r for r in rollups if not r.empty]
+    if not rollups:
+        return _empty_rollup()
+    return (
+        pd.concat(rollups)
+        .groupby(level="cell", sort=True)
+        .agg({"count": "sum", "sum": "sum", "sum_sq": "sum", "max": "max"})
+    )
+
+
+def summarize_rollup(rollup: pd.DataFrame) -> gpd.GeoDataFrame:
+    """Mean and standard deviation of values per cell with cell polygons, e.g. to plot a fleet map
+
+    Parameters
+    ----------
+    rollup : pd.DataFrame
+        rollup from `rollup_road_quality` or `merge_rollups`
+
+    Returns
+    -------
+    gpd.GeoDataFrame
+        rollup with `mean`, `std` (population standard deviation) and `cell` polygon geometry
+    """
+    summary = pd.DataFrame(rollup[ROLLUP_STATISTICS])
+    summary["mean"] = summary["sum"] / summary["count"]
+    variance = summary["sum_sq"] / summary["count"] - summary["mean"] ** 2
+    # sums of squares lose precision on nearly constant values
+    summary["std"] = np.sqrt(variance.clip(lower=0))
+    bounds = np.array([geohash_bounds(cell) for cell in summary.index]).reshape(-1, 4)
+    polygons = shapely.box(bounds[:, 0], bounds[:, 1], bounds[:, 2], bounds[:, 3])
+    return gpd.GeoDataFrame(
+        summary, geometry=gpd.GeoSeries(polygons, index=summary.index, crs="EPSG:4326")
+    ).rename_geometry("polygon")
+
+# %% ../../../nbs/core/13_road_cell_rollup.ipynb 11
+def _rollup_session(dataset_dir: PathLike, session: str, cell_precision: int, value: str) -> pd.DataFrame:
+    road_quality_df = read_road_quality_parquet(
+        dataset_dir, sessions=[session], columns=["section_number", value]
+    )
+    return rollup_road_quality(road_quality_df, cell_precision, value)
+
+
+def rollup_road_quality_parquet(
+    dataset_dir: PathLike,
+    sessions: Iterable[str] | None = None,
+    rollup: pd.DataFrame | None = None,
+    cell_precision: int = ROLLUP_CELL_PRECISION,
+    value: str = "iri",
+    n_workers: int | None = None,
+    progress: bool = True,
+) -> pd.DataFrame:
+    """Roll up sessions of a road quality dataset in parallel
+
+    Parameters
+    ----------
+    dataset_dir : PathLike
+        root directory of the dataset
+    sessions : Iterable[str] | None, optional
+        sessions to roll up, by default all sessions of the dataset
+    rollup : pd.DataFrame | None, optional
+        rollup of other sessions to merge the new ones into, by default None
+    cell_precision : int, optional
+        number of geohash characters of cells, must match the one of `rollup`, by default ROLLUP_CELL_PRECISION
+    value : str, optional
+        column with a value of sections, by default "iri"
+    n_workers : int | None, optional
+        number of worker processes, by default the number of CPUs
+    progress : bool, optional
+        whether to show a progress bar over sessions, by default True
+
+    Returns
+    -------
+    pd.DataFrame
+        merged rollup
+    """
+    dataset_dir = pathify(dataset_dir)
+    if sessions is None:
+        sessions = [d.name.split("=", 1)[1] for d in sorted(dataset_dir.glob("session=*"))]
+    sessions = list(sessions)
+    rollups = [] if rollup is None else [rollup]
+    n_workers = n_workers or os.cpu_count() or 1
+    progress_bar = tqdm(total=len(sessions), desc="sessions", disable=not progress)
+    if n_workers == 1:
+        for session in sessions:
+            rollups.append(_rollup_session(dataset_dir, session, cell_precision, value))
+            progress_bar.update()
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            futures = [
+                executor.submit(_rollup_session, dataset_dir, session, cell_precision, value)
+                for session in sessions
+            ]
+            for future in as_completed(futures):
+                rollups.append(future.result())
+                progress_bar.update()
+    progress_bar.close()
+    merged = merge_rollups(rollups)
+    logger.info(f"Rolled up {len(sessions)} sessions into {len(merged)} cells")
+    return merged
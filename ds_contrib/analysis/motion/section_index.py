@@ -0,0 +1,226 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/core/12_section_index.ipynb.
+
+# %% ../../../nbs/core/12_section_index.ipynb 3
+# basic imports
+from __future__ import annotations
+
+# sys and paths imports
+import json
+import logging
+
+# typing imports
+from pathlib import Path
+from typing import Iterable, Mapping
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import pyproj
+import shapely
+
+from .cells import encode_geohash
+from .distance import EARTH_RADIUS
+from .iri import get_section_lines
+from .storage import read_road_quality_parquet
+from ...core.paths import PathLike, atomic_path, pathify
+
+# %% auto 0
+__all__ = ['logger', 'SECTION_INDEX_VERSION', 'SECTION_INDEX_CELL_PRECISION', 'SECTION_INDEX_MANIFEST', 'NEAREST_START_RADIUS',
+           'SectionIndex']
+
+# %% ../../../nbs/core/12_section_index.ipynb 5
+logger = logging.getLogger(__name__)
+
+# %% ../../../nbs/core/12_section_index.ipynb 7
+SECTION_INDEX_VERSION = 1
+SECTION_INDEX_CELL_PRECISION = 5
+SECTION_INDEX_MANIFEST = "index.json"
+NEAREST_START_RADIUS = 100.0
+
+
+def _meters_per_degree(lat: float) -> tuple[float, float]:
+    meters_per_degree = np.radians(1) * EARTH_RADIUS
+    return meters_per_degree * np.cos(np.radians(lat)), meters_per_degree
+
+
+def _radius_bbox(lon: float, lat: float, radius: float) -> tuple[float, float, float, float]:
+    lon_scale, lat_scale = _meters_per_degree(lat)
+    return (lon - radius / lon_scale, lat - radius / lat_scale, lon + radius / lon_scale, lat + radius / lat_scale)
+
+
+def _get_distances(geometries: np.ndarray, lon: float, lat: float) -> np.ndarray:
+    scale = np.array(_meters_per_degree(lat))
+    local = shapely.transform(geometries, lambda coords: (coords - [lon, lat]) * scale)
+    return shapely.distance(local, shapely.Point(0, 0))
+
+
+def _get_bounds_frame(sections: gpd.GeoDataFrame, cells: np.ndarray) -> pd.DataFrame:
+    bounds = pd.DataFrame(
+        shapely.bounds(sections.geometry.to_numpy()),
+        columns=["min_lon", "min_lat", "max_lon", "max_lat"],
+    )
+    bounds["cell"] = cells
+    manifest = bounds.groupby("cell").agg(
+        n_sections=("min_lon", "size"),
+        min_lon=("min_lon", "min"),
+        min_lat=("min_lat", "min"),
+        max_lon=("max_lon", "max"),
+        max_lat=("max_lat", "max"),
+    )
+    return manifest
+
+
+class SectionIndex:
+    """Spatial index of road sections of many rides
+
+    Parameters
+    ----------
+    sections : gpd.GeoDataFrame
+        section rows with `session` column and `section` LineString geometry, e.g. from `get_section_lines`,
+        sections without geometry are not indexed
+    cell_precision : int, optional
+        number of geohash characters of index cells, by default SECTION_INDEX_CELL_PRECISION
+    """
+
+    def __init__(
+        self, sections: gpd.GeoDataFrame, cell_precision: int = SECTION_INDEX_CELL_PRECISION
+    ):
+        sections = sections[~sections.geometry.isna()].reset_index(drop=True)
+        centroids = shapely.centroid(sections.geometry.to_numpy())
+        cells = encode_geohash(shapely.get_x(centroids), shapely.get_y(centroids), cell_precision)
+        self.cell_precision = cell_precision
+        self.columns = list(sections.columns)
+        self.crs = sections.crs
+        self.manifest = _get_bounds_frame(sections, cells)
+        self._path = None
+        self._cells = {
+            cell: cell_sections.reset_index(drop=True)
+            for cell, cell_sections in sections.groupby(cells, sort=True)
+        }
+        self._trees = {}
+
+    @classmethod
+    def from_road_quality(
+        cls,
+        road_quality_dfs: Mapping[str, pd.DataFrame],
+        cell_precision: int = SECTION_INDEX_CELL_PRECISION,
+    ) -> SectionIndex:
+        """Build an index from road quality dataframes of rides, keyed by session name"""
+        sections = []
+        for session, road_quality_df in road_quality_dfs.items():
+            session_sections = get_section_lines(road_quality_df).reset_index()
+            session_sections.insert(0, "session", session)
+            sections.append(session_sections)
+        return cls(pd.concat(sections, ignore_index=True), cell_precision)
+
+    @classmethod
+    def from_road_quality_parquet(
+        cls,
+        dataset_dir: PathLike,
+        sessions: Iterable[str] | None = None,
+        cell_precision: int = SECTION_INDEX_CELL_PRECISION,
+    ) -> SectionIndex:
+        """Build an index from a dataset written by `write_road_quality_parquet`, reading one session at a time"""
+        dataset_dir = pathify(dataset_dir)
+        if sessions is None:
+            sessions = [d.name.split("=", 1)[1] for d in sorted(dataset_dir.glob("session=*"))]
+        columns = ["section_number", "rms", "iri", "ride_quality", "bump"]
+        road_quality_dfs = {
+            session: read_road_quality_parquet(dataset_dir, sessions=[session], columns=columns)
+            for session in sessions
+        }
+        return cls.from_road_quality(road_quality_dfs, cell_precision)
+
+    def save(self, path: PathLike) -> Path:
+        """Save the index to a directory, an existing directory is replaced as a whole with `atomic_path`"""
+        path = pathify(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        manifest = {
+            "version": SECTION_INDEX_VERSION,
+            "cell_precision": self.cell_precision,
+            "columns": self.columns,
+            "crs": self.crs.to_json() if self.crs is not None else None,
+            "cells": self.manifest.reset_index().to_dict(orient="records"),
+        }
+        with atomic_path(path) as tmp_path:
+            tmp_path.mkdir()
+            for cell in self.manifest.index:
+                self._get_cell(cell).to_parquet(tmp_path / f"cell={cell}.parquet")
+            (tmp_path / SECTION_INDEX_MANIFEST).write_text(json.dumps(manifest))
+        return path
+
+    @classmethod
+    def load(cls, path: PathLike) -> SectionIndex:
+        """Open a saved index, only the manifest is read"""
+        path = pathify(path)
+        manifest = json.loads((path / SECTION_INDEX_MANIFEST).read_text())
+        if manifest["version"] != SECTION_INDEX_VERSION:
+            raise ValueError(
+                f"Section index `{path}` has version {manifest['version']}, expected {SECTION_INDEX_VERSION}"
+            )
+        index = cls.__new__(cls)
+        index.cell_precision = manifest["cell_precision"]
+        index.columns = manifest["columns"]
+        index.crs = pyproj.CRS.from_json(manifest["crs"]) if manifest["crs"] is not None else None
+        index.manifest = pd.DataFrame.from_records(manifest["cells"], index="cell")
+        index._path = path
+        index._cells = {}
+        index._trees = {}
+        return index
+
+    def __len__(self) -> int:
+        return int(self.manifest["n_sections"].sum())
+
+    def _get_cell(self, cell: str) -> gpd.GeoDataFrame:
+        if cell not in self._cells:
+            self._cells[cell] = gpd.read_parquet(self._path / f"cell={cell}.parquet")
+        return self._cells[cell]
+
+    def _get_tree(self, cell: str) -> shapely.STRtree:
+        if cell not in self._trees:
+            self._trees[cell] = shapely.STRtree(self._get_cell(cell).geometry.to_numpy())
+        return self._trees[cell]
+
+    def _query(self, bbox: tuple[float, float, float, float], predicate: str | None) -> gpd.GeoDataFrame:
+        min_lon, min_lat, max_lon, max_lat = bbox
+        m = self.manifest
+        cells = m.index[
+            (m.min_lon <= max_lon) & (min_lon <= m.max_lon) & (m.min_lat <= max_lat) & (min_lat <= m.max_lat)
+        ]
+        box = shapely.box(*bbox)
+        parts = [
+            self._get_cell(cell).iloc[np.sort(self._get_tree(cell).query(box, predicate=predicate))]
+            for cell in cells
+        ]
+        if not parts:
+            return gpd.GeoDataFrame(
+                {column: [] for column in self.columns if column != "section"},
+                geometry=gpd.GeoSeries([], crs=self.crs),
+            ).rename_geometry("section")
+        return pd.concat(parts, ignore_index=True)
+
+    def query_bbox(self, bbox: tuple[float, float, float, float]) -> gpd.GeoDataFrame:
+        """Sections intersecting `(min_lon, min_lat, max_lon, max_lat)` bbox"""
+        return self._query(bbox, predicate="intersects")
+
+    def query_radius(self, lon: float, lat: float, radius: float) -> gpd.GeoDataFrame:
+        """Sections within `radius` meters of a point, with `distance` in meters, nearest first"""
+        sections = self._query(_radius_bbox(lon, lat, radius), predicate=None)
+        distances = _get_distances(sections.geometry.to_numpy(), lon, lat)
+        sections = sections.assign(distance=distances)[distances <= radius]
+        return sections.sort_values("distance", kind="stable").reset_index(drop=True)
+
+    def query_nearest(self, lon: float, lat: float, k: int = 1) -> gpd.GeoDataFrame:
+        """`k` nearest sections to a point, with `distance` in meters, nearest first"""
+        m = self.manifest
+        # the search radius is doubled until it has k sections or covers the whole index
+        corners = shapely.points(
+            np.array(np.meshgrid([m.min_lon.min(), m.max_lon.max()], [m.min_lat.min(), m.max_lat.max()])).reshape(2, -1).T
+        )
+        max_radius = _get_distances(corners, lon, lat).max() if len(m) else 0.0
+        radius = NEAREST_START_RADIUS
+        while True:
+            sections = self.query_radius(lon, lat, radius)
+            if len(sections) >= k or radius >= max_radius:
+                return sections.head(k)
+            radius *= 2
@@ -0,0 +1,259 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/core/11_road_quality_storage.ipynb.
+
+# %% ../../../nbs/core/11_road_quality_storage.ipynb 3
+# basic imports
+from __future__ import annotations
+
+# sys and paths imports
+import json
+import logging
+
+# typing imports
+from pathlib import Path
+from typing import Iterable
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+import shapely
+
+from .batch import get_session_name
+from .cells import encode_geohash, geohash_bounds
+from .iri import compact_road_quality_df, get_gps_geometry
+from ...core.paths import PathLike, atomic_path, pathify
+
+# %% auto 0
+__all__ = ['logger', 'ROAD_QUALITY_CELL_PRECISION', 'ROAD_QUALITY_ROW_GROUP_SIZE', 'UNKNOWN_CELL', 'get_road_quality_cells',
+           'write_road_quality_parquet', 'read_road_quality_parquet']
+
+# %% ../../../nbs/core/11_road_quality_storage.ipynb 5
+logger = logging.getLogger(__name__)
+
+# %% ../../../nbs/core/11_road_quality_storage.ipynb 7
+ROAD_QUALITY_CELL_PRECISION = 4
+ROAD_QUALITY_ROW_GROUP_SIZE = 65_536
+UNKNOWN_CELL = "unknown"
+
+
+def get_road_quality_cells(
+    road_quality_df: pd.DataFrame, cell_precision: int = ROAD_QUALITY_CELL_PRECISION
+) -> np.ndarray:
+    """Spatial cells of rows of a road quality dataframe, `UNKNOWN_CELL` for rows without position
+
+    Parameters
+    ----------
+    road_quality_df : pd.DataFrame
+        road quality dataframe with either `gps` geometry or `lon` and `lat` columns
+    cell_precision : int, optional
+        number of geohash characters of cells, by default ROAD_QUALITY_CELL_PRECISION
+
+    Returns
+    -------
+    np.ndarray
+        object array of cell names
+    """
+    if "gps" in road_quality_df.columns:
+        geometry = gpd.GeoSeries(road_quality_df["gps"])
+        lon, lat = geometry.x.to_numpy(), geometry.y.to_numpy()
+    else:
+        lon, lat = road_quality_df["lon"].to_numpy(), road_quality_df["lat"].to_numpy()
+    cells = encode_geohash(lon, lat, cell_precision)
+    cells[pd.isna(cells)] = UNKNOWN_CELL
+    return cells
+
+
+def write_road_quality_parquet(
+    road_quality_df: pd.DataFrame,
+    dataset_dir: PathLike,
+    session: PathLike,
+    cell_precision: int = ROAD_QUALITY_CELL_PRECISION,
+    row_group_size: int = ROAD_QUALITY_ROW_GROUP_SIZE,
+) -> list[Path]:
+    """Write road quality of a session to the GeoParquet dataset
+
+    Parameters
+    ----------
+    road_quality_df : pd.DataFrame
+        road quality dataframe of the session, e.g. from `road_quality_from_sensor_data`
+    dataset_dir : PathLike
+        root directory of the dataset
+    session : PathLike
+        session path or name, its partition is named by `get_session_name`
+    cell_precision : int, optional
+        number of geohash characters of spatial partitions, by default ROAD_QUALITY_CELL_PRECISION
+    row_group_size : int, optional
+        maximum number of rows in a row group, by default ROAD_QUALITY_ROW_GROUP_SIZE
+
+    Returns
+    -------
+    list[Path]
+        written files, one per cell
+    """
+    dataset_dir = pathify(dataset_dir)
+    name = get_session_name(session)
+    df = compact_road_quality_df(road_quality_df).sort_index(kind="stable")
+    cells = get_road_quality_cells(df, cell_precision)
+    df = get_gps_geometry(df)
+    df.loc[cells == UNKNOWN_CELL, "gps"] = None
+
+    session_dir = dataset_dir / f"session={name}"
+    paths = []
+    with atomic_path(session_dir) as tmp_dir:
+        for cell, cell_df in df.groupby(cells, sort=True):
+            path = tmp_dir / f"cell={cell}" / "part-0.parquet"
+            path.parent.mkdir(parents=True)
+            cell_df.to_parquet(path, index=True, row_group_size=row_group_size)
+            paths.append(session_dir / path.relative_to(tmp_dir))
+    logger.info(f"Written {len(df)} rows of session `{name}` in {len(paths)} cells")
+    return paths
+
+# %% ../../../nbs/core/11_road_quality_storage.ipynb 9
+def _get_dataset_cells(dataset_dir: Path, sessions: Iterable[str] | None) -> list[Path]:
+    session_dirs = (
+        [dataset_dir / f"session={get_session_name(s)}" for s in sessions]
+        if sessions is not None
+        else sorted(dataset_dir.glob("session=*"))
+    )
+    return [cell_dir for d in session_dirs for cell_dir in sorted(d.glob("cell=*"))]
+
+
+def _cell_intersects(cell: str, bbox: tuple[float, float, float, float]) -> bool:
+    if cell == UNKNOWN_CELL:
+        return False
+    min_lon, min_lat, max_lon, max_lat = geohash_bounds(cell)
+    return min_lon <= bbox[2] and bbox[0] <= max_lon and min_lat <= bbox[3] and bbox[1] <= max_lat
+
+
+def _range_expression(column: str, value_range: tuple | None) -> ds.Expression | None:
+    if value_range is None:
+        return None
+    start, end = value_range
+    if column == "timestamp":
+        start, end = [None if v is None else pa.scalar(pd.Timestamp(v).as_unit("ns")) for v in (start, end)]
+    expressions = []
+    if start is not None:
+        expressions.append(ds.field(column) >= start)
+    if end is not None:
+        expressions.append(ds.field(column) <= end)
+    return _and(expressions)
+
+
+def _and(expressions: list[ds.Expression | None]) -> ds.Expression | None:
+    expressions = [e for e in expressions if e is not None]
+    if not expressions:
+        return None
+    expression = expressions[0]
+    for e in expressions[1:]:
+        expression = expression & e
+    return expression
+
+
+def read_road_quality_parquet(
+    dataset_dir: PathLike,
+    sessions: Iterable[PathLike] | None = None,
+    bbox: tuple[float, float, float, float] | None = None,
+    time_range: tuple | None = None,
+    path_range: tuple[float | None, float | None] | None = None,
+    iri_range: tuple[float | None, float | None] | None = None,
+    columns: list[str] | None = None,
+    row_filter: ds.Expression | None = None,
+) -> gpd.GeoDataFrame:
+    """Read road quality from the GeoParquet dataset
+
+    Parameters
+    ----------
+    dataset_dir : PathLike
+        root directory of the dataset
+    sessions : Iterable[PathLike] | None, optional
+        sessions to read, by default all sessions
+    bbox : tuple[float, float, float, float] | None, optional
+        `(min_lon, min_lat, max_lon, max_lat)` of points to read, by default None
+    time_range : tuple | None, optional
+        range of timestamps, by default None
+    path_range : tuple[float | None, float | None] | None, optional
+        range of path in meters, by default None
+    iri_range : tuple[float | None, float | None] | None, optional
+        range of IRI, by default None
+    columns : list[str] | None, optional
+        columns to read, timestamp index and `gps` geometry are always read, by default all columns
+    row_filter : ds.Expression | None, optional
+        additional pyarrow filter, e.g. `ds.field("bump")`, by default None
+
+    Returns
+    -------
+    gpd.GeoDataFrame
+        road quality of selected rows with `session` and `cell` columns,
+        empty with the schema of the dataset if no partitions match the selection
+
+    Raises
+    ------
+    FileNotFoundError
+        if `dataset_dir` does not exist
+    """
+    dataset_dir = pathify(dataset_dir)
+    if not dataset_dir.is_dir():
+        raise FileNotFoundError(f"Road quality dataset `{dataset_dir}` does not exist")
+    cell_dirs = _get_dataset_cells(dataset_dir, sessions)
+    if bbox is not None:
+        cell_dirs = [d for d in cell_dirs if _cell_intersects(d.name.split("=", 1)[1], bbox)]
+    files = [str(path) for d in cell_dirs for path in sorted(d.glob("*.parquet"))]
+    # an empty selection is an empty frame with the schema of the whole dataset
+    schema_files = files or [
+        str(path) for d in _get_dataset_cells(dataset_dir, None) for path in sorted(d.glob("*.parquet"))
+    ]
+    if not schema_files:
+        logger.warning(f"Road quality dataset `{dataset_dir}` is empty")
+        index = pd.DatetimeIndex([], name="timestamp")
+        return gpd.GeoDataFrame(
+            {
+                "gps": gpd.GeoSeries([], index=index, crs="EPSG:4326"),
+                "session": pd.Categorical([]),
+                "cell": pd.Categorical([]),
+            },
+            geometry="gps",
+            index=index,
+        )
+
+    # geometry of `cell=unknown` partitions is all null, types are promoted to the ones of other files
+    schema = pa.unify_schemas(
+        [pq.read_schema(path) for path in schema_files]
+        + [pa.schema([("session", pa.string()), ("cell", pa.string())])]
+    )
+    if columns is not None:
+        columns = list(dict.fromkeys(["timestamp", *columns, "gps", "session", "cell"]))
+    if files:
+        dataset = ds.dataset(
+            files,
+            schema=schema,
+            format="parquet",
+            partitioning="hive",
+            partition_base_dir=str(dataset_dir),
+        )
+        expression = _and(
+            [
+                _range_expression("timestamp", time_range),
+                _range_expression("path", path_range),
+                _range_expression("iri", iri_range),
+                row_filter,
+            ]
+        )
+        table = dataset.to_table(columns=columns, filter=expression)
+    else:
+        table = schema.empty_table()
+        if columns is not None:
+            table = table.select(columns)
+    df = table.to_pandas()
+
+    geo_metadata = json.loads(schema.metadata[b"geo"])
+    df["gps"] = gpd.GeoSeries.from_wkb(
+        df["gps"], index=df.index, crs=geo_metadata["columns"]["gps"].get("crs")
+    )
+    df = gpd.GeoDataFrame(df, geometry="gps")
+    if bbox is not None:
+        df = df[shapely.intersects_xy(shapely.box(*bbox), df["gps"].x, df["gps"].y)]
+    for column in ["session", "cell"]:
+        df[column] = df[column].astype("category")
+    return df.sort_values(["session", "timestamp"], kind="stable")
@@ -0,0 +1,374 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/core/14_synthetic_recslam.ipynb.
+
+# %% ../../../nbs/core/14_synthetic_recslam.ipynb 3
+# basic imports
+from __future__ import annotations
+
+# sys and paths imports
+import json
+import logging
+from pathlib import Path
+
+# typing imports
+from typing import Iterator
+
+import numpy as np
+import pandas as pd
+
+from ...core.paths import PathLike, pathify
+
+# %% auto 0
+__all__ = ['logger', 'SYNTHETIC_START_TIME', 'SYNTHETIC_ORIGIN', 'MOTION_RATE', 'GPS_RATE', 'FRAME_RATE', 'ROUGHNESS_LEVELS',
+           'SYNTHETIC_MOTION_COLUMNS', 'SYNTHETIC_GPS_COLUMNS', 'simulate_recslam_sensor_data',
+           'write_synthetic_recslam_session']
+
+# %% ../../../nbs/core/14_synthetic_recslam.ipynb 5
+logger = logging.getLogger(__name__)
+
+# %% ../../../nbs/core/14_synthetic_recslam.ipynb 7
+SYNTHETIC_START_TIME = 1645438718.396  # unix time of the first motion sample
+SYNTHETIC_ORIGIN = (48.80356, 55.7517)  # lon, lat of the start of the ride
+MOTION_RATE = 100.0  # Hz
+GPS_RATE = 1.0  # Hz
+FRAME_RATE = 30.0  # fps
+ROUGHNESS_LEVELS = {"smooth": 0.02, "fair": 0.05, "rough": 0.12}  # std of accel_x in g at 10 m/s
+SYNTHETIC_MOTION_COLUMNS = [
+    "time",
+    "yaw",
+    "roll",
+    "pitch",
+    "rrate_x",
+    "rrate_y",
+    "rrate_z",
+    "gravity_x",
+    "gravity_y",
+    "gravity_z",
+    "accel_x",
+    "accel_y",
+    "accel_z",
+    "magnetic_x",
+    "magnetic_y",
+    "magnetic_z",
+    "date",
+]
+SYNTHETIC_GPS_COLUMNS = [
+    "lat",
+    "lon",
+    "accuracy",
+    "altitude",
+    "altitude_accuracy",
+    "course",
+    "speed",
+    "time",
+]
+
+_METERS_PER_DEGREE_LAT = 110_574.0
+_BUMP_WAVEFORM = np.exp(-np.arange(40) / 8) * np.cos(2 * np.pi * 6 * np.arange(40) / MOTION_RATE)
+
+
+def _smooth(values: np.ndarray, window: int) -> np.ndarray:
+    padded = np.pad(values, window // 2, mode="edge")
+    return np.convolve(padded, np.ones(window) / window, mode="valid")
+
+
+def _simulate_trajectory(
+    duration: float,
+    rng: np.random.Generator,
+    bumps_per_km: float,
+    origin: tuple[float, float],
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    t = np.arange(int(np.ceil(duration * GPS_RATE)) + 1) / GPS_RATE
+    # legs with a constant target speed, the car stands still on some of them
+    leg_ends = np.cumsum(rng.uniform(30, 300, int(duration / 30) + 2))
+    leg = np.searchsorted(leg_ends, t, side="right")
+    n_legs = len(leg_ends)
+    target_speed = np.where(rng.random(n_legs) < 0.15, 0.0, rng.uniform(5, 22, n_legs))
+    speed = np.clip(_smooth(target_speed[leg], 15), 0, None)
+    leg_turn = np.cumsum(rng.choice([-90.0, 0.0, 0.0, 90.0], n_legs))
+    wander = np.cumsum(np.where(speed > 0.5, rng.normal(0, 1.5, len(t)), 0.0))
+    heading = _smooth(leg_turn[leg], 11) + wander  # degrees clockwise from north, unwrapped
+
+    step = speed / GPS_RATE
+    path = np.concatenate([[0.0], np.cumsum(step[:-1])])
+    east = np.concatenate([[0.0], np.cumsum((step * np.sin(np.radians(heading)))[:-1])])
+    north = np.concatenate([[0.0], np.cumsum((step * np.cos(np.radians(heading)))[:-1])])
+    lon0, lat0 = origin
+    meters_per_degree_lon = _METERS_PER_DEGREE_LAT * np.cos(np.radians(lat0))
+
+    # stretches of road with the same roughness
+    stretch_ends = np.cumsum(rng.uniform(200, 2000, int(path[-1] / 200) + 2))
+    levels = rng.choice(list(ROUGHNESS_LEVELS.values()), len(stretch_ends), p=[0.5, 0.35, 0.15])
+    roughness = levels[np.searchsorted(stretch_ends, path, side="right")]
+
+    trajectory = pd.DataFrame(
+        {
+            "time": t,
+            "lon": lon0 + east / meters_per_degree_lon,
+            "lat": lat0 + north / _METERS_PER_DEGREE_LAT,
+            "altitude": 150 + np.cumsum(rng.normal(0, 0.05, len(t))),
+            "speed": speed,
+            "heading": heading,
+            "path": path,
+            "roughness": roughness,
+        }
+    )
+    # bumps are placed along the road and passed at the moment the car reaches them
+    bump_positions = np.sort(rng.uniform(0, path[-1], rng.poisson(bumps_per_km * path[-1] / 1000)))
+    bumps = pd.DataFrame(
+        {
+            "time": np.interp(bump_positions, path, t),
+            "path": bump_positions,
+            "amplitude": rng.choice([-1.0, 1.0], len(bump_positions)) * rng.uniform(0.8, 2.5, len(bump_positions)),
+        }
+    )
+    return trajectory, bumps
+
+
+def _simulate_motion(
+    trajectory: pd.DataFrame,
+    bumps: pd.DataFrame,
+    start: int,
+    stop: int,
+    rng: np.random.Generator,
+    start_time: float,
+) -> pd.DataFrame:
+    n = stop - start
+    t = (np.arange(start, stop) + np.clip(rng.normal(0, 0.01, n), -0.4, 0.4)) / MOTION_RATE
+    speed = np.interp(t, trajectory["time"], trajectory["speed"])
+    roughness = np.interp(t, trajectory["time"], trajectory["roughness"])
+    heading = np.radians(np.interp(t, trajectory["time"], trajectory["heading"]))
+    acceleration = np.interp(t, trajectory["time"], np.gradient(trajectory["speed"].to_numpy()) * GPS_RATE)
+    turn_rate = np.interp(t, trajectory["time"], np.gradient(np.radians(trajectory["heading"].to_numpy())) * GPS_RATE)
+
+    # vertical vibrations grow with roughness and speed, the engine vibrates even when standing still
+    vibration = 0.005 + roughness * speed / 10
+    accel_x = rng.normal(0, 1, n) * vibration
+    # bumps which started before the chunk still ring in it
+    bump_times = bumps["time"].to_numpy()
+    in_chunk = (bump_times * MOTION_RATE >= start - len(_BUMP_WAVEFORM)) & (bump_times * MOTION_RATE < stop)
+    bump_starts = np.round(bump_times[in_chunk] * MOTION_RATE).astype(np.int64) - start
+    bump_indices = bump_starts[:, None] + np.arange(len(_BUMP_WAVEFORM))
+    bump_values = bumps["amplitude"].to_numpy()[in_chunk, None] * _BUMP_WAVEFORM
+    valid = (bump_indices >= 0) & (bump_indices < n)
+    np.add.at(accel_x, bump_indices[valid], bump_values[valid])
+
+    roll = 0.02 + rng.normal(0, 0.01, n)
+    pitch = -0.05 + acceleration / 100 + rng.normal(0, 0.01, n)
+    yaw = np.angle(np.exp(-1j * heading))  # counterclockwise, wrapped to [-pi, pi]
+    motion = pd.DataFrame(
+        {
+            "time": start_time + t,
+            "yaw": yaw,
+            "roll": roll,
+            "pitch": pitch,
+            "rrate_x": rng.normal(0, 0.02, n),
+            "rrate_y": rng.normal(0, 0.02, n),
+            "rrate_z": -turn_rate + rng.normal(0, 0.02, n),
+            "gravity_x": -np.sin(pitch),
+            "gravity_y": np.sin(roll),
+            "gravity_z": -np.cos(pitch) * np.cos(roll),
+            "accel_x": accel_x,
+            "accel_y": rng.normal(0, 1, n) * vibration / 2,
+            "accel_z": acceleration / 9.81 + rng.normal(0, 1, n) * vibration / 2,
+            "magnetic_x": 40 * np.cos(yaw) + rng.normal(0, 0.5, n),
+            "magnetic_y": 40 * np.sin(yaw) + rng.normal(0, 0.5, n),
+            "magnetic_z": -30 + rng.normal(0, 0.5, n),
+            "date": start_time + t,
+        }
+    )
+    return motion[SYNTHETIC_MOTION_COLUMNS]
+
+
+def _simulate_gps(
+    trajectory: pd.DataFrame,
+    rng: np.random.Generator,
+    duration: float,
+    dropouts_per_hour: float,
+    start_time: float,
+) -> pd.DataFrame:
+    # the receiver starts a bit later than the motion sensors
+    t = trajectory["time"].to_numpy() + 0.9 + rng.normal(0, 0.01, len(trajectory))
+    keep = t < duration
+    dropout_starts = rng.uniform(0, duration, rng.poisson(dropouts_per_hour * duration / 3600))
+    dropout_ends = dropout_starts + rng.uniform(5, 60, len(dropout_starts))
+    for dropout_start, dropout_end in zip(dropout_starts, dropout_ends):
+        keep &= (t < dropout_start) | (t >= dropout_end)
+
+    n = len(t)
+    accuracy = 3 + rng.exponential(2, n)
+    # the error of a receiver drifts slowly, rather than jumps between fixes
+    noise_east = _smooth(rng.normal(0, 1, n), 5) * accuracy
+    noise_north = _smooth(rng.normal(0, 1, n), 5) * accuracy
+    lat0 = trajectory["lat"].iloc[0]
+    speed = np.clip(trajectory["speed"].to_numpy() + rng.normal(0, 0.2, n), 0, None)
+    gps = pd.DataFrame(
+        {
+            "lat": trajectory["lat"] + noise_north / _METERS_PER_DEGREE_LAT,
+            "lon": trajectory["lon"] + noise_east / (_METERS_PER_DEGREE_LAT * np.cos(np.radians(lat0))),
+            "accuracy": accuracy,
+            "altitude": trajectory["altitude"] + rng.normal(0, 2, n),
+            "altitude_accuracy": rng.uniform(3, 8, n),
+            "course": np.where(speed > 0.5, trajectory["heading"] % 360, -1.0),
+            "speed": speed,
+            "time": start_time + t,
+        }
+    )
+    return gps.loc[keep, SYNTHETIC_GPS_COLUMNS].reset_index(drop=True)
+
+
+def _simulate_timestamps(
+    rng: np.random.Generator,
+    duration: float,
+    start_time: float,
+) -> dict[str, list]:
+    t = 0.12 + np.arange(int((duration - 0.5) * FRAME_RATE)) / FRAME_RATE
+    t = t[rng.random(len(t)) > 0.002]
+    t = t + rng.normal(0, 0.001, len(t))
+    n = len(t)
+    brightness = np.clip(8 + np.cumsum(rng.normal(0, 0.01, n)), 2, 11)
+    return {
+        "time": np.round(start_time + t, 3).tolist(),
+        "exp": np.round(0.0004 * 2 ** (9 - brightness), 6).tolist(),
+        "iso": np.where(brightness < 5, 200, 50).tolist(),
+        "brightness": np.round(brightness, 3).tolist(),
+    }
+
+# %% ../../../nbs/core/14_synthetic_recslam.ipynb 8
+def _iter_motion_chunks(
+    trajectory: pd.DataFrame,
+    bumps: pd.DataFrame,
+    duration: float,
+    seed_sequence: np.random.SeedSequence,
+    chunk_duration: float,
+    start_time: float,
+) -> Iterator[pd.DataFrame]:
+    n_samples = int(duration * MOTION_RATE)
+    chunk_size = int(chunk_duration * MOTION_RATE)
+    starts = range(0, n_samples, chunk_size)
+    for start, chunk_seed in zip(starts, seed_sequence.spawn(len(starts))):
+        stop = min(start + chunk_size, n_samples)
+        yield _simulate_motion(trajectory, bumps, start, stop, np.random.default_rng(chunk_seed), start_time)
+
+
+def _simulate_ride(
+    hours: float,
+    seed: int,
+    dropouts_per_hour: float,
+    bumps_per_km: float,
+    chunk_duration: float,
+    start_time: float,
+    origin: tuple[float, float],
+) -> tuple[pd.DataFrame, dict[str, list], Iterator[pd.DataFrame], pd.DataFrame]:
+    duration = hours * 3600
+    trajectory_seed, gps_seed, frames_seed, motion_seed = np.random.SeedSequence(seed).spawn(4)
+    trajectory, bumps = _simulate_trajectory(duration, np.random.default_rng(trajectory_seed), bumps_per_km, origin)
+    gps_df = _simulate_gps(trajectory, np.random.default_rng(gps_seed), duration, dropouts_per_hour, start_time)
+    timestamps_json = _simulate_timestamps(np.random.default_rng(frames_seed), duration, start_time)
+    motion_chunks = _iter_motion_chunks(trajectory, bumps, duration, motion_seed, chunk_duration, start_time)
+    bumps = bumps.assign(time=start_time + bumps["time"])
+    return gps_df, timestamps_json, motion_chunks, bumps
+
+
+def simulate_recslam_sensor_data(
+    hours: float = 1.0,
+    seed: int = 0,
+    dropouts_per_hour: float = 4.0,
+    bumps_per_km: float = 1.0,
+    chunk_duration: float = 3600.0,
+    start_time: float = SYNTHETIC_START_TIME,
+    origin: tuple[float, float] = SYNTHETIC_ORIGIN,
+) -> dict[str, pd.DataFrame | dict]:
+    """Simulates raw recslam sensor data of a ride in memory, see `write_synthetic_recslam_session` to write it to files
+
+    Parameters
+    ----------
+    hours : float, optional
+        duration of the ride, by default 1.0
+    seed : int, optional
+        seed of all random streams, by default 0
+    dropouts_per_hour : float, optional
+        average number of GPS dropouts of 5 to 60 seconds per hour, by default 4.0
+    bumps_per_km : float, optional
+        average number of bumps per kilometer of the road, by default 1.0
+    chunk_duration : float, optional
+        duration of motion chunks simulated at once in seconds,
+        the same as in `write_synthetic_recslam_session` to get the same motion data, by default 3600.0
+    start_time : float, optional
+        unix time of the first motion sample, by default SYNTHETIC_START_TIME
+    origin : tuple[float, float], optional
+        lon and lat of the start of the ride, by default SYNTHETIC_ORIGIN
+
+    Returns
+    -------
+    dict[str, pd.DataFrame | dict]
+        raw data with the same keys as `read_recslam_sensor_data_raw`: `motion_df`, `gps_df` and `timestamps_json`,
+        and `bumps_df` with unix time, position along the road and amplitude of simulated bumps
+    """
+    gps_df, timestamps_json, motion_chunks, bumps = _simulate_ride(
+        hours, seed, dropouts_per_hour, bumps_per_km, chunk_duration, start_time, origin
+    )
+    return {
+        "motion_df": pd.concat(list(motion_chunks), ignore_index=True),
+        "gps_df": gps_df,
+        "timestamps_json": timestamps_json,
+        "bumps_df": bumps,
+    }
+
+
+def write_synthetic_recslam_session(
+    session_dir: PathLike,
+    hours: float = 1.0,
+    seed: int = 0,
+    dropouts_per_hour: float = 4.0,
+    bumps_per_km: float = 1.0,
+    chunk_duration: float = 3600.0,
+    start_time: float = SYNTHETIC_START_TIME,
+    origin: tuple[float, float] = SYNTHETIC_ORIGIN,
+) -> dict[str, Path]:
+    """Writes `motion.csv`, `gps.csv` and `times_full_2.json` of a simulated ride, see `simulate_recslam_sensor_data`
+
+    Motion data is simulated and appended to the file chunk by chunk,
+    so the memory usage does not depend on the duration of the ride.
+
+    Parameters
+    ----------
+    session_dir : PathLike
+        directory of the session, created if missing
+    hours : float, optional
+        duration of the ride, by default 1.0
+    seed : int, optional
+        seed of all random streams, by default 0
+    dropouts_per_hour : float, optional
+        average number of GPS dropouts of 5 to 60 seconds per hour, by default 4.0
+    bumps_per_km : float, optional
+        average number of bumps per kilometer of the road, by default 1.0
+    chunk_duration : float, optional
+        duration of motion chunks simulated and written at once in seconds, by default 3600.0
+    start_time : float, optional
+        unix time of the first motion sample, by default SYNTHETIC_START_TIME
+    origin : tuple[float, float], optional
+        lon and lat of the start of the ride, by default SYNTHETIC_ORIGIN
+
+    Returns
+    -------
+    dict[str, Path]
+        paths of written files with keys `motion_path`, `gps_path` and `timestamps_path`,
+        as expected by `read_recslam_sensor_data_standard`
+    """
+    session_dir = pathify(session_dir)
+    session_dir.mkdir(parents=True, exist_ok=True)
+    paths = {
+        "motion_path": session_dir / "motion.csv",
+        "gps_path": session_dir / "gps.csv",
+        "timestamps_path": session_dir / "times_full_2.json",
+    }
+    gps_df, timestamps_json, motion_chunks, bumps = _simulate_ride(
+        hours, seed, dropouts_per_hour, bumps_per_km, chunk_duration, start_time, origin
+    )
+    gps_df.to_csv(paths["gps_path"], index=False, float_format="%.6f")
+    with open(paths["timestamps_path"], "w") as f:
+        json.dump(timestamps_json, f)
+    for i, motion_chunk in enumerate(motion_chunks):
+        motion_chunk.to_csv(paths["motion_path"], mode="w" if i == 0 else "a", header=i == 0, index=False, float_format="%.6f")
+    logger.info(f"Written {hours}h synthetic ride with {len(bumps)} bumps to {session_dir}")
+    return paths
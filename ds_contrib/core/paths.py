@@ -8,10 +8,11 @@ import os
 import re
 import shutil
 import weakref as _weakref
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import Iterable, Literal
+from typing import Iterable, Iterator, Literal
 
 from pydantic import PathNotADirectoryError
 
@@ -19,7 +20,7 @@ from .utils import Iterifiable, handle_existing, iterify
 
 # %% auto 0
 __all__ = ['logger', 'PathLike', 'list_paths', 'get_dir', 'shared_root', 'prepare_paths_for_transfer', 'Directory', 'pathify',
-           'handle_existing_path']
+           'handle_existing_path', 'atomic_path']
 
 # %% ../../nbs/core/01_paths.ipynb 4
 logger = logging.getLogger(__name__)
@@ -421,3 +422,42 @@ def handle_existing_path(
         strategy=strategy,
         error_type=FileExistsError,
     )
+
+# %% ../../nbs/core/01_paths.ipynb 27
+def _remove_path(p: Path):
+    if p.is_dir():
+        shutil.rmtree(p, ignore_errors=True)
+    else:
+        p.unlink(missing_ok=True)
+
+
+@contextmanager
+def atomic_path(path: PathLike) -> Iterator[Path]:
+    """Yields a temporary path next to `path` to write a file or a directory to and moves it to `path` on success
+
+    Parameters
+    ----------
+    path : PathLike
+        destination file or directory, an existing one is replaced
+
+    Yields
+    ------
+    Path
+        hidden temporary path on the same file system, removed if writing fails
+    """
+    path = pathify(path, none_handling="raise")
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    _remove_path(tmp_path)
+    try:
+        yield tmp_path
+    except BaseException:
+        _remove_path(tmp_path)
+        raise
+    if tmp_path.is_dir() and path.exists():
+        # a non empty directory can not be replaced, the old one is moved aside first
+        old_path = path.with_name(f".{path.name}.{os.getpid()}.old")
+        os.replace(path, old_path)
+        os.replace(tmp_path, path)
+        _remove_path(old_path)
+    else:
+        os.replace(tmp_path, path)